@@ -1,11 +1,18 @@
 import math
+import random
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional, Tuple
+
+from game.config import GameConfig
 
 if TYPE_CHECKING:
     from game.state import GameState
 
+DEFAULT_FIELD_WIDTH = GameConfig.field_width
+DEFAULT_FIELD_HEIGHT = GameConfig.field_height
+DEFAULT_GOAL_HEIGHT = GameConfig.goal_height
+
 
 @dataclass
 class Action:
@@ -48,6 +55,12 @@ class Action:
 class BaseAgent(ABC):
     """Base class for AI agents."""
 
+    __slots__ = ('team_id', 'player_id', 'noise_row', '_player_index')
+
+    # Trusted agents are called inline by the engine. Untrusted agents run
+    # on a worker thread and fall back to a default action on timeout.
+    trusted: bool = False
+
     def __init__(self, team_id: int, player_id: int):
         """
         Initialize agent.
@@ -58,6 +71,22 @@ class BaseAgent(ABC):
         """
         self.team_id = team_id
         self.player_id = player_id
+        # Two uniform(-1, 1) samples refreshed by the game each tick; None
+        # when the agent runs outside a game (see uniform_noise)
+        self.noise_row: Optional[list] = None
+        # Index of this agent's player in state.players, set by the game
+        self._player_index: Optional[int] = None
+        self.configure(DEFAULT_FIELD_WIDTH, DEFAULT_FIELD_HEIGHT, DEFAULT_GOAL_HEIGHT)
+
+    def configure(self, field_width: float, field_height: float, goal_height: float) -> None:
+        """
+        Called by the game with the field geometry before the first tick.
+
+        Override to precompute per-team constants instead of deriving them
+        from the state on every get_action call. Agents are configured with
+        the default geometry on construction.
+        """
+        pass
 
     @abstractmethod
     def get_action(self, state: 'GameState') -> Action:
@@ -83,9 +112,32 @@ class BaseAgent(ABC):
         """
         pass
 
+    def uniform_noise(self) -> Tuple[float, float]:
+        """Two uniform(-1, 1) samples for this tick."""
+        row = self.noise_row
+        if row is None:
+            return random.uniform(-1.0, 1.0), random.uniform(-1.0, 1.0)
+        return row[0], row[1]
+
     def get_my_player(self, state: 'GameState'):
-        """Helper to get this agent's player state."""
-        return state.get_player(self.team_id, self.player_id)
+        """
+        Helper to get this agent's player state.
+
+        Also leaves ``self._player_index`` pointing at the player in
+        ``state.players``, so per-player state lists such as
+        ``state.ball_dist_sq`` can be indexed with it afterwards.
+        """
+        players = state.players
+        i = self._player_index
+        if i is not None and i < len(players):
+            p = players[i]
+            if p.player_id == self.player_id and p.team_id == self.team_id:
+                return p
+        for i, p in enumerate(players):
+            if p.team_id == self.team_id and p.player_id == self.player_id:
+                self._player_index = i
+                return p
+        raise ValueError(f"Player not found: team={self.team_id}, player={self.player_id}")
 
     def get_teammates(self, state: 'GameState'):
         """Helper to get teammate player states (excluding self)."""
@@ -0,0 +1,584 @@
+"""Vectorized policy kernel for the built-in agents.
+
+Evaluates the policy of every built-in agent in a game in one NumPy pass
+over struct-of-arrays player data, instead of one Python-level
+``get_action`` call per player. The kernel reproduces the per-agent logic
+in ``random_agent.py``; agents of other classes (keyboard, network, user
+subclasses) are not batch-capable and keep going through ``get_action``.
+
+When Numba is installed the kernel is a JIT-compiled per-player loop that
+writes into a caller-provided buffer; otherwise the NumPy version is used.
+"""
+
+import math
+import textwrap
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+from .base import BaseAgent
+from .random_agent import (
+    RandomAgent, ChaserAgent, GoalieAgent,
+    StrikerAgent, DefenderAgent, InterceptorAgent,
+    MidfielderAgent, AggressorAgent, WingerAgent,
+)
+
+# Role ids
+RANDOM = 0
+CHASER = 1
+GOALIE = 2
+STRIKER = 3
+DEFENDER = 4
+INTERCEPTOR = 5
+MIDFIELDER = 6
+AGGRESSOR = 7
+WINGER = 8
+
+# Exact class -> role id (subclasses may override get_action, so no isinstance)
+ROLE_BY_CLASS = {
+    RandomAgent: RANDOM,
+    ChaserAgent: CHASER,
+    GoalieAgent: GOALIE,
+    StrikerAgent: STRIKER,
+    DefenderAgent: DEFENDER,
+    InterceptorAgent: INTERCEPTOR,
+    MidfielderAgent: MIDFIELDER,
+    AggressorAgent: AGGRESSOR,
+    WingerAgent: WINGER,
+}
+
+# Columns of the per-player params matrix
+P_MAX_ACC = 0
+P_KICK_RANGE_SQ = 1
+P_NOISE = 2
+P_PREDICTION_TICKS = 3
+P_FLANK_Y = 4
+NUM_PARAMS = 5
+
+
+def agent_role(agent: BaseAgent) -> Optional[int]:
+    """Return the batch role id for an agent, or None if it is not batch-capable."""
+    return ROLE_BY_CLASS.get(type(agent))
+
+
+def build_policy_arrays(
+    agents: List[Optional[BaseAgent]],
+    field_height: float,
+) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Build (roles, params) arrays for a list of agents ordered by player index.
+
+    Returns None if any slot has no agent or an agent that is not batch-capable.
+    """
+    n = len(agents)
+    roles = np.empty(n, dtype=np.int64)
+    params = np.zeros((n, NUM_PARAMS), dtype=np.float64)
+
+    for i, agent in enumerate(agents):
+        role = agent_role(agent) if agent is not None else None
+        if role is None:
+            return None
+
+        roles[i] = role
+        params[i, P_MAX_ACC] = getattr(agent, 'max_acceleration', 0.5)
+        params[i, P_KICK_RANGE_SQ] = getattr(agent, 'kick_range_sq', 0.0)
+        params[i, P_NOISE] = getattr(agent, 'noise', 0.0)
+        params[i, P_PREDICTION_TICKS] = getattr(agent, 'prediction_ticks', 0)
+
+        if role == WINGER:
+            if agent.preferred_y is not None:
+                params[i, P_FLANK_Y] = agent.preferred_y
+            elif agent.player_id % 2 == 0:
+                params[i, P_FLANK_Y] = field_height * 0.2  # Top
+            else:
+                params[i, P_FLANK_Y] = field_height * 0.8  # Bottom
+
+    return roles, params
+
+
+def _actions_numpy(
+    player_xy: np.ndarray,
+    player_team: np.ndarray,
+    player_cooldown: np.ndarray,
+    ball_xyv: np.ndarray,
+    roles: np.ndarray,
+    params: np.ndarray,
+    noise: np.ndarray,
+    field_width: float,
+    field_height: float,
+    goal_height: float,
+    out: np.ndarray,
+) -> None:
+    """
+    Compute actions for all players in one vectorized pass.
+
+    Args:
+        player_xy: (N, 2) player positions
+        player_team: (N,) team ids
+        player_cooldown: (N,) kick cooldown ticks
+        ball_xyv: ball (x, y, vx, vy, ...)
+        roles: (N,) role ids
+        params: (N, NUM_PARAMS) per-player policy parameters
+        noise: (N, 2) uniform samples in [-1, 1]
+        field_width, field_height, goal_height: field geometry
+        out: (N, 3) buffer receiving (ax, ay, kick) with kick as 0.0/1.0
+    """
+    px = player_xy[:, 0]
+    py = player_xy[:, 1]
+    bx, by, bvx, bvy = ball_xyv[0], ball_xyv[1], ball_xyv[2], ball_xyv[3]
+    left = player_team == 0
+    center_x = field_width / 2
+    center_y = field_height / 2
+
+    ball_dx = bx - px
+    ball_dy = by - py
+    ball_dist_sq = ball_dx * ball_dx + ball_dy * ball_dy
+
+    # Default target is the ball (chaser, aggressor, far striker)
+    tx = np.full(len(px), bx)
+    ty = np.full(len(px), by)
+
+    # Goalie: hold the goal line, track ball y within the goal mouth
+    m = roles == GOALIE
+    if m.any():
+        goal_half_height = goal_height / 2
+        lo = center_y - goal_half_height + 20
+        hi = center_y + goal_half_height - 20
+        tx[m] = np.where(left[m], 50.0, field_width - 50)
+        ty[m] = max(lo, min(hi, by))
+
+    # Striker: get behind the ball relative to the opponent goal when close
+    m = (roles == STRIKER) & (ball_dist_sq < 10000)
+    if m.any():
+        gtb_x = bx - np.where(left[m], field_width, 0.0)
+        gtb_y = by - center_y
+        gtb_dist = np.sqrt(gtb_x * gtb_x + gtb_y * gtb_y)
+        ok = gtb_dist > 0
+        inv = np.divide(30.0, gtb_dist, out=np.zeros_like(gtb_dist), where=ok)
+        tx[m] = bx + gtb_x * inv
+        ty[m] = by + gtb_y * inv
+
+    # Defender: 30% of the way from ball to own goal, within defensive third
+    m = roles == DEFENDER
+    if m.any():
+        btg_x = np.where(left[m], 0.0, field_width) - bx
+        btg_y = center_y - by
+        ok = np.sqrt(btg_x * btg_x + btg_y * btg_y) > 0
+        dtx = np.where(
+            left[m],
+            np.minimum(bx + btg_x * 0.3, field_width * 0.4),
+            np.maximum(bx + btg_x * 0.3, field_width * 0.6),
+        )
+        tx[m] = np.where(ok, dtx, px[m])
+        ty[m] = np.where(ok, by + btg_y * 0.3, py[m])
+
+    # Interceptor: predicted ball position, clamped to the field
+    m = roles == INTERCEPTOR
+    if m.any():
+        ticks = params[m, P_PREDICTION_TICKS]
+        pred_x = bx + bvx * ticks
+        pred_y = by + bvy * ticks
+        np.clip(pred_x, 0.0, field_width, out=pred_x)
+        np.clip(pred_y, 0.0, field_height, out=pred_y)
+        tx[m] = pred_x
+        ty[m] = pred_y
+
+    # Midfielder: join attacks up to a limit, otherwise hold the center
+    m = roles == MIDFIELDER
+    if m.any():
+        lm = left[m]
+        attacking = np.where(lm, bx > center_x, bx < center_x)
+        attack_x = np.where(lm, min(bx, field_width * 0.7), max(bx, field_width * 0.3))
+        hold_x = center_x + np.where(lm, 50.0, -50.0)
+        tx[m] = np.where(attacking, attack_x, hold_x)
+
+    # Winger: stay ahead of the ball on a flank, go for it when near
+    m = roles == WINGER
+    if m.any():
+        near = ball_dist_sq[m] < 22500
+        ahead_x = np.where(left[m], min(bx + 100, field_width * 0.8), max(bx - 100, field_width * 0.2))
+        tx[m] = np.where(near, bx, ahead_x)
+        ty[m] = np.where(near, by, params[m, P_FLANK_Y])
+
+    # Accelerate toward target at max acceleration
+    dx = tx - px
+    dy = ty - py
+    dist = np.sqrt(dx * dx + dy * dy)
+    scale = np.divide(params[:, P_MAX_ACC], dist, out=np.zeros_like(dist), where=dist > 0)
+
+    out[:, 0] = dx * scale + noise[:, 0] * params[:, P_NOISE]
+    out[:, 1] = dy * scale + noise[:, 1] * params[:, P_NOISE]
+    out[:, 2] = (ball_dist_sq <= params[:, P_KICK_RANGE_SQ]) & (player_cooldown == 0)
+
+    # Random: random direction and magnitude, never kicks
+    m = roles == RANDOM
+    if m.any():
+        angle = (noise[m, 0] + 1.0) * np.pi
+        magnitude = (noise[m, 1] + 1.0) * 0.25
+        out[m, 0] = np.cos(angle) * magnitude
+        out[m, 1] = np.sin(angle) * magnitude
+        out[m, 2] = 0.0
+
+    # Same clamp Action applies
+    np.clip(out[:, :2], -1.0, 1.0, out=out[:, :2])
+
+
+def _actions_loop(
+    player_xy, player_team, player_cooldown, ball_xyv, roles, params, noise,
+    field_width, field_height, goal_height, out,
+):
+    """Per-player loop version of _actions_numpy, written for Numba to compile."""
+    bx = ball_xyv[0]
+    by = ball_xyv[1]
+    bvx = ball_xyv[2]
+    bvy = ball_xyv[3]
+    center_x = field_width / 2
+    center_y = field_height / 2
+
+    for i in range(player_xy.shape[0]):
+        px = player_xy[i, 0]
+        py = player_xy[i, 1]
+        left = player_team[i] == 0
+        role = roles[i]
+
+        ball_dist_sq = (bx - px) * (bx - px) + (by - py) * (by - py)
+
+        if role == RANDOM:
+            angle = (noise[i, 0] + 1.0) * math.pi
+            magnitude = (noise[i, 1] + 1.0) * 0.25
+            out[i, 0] = math.cos(angle) * magnitude
+            out[i, 1] = math.sin(angle) * magnitude
+            out[i, 2] = 0.0
+            continue
+
+        tx = bx
+        ty = by
+        if role == GOALIE:
+            goal_half_height = goal_height / 2
+            tx = 50.0 if left else field_width - 50
+            ty = max(center_y - goal_half_height + 20, min(center_y + goal_half_height - 20, by))
+        elif role == STRIKER:
+            if ball_dist_sq < 10000:
+                gtb_x = bx - (field_width if left else 0.0)
+                gtb_y = by - center_y
+                gtb_dist = math.sqrt(gtb_x * gtb_x + gtb_y * gtb_y)
+                if gtb_dist > 0:
+                    inv = 30.0 / gtb_dist
+                    tx = bx + gtb_x * inv
+                    ty = by + gtb_y * inv
+        elif role == DEFENDER:
+            btg_x = (0.0 if left else field_width) - bx
+            btg_y = center_y - by
+            if math.sqrt(btg_x * btg_x + btg_y * btg_y) > 0:
+                tx = bx + btg_x * 0.3
+                ty = by + btg_y * 0.3
+                if left:
+                    tx = min(tx, field_width * 0.4)
+                else:
+                    tx = max(tx, field_width * 0.6)
+            else:
+                tx = px
+                ty = py
+        elif role == INTERCEPTOR:
+            ticks = params[i, P_PREDICTION_TICKS]
+            tx = max(0.0, min(field_width, bx + bvx * ticks))
+            ty = max(0.0, min(field_height, by + bvy * ticks))
+        elif role == MIDFIELDER:
+            attacking = bx > center_x if left else bx < center_x
+            if attacking:
+                tx = min(bx, field_width * 0.7) if left else max(bx, field_width * 0.3)
+            else:
+                tx = center_x + (50.0 if left else -50.0)
+        elif role == WINGER:
+            if ball_dist_sq >= 22500:
+                tx = min(bx + 100, field_width * 0.8) if left else max(bx - 100, field_width * 0.2)
+                ty = params[i, P_FLANK_Y]
+
+        dx = tx - px
+        dy = ty - py
+        dist = math.sqrt(dx * dx + dy * dy)
+        ax = 0.0
+        ay = 0.0
+        if dist > 0:
+            scale = params[i, P_MAX_ACC] / dist
+            ax = dx * scale
+            ay = dy * scale
+
+        ax += noise[i, 0] * params[i, P_NOISE]
+        ay += noise[i, 1] * params[i, P_NOISE]
+
+        out[i, 0] = max(-1.0, min(1.0, ax))
+        out[i, 1] = max(-1.0, min(1.0, ay))
+        out[i, 2] = 1.0 if ball_dist_sq <= params[i, P_KICK_RANGE_SQ] and player_cooldown[i] == 0 else 0.0
+
+
+if NUMBA_AVAILABLE:
+    _kernel = njit(cache=True, boundscheck=False)(_actions_loop)
+else:
+    _kernel = _actions_numpy
+
+
+def compute_actions(
+    player_xy: np.ndarray,
+    player_team: np.ndarray,
+    player_cooldown: np.ndarray,
+    ball_xyv: np.ndarray,
+    roles: np.ndarray,
+    params: np.ndarray,
+    noise: np.ndarray,
+    field_width: float,
+    field_height: float,
+    goal_height: float,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Compute (ax, ay, kick) for all players. See _actions_numpy for arguments.
+
+    Pass a preallocated (N, 3) float64 ``out`` buffer to avoid an allocation
+    per call. Returns the buffer.
+    """
+    if out is None:
+        out = np.empty((len(player_xy), 3), dtype=np.float64)
+    _kernel(
+        player_xy, player_team, player_cooldown, ball_xyv, roles, params, noise,
+        float(field_width), float(field_height), float(goal_height), out,
+    )
+    return out
+
+
+# Policy fragments for specialize_actions(), keyed by role id. Each sets
+# tx/ty (the movement target) from the player (px, py) and ball (bx, by,
+# bvx, bvy) locals; {placeholders} are constant-folded per player.
+_TARGET_CODE = {
+    CHASER: """\
+tx = bx
+ty = by
+""",
+    AGGRESSOR: """\
+tx = bx
+ty = by
+""",
+    GOALIE: """\
+tx = {goal_line_x!r}
+ty = max({lo!r}, min({hi!r}, by))
+""",
+    STRIKER: """\
+tx = bx
+ty = by
+if ball_dist_sq < 10000:
+    gtb_x = bx - {opp_goal_x!r}
+    gtb_y = by - {center_y!r}
+    gtb_dist = math.sqrt(gtb_x * gtb_x + gtb_y * gtb_y)
+    if gtb_dist > 0:
+        inv = 30.0 / gtb_dist
+        tx = bx + gtb_x * inv
+        ty = by + gtb_y * inv
+""",
+    DEFENDER: """\
+btg_x = {own_goal_x!r} - bx
+btg_y = {center_y!r} - by
+if math.sqrt(btg_x * btg_x + btg_y * btg_y) > 0:
+    tx = {clamp}(bx + btg_x * 0.3, {limit_x!r})
+    ty = by + btg_y * 0.3
+else:
+    tx = px
+    ty = py
+""",
+    INTERCEPTOR: """\
+tx = max(0.0, min({field_width!r}, bx + bvx * {ticks!r}))
+ty = max(0.0, min({field_height!r}, by + bvy * {ticks!r}))
+""",
+    MIDFIELDER: """\
+if bx {attack_cmp} {center_x!r}:
+    tx = {clamp}(bx, {limit_x!r})
+else:
+    tx = {hold_x!r}
+ty = by
+""",
+    WINGER: """\
+tx = bx
+ty = by
+if ball_dist_sq >= 22500:
+    tx = {clamp}(bx {ahead_op} 100, {limit_x!r})
+    ty = {flank_y!r}
+""",
+}
+
+_RANDOM_CODE = """\
+angle = (n{i}x + 1.0) * math.pi
+magnitude = (n{i}y + 1.0) * 0.25
+ax{i} = max(-1.0, min(1.0, math.cos(angle) * magnitude))
+ay{i} = max(-1.0, min(1.0, math.sin(angle) * magnitude))
+kick{i} = 0.0
+"""
+
+_STEER_CODE = """\
+dx = tx - px
+dy = ty - py
+dist = math.sqrt(dx * dx + dy * dy)
+ax = 0.0
+ay = 0.0
+if dist > 0:
+    scale = {max_acc!r} / dist
+    ax = dx * scale
+    ay = dy * scale
+ax{i} = max(-1.0, min(1.0, ax + n{i}x * {noise!r}))
+ay{i} = max(-1.0, min(1.0, ay + n{i}y * {noise!r}))
+kick{i} = 1.0 if ball_dist_sq <= {kick_range_sq!r} and cd{i} == 0 else 0.0
+"""
+
+
+def _player_source(i: int, role: int, left: bool, p: np.ndarray,
+                   field_width: float, field_height: float, goal_height: float) -> str:
+    """Generate the unrolled policy code for player slot ``i``."""
+    header = (
+        f"# player {i}: role {role}, team {0 if left else 1}\n"
+        f"px = x{i}\n"
+        f"py = y{i}\n"
+        "ball_dist_sq = (bx - px) * (bx - px) + (by - py) * (by - py)\n"
+    )
+    if role == RANDOM:
+        return header + _RANDOM_CODE.format(i=i)
+
+    center_x = field_width / 2
+    center_y = field_height / 2
+    consts = dict(
+        field_width=field_width,
+        field_height=field_height,
+        center_x=center_x,
+        center_y=center_y,
+        ticks=float(p[P_PREDICTION_TICKS]),
+        flank_y=float(p[P_FLANK_Y]),
+        clamp='min' if left else 'max',
+    )
+    if role == GOALIE:
+        consts.update(
+            goal_line_x=50.0 if left else field_width - 50,
+            lo=center_y - goal_height / 2 + 20,
+            hi=center_y + goal_height / 2 - 20,
+        )
+    elif role == STRIKER:
+        consts['opp_goal_x'] = field_width if left else 0.0
+    elif role == DEFENDER:
+        consts['own_goal_x'] = 0.0 if left else field_width
+        consts['limit_x'] = field_width * 0.4 if left else field_width * 0.6
+    elif role == MIDFIELDER:
+        consts['attack_cmp'] = '>' if left else '<'
+        consts['limit_x'] = field_width * 0.7 if left else field_width * 0.3
+        consts['hold_x'] = center_x + (50.0 if left else -50.0)
+    elif role == WINGER:
+        consts['ahead_op'] = '+' if left else '-'
+        consts['limit_x'] = field_width * 0.8 if left else field_width * 0.2
+
+    steer = _STEER_CODE.format(
+        i=i,
+        max_acc=float(p[P_MAX_ACC]),
+        noise=float(p[P_NOISE]),
+        kick_range_sq=float(p[P_KICK_RANGE_SQ]),
+    )
+    return header + _TARGET_CODE[role].format(**consts) + steer
+
+
+@lru_cache(maxsize=32)
+def _build_specialized(roles: Tuple[int, ...], left: Tuple[bool, ...], params: bytes,
+                       field_width: float, field_height: float, goal_height: float):
+    """Generate and exec the kernel source for one lineup."""
+    n = len(roles)
+    p = np.frombuffer(params, dtype=np.float64).reshape(n, NUM_PARAMS)
+    idx = range(n)
+
+    # Convert the inputs to Python floats once, write back in one assignment
+    body = ("xy = player_xy.tolist()\ncd = player_cooldown.tolist()\nnz = noise.tolist()\n"
+            "bx, by, bvx, bvy = ball_xyv.tolist()[:4]\n")
+    body += "".join(f"x{i}, y{i} = xy[{i}]\ncd{i} = cd[{i}]\nn{i}x, n{i}y = nz[{i}]\n"
+                    for i in idx)
+    body += "".join(_player_source(i, roles[i], left[i], p[i],
+                                   field_width, field_height, goal_height) for i in idx)
+    rows = ", ".join(f"(ax{i}, ay{i}, kick{i})" for i in idx)
+    body += f"out[:] = ({rows},)\n"
+    source = ("def _generated_actions(player_xy, player_cooldown, ball_xyv, noise, out):\n"
+              + textwrap.indent(body, "    "))
+
+    namespace = {'math': math}
+    exec(compile(source, f"<specialized policy {roles}>", "exec"), namespace)
+    return namespace['_generated_actions']
+
+
+def specialize_actions(
+    roles: np.ndarray,
+    player_team: np.ndarray,
+    params: np.ndarray,
+    field_width: float,
+    field_height: float,
+    goal_height: float,
+):
+    """
+    Build a kernel with the policy of one fixed lineup inlined.
+
+    The returned ``kernel(player_xy, player_cooldown, ball_xyv, noise, out)``
+    computes the same (N, 3) actions as compute_actions, but with each
+    player's role, team side, parameters and the field geometry folded into
+    generated straight-line code, so there is no per-player role dispatch.
+    Kernels are cached per lineup, so repeated games reuse the generated code.
+
+    This is the fast path without Numba. The compiled compute_actions loop
+    already dispatches roles at machine speed, and JIT-compiling a whole
+    unrolled lineup takes seconds, so games use it instead when Numba is
+    installed.
+    """
+    return _build_specialized(
+        tuple(int(r) for r in roles),
+        tuple(bool(t == 0) for t in player_team),
+        np.ascontiguousarray(params, dtype=np.float64).tobytes(),
+        float(field_width), float(field_height), float(goal_height),
+    )
+
+
+def lineup_kernel(
+    roles: np.ndarray,
+    player_team: np.ndarray,
+    params: np.ndarray,
+    field_width: float,
+    field_height: float,
+    goal_height: float,
+):
+    """
+    Return the fastest ``kernel(player_xy, player_cooldown, ball_xyv, noise, out)``
+    for a fixed lineup: the JIT-compiled compute_actions with the lineup
+    arguments bound when Numba is installed, else specialize_actions().
+    """
+    if not NUMBA_AVAILABLE:
+        return specialize_actions(roles, player_team, params,
+                                  field_width, field_height, goal_height)
+
+    warmup()
+    field_width, field_height, goal_height = float(field_width), float(field_height), float(goal_height)
+
+    def kernel(player_xy, player_cooldown, ball_xyv, noise, out):
+        _kernel(player_xy, player_team, player_cooldown, ball_xyv, roles, params, noise,
+                field_width, field_height, goal_height, out)
+
+    return kernel
+
+
+_warmed_up = False
+
+
+def warmup() -> None:
+    """Compile the JIT kernel ahead of the first game tick (no-op without Numba)."""
+    global _warmed_up
+    if _warmed_up or not NUMBA_AVAILABLE:
+        return
+    compute_actions(
+        np.zeros((1, 2)), np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.int64),
+        np.zeros(4), np.zeros(1, dtype=np.int64), np.zeros((1, NUM_PARAMS)),
+        np.zeros((1, 2)), 1.0, 1.0, 1.0,
+    )
+    _warmed_up = True
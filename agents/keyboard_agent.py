@@ -1,6 +1,6 @@
 """Keyboard-controlled agent for human players."""
 
-from typing import TYPE_CHECKING, Optional, Set
+from typing import TYPE_CHECKING, Optional
 
 try:
     import pygame
@@ -13,59 +13,73 @@ from agents.base import BaseAgent, Action
 if TYPE_CHECKING:
     from game.state import GameState
 
+# Bits of KeyboardController._key_mask
+KEY_UP = 1      # W
+KEY_DOWN = 2    # S
+KEY_LEFT = 4    # A
+KEY_RIGHT = 8   # D
+KEY_KICK = 16   # Space
+
+KEY_BITS = {
+    pygame.K_w: KEY_UP,
+    pygame.K_s: KEY_DOWN,
+    pygame.K_a: KEY_LEFT,
+    pygame.K_d: KEY_RIGHT,
+    pygame.K_SPACE: KEY_KICK,
+} if PYGAME_AVAILABLE else {}
+
 
 class KeyboardAgent(BaseAgent):
     """Agent controlled by keyboard input, with AI fallback when not active."""
 
+    __slots__ = ('controller', 'is_active', 'fallback_agent')
+
     def __init__(self, team_id: int, player_id: int, fallback_agent: Optional[BaseAgent] = None):
         super().__init__(team_id, player_id)
-        self.pressed_keys: Optional[Set[int]] = None
+        self.controller: Optional['KeyboardController'] = None  # Set by KeyboardController
         self.is_active = False
         self.fallback_agent = fallback_agent
 
-    def set_key_state(self, pressed_keys: Set[int]):
-        """Link to renderer's key state set."""
-        self.pressed_keys = pressed_keys
-
     def set_active(self, active: bool):
         """Set whether this agent responds to keyboard input."""
         self.is_active = active
 
     def get_action(self, state: 'GameState') -> Action:
         # When not active, delegate to fallback AI agent
-        if not self.is_active or self.pressed_keys is None:
+        if not self.is_active or self.controller is None:
             if self.fallback_agent:
                 return self.fallback_agent.get_action(state)
             return Action(0, 0, False)
 
-        if not PYGAME_AVAILABLE:
-            return Action(0, 0, False)
-
-        ax, ay = 0.0, 0.0
-        accel = 0.5  # Max acceleration from config
-
-        if pygame.K_w in self.pressed_keys:
-            ay -= accel
-        if pygame.K_s in self.pressed_keys:
-            ay += accel
-        if pygame.K_a in self.pressed_keys:
-            ax -= accel
-        if pygame.K_d in self.pressed_keys:
-            ax += accel
-
-        kick = pygame.K_SPACE in self.pressed_keys
-        return Action(ax, ay, kick)
+        # 0.5 = max acceleration from config; opposite keys cancel out
+        m = self.controller._key_mask
+        ay = ((m >> 1) & 1) * 0.5 - (m & 1) * 0.5
+        ax = ((m >> 3) & 1) * 0.5 - ((m >> 2) & 1) * 0.5
+        return Action(ax, ay, bool(m & KEY_KICK))
 
 
 class KeyboardController:
     """Manages switching between keyboard-controlled players."""
 
+    __slots__ = ('agents', 'active_index', '_key_mask')
+
     def __init__(self, agents: list[KeyboardAgent]):
         self.agents = agents
         self.active_index = 0
+        self._key_mask = 0  # KEY_* bits of the movement/kick keys held down
+        for agent in agents:
+            agent.controller = self
         if agents:
             agents[0].set_active(True)
 
+    def on_key(self, key: int, pressed: bool) -> None:
+        """Update the key mask from a renderer KEYDOWN/KEYUP event."""
+        bit = KEY_BITS.get(key, 0)
+        if pressed:
+            self._key_mask |= bit
+        else:
+            self._key_mask &= ~bit
+
     def switch_next(self):
         """Switch control to the next player on the team."""
         if not self.agents:
@@ -1,4 +1,3 @@
-import random
 import math
 from typing import TYPE_CHECKING
 
@@ -11,10 +10,15 @@ if TYPE_CHECKING:
 class RandomAgent(BaseAgent):
     """Agent that takes random actions."""
 
+    __slots__ = ()
+
+    trusted = True
+
     def get_action(self, state: 'GameState') -> Action:
         """Return random acceleration."""
-        angle = random.uniform(0, 2 * math.pi)
-        magnitude = random.uniform(0, 0.5)
+        u, v = self.uniform_noise()
+        angle = (u + 1.0) * math.pi
+        magnitude = (v + 1.0) * 0.25
         return Action(
             ax=math.cos(angle) * magnitude,
             ay=math.sin(angle) * magnitude,
@@ -24,11 +28,16 @@ class RandomAgent(BaseAgent):
 class ChaserAgent(BaseAgent):
     """Simple agent that chases the ball and kicks when close."""
 
+    __slots__ = ('max_acceleration', 'noise', 'kick_range', 'kick_range_sq')
+
+    trusted = True
+
     def __init__(self, team_id: int, player_id: int, max_acceleration: float = 0.5, noise: float = 0.15, kick_range: float = 40.0):
         super().__init__(team_id, player_id)
         self.max_acceleration = max_acceleration
         self.noise = noise
         self.kick_range = kick_range
+        self.kick_range_sq = kick_range * kick_range
 
     def get_action(self, state: 'GameState') -> Action:
         """Move toward the ball with some noise, kick when close."""
@@ -40,19 +49,21 @@ class ChaserAgent(BaseAgent):
         dy = ball.y - me.y
 
         # Normalize and scale
-        dist = math.sqrt(dx ** 2 + dy ** 2)
-        if dist > 0:
+        dist_sq = state.ball_dist_sq[self._player_index]
+        if dist_sq > 0:
+            dist = math.sqrt(dist_sq)
             ax = (dx / dist) * self.max_acceleration
             ay = (dy / dist) * self.max_acceleration
         else:
             ax, ay = 0.0, 0.0
 
         # Add noise
-        ax += random.uniform(-self.noise, self.noise)
-        ay += random.uniform(-self.noise, self.noise)
+        nx, ny = self.uniform_noise()
+        ax += nx * self.noise
+        ay += ny * self.noise
 
         # Kick if close enough and cooldown is ready
-        kick = dist <= self.kick_range and me.can_kick()
+        kick = dist_sq <= self.kick_range_sq and me.can_kick()
 
         return Action(ax=ax, ay=ay, kick=kick)
 
@@ -60,33 +71,38 @@ class ChaserAgent(BaseAgent):
 class GoalieAgent(BaseAgent):
     """Simple goalie agent that stays near its goal and kicks away threats."""
 
+    __slots__ = (
+        'max_acceleration', 'noise', 'kick_range', 'kick_range_sq', '_goal_x',
+        '_target_y_lo', '_target_y_hi',
+    )
+
+    trusted = True
+
     def __init__(self, team_id: int, player_id: int, max_acceleration: float = 0.5, noise: float = 0.1, kick_range: float = 40.0):
         super().__init__(team_id, player_id)
         self.max_acceleration = max_acceleration
         self.noise = noise
         self.kick_range = kick_range
+        self.kick_range_sq = kick_range * kick_range
+
+    def configure(self, field_width: float, field_height: float, goal_height: float) -> None:
+        # Goal position: just in front of the left or right goal
+        self._goal_x = 50.0 if self.team_id == 0 else field_width - 50
+        # Target y range: the goal mouth, inset by 20
+        center_y = field_height / 2
+        self._target_y_lo = center_y - goal_height / 2 + 20
+        self._target_y_hi = center_y + goal_height / 2 - 20
 
     def get_action(self, state: 'GameState') -> Action:
         """Stay between ball and goal, kick when ball is close."""
         me = self.get_my_player(state)
         ball = state.ball
 
-        # Goal position
-        if self.team_id == 0:
-            goal_x = 50  # Left goal area
-        else:
-            goal_x = state.field_width - 50  # Right goal area
-
         # Target y is ball's y, clamped to goal area
-        goal_half_height = state.goal_height / 2
-        center_y = state.field_height / 2
-        target_y = max(
-            center_y - goal_half_height + 20,
-            min(center_y + goal_half_height - 20, ball.y)
-        )
+        target_y = max(self._target_y_lo, min(self._target_y_hi, ball.y))
 
         # Move toward target position
-        dx = goal_x - me.x
+        dx = self._goal_x - me.x
         dy = target_y - me.y
 
         dist = math.sqrt(dx ** 2 + dy ** 2)
@@ -97,14 +113,13 @@ class GoalieAgent(BaseAgent):
             ax, ay = 0.0, 0.0
 
         # Add noise
-        ax += random.uniform(-self.noise, self.noise)
-        ay += random.uniform(-self.noise, self.noise)
+        nx, ny = self.uniform_noise()
+        ax += nx * self.noise
+        ay += ny * self.noise
 
         # Kick if ball is close enough
-        ball_dx = ball.x - me.x
-        ball_dy = ball.y - me.y
-        ball_dist = math.sqrt(ball_dx ** 2 + ball_dy ** 2)
-        kick = ball_dist <= self.kick_range and me.can_kick()
+        ball_dist_sq = state.ball_dist_sq[self._player_index]
+        kick = ball_dist_sq <= self.kick_range_sq and me.can_kick()
 
         return Action(ax=ax, ay=ay, kick=kick)
 
@@ -112,34 +127,34 @@ class GoalieAgent(BaseAgent):
 class StrikerAgent(BaseAgent):
     """Aggressive forward that pushes toward opponent's goal."""
 
+    __slots__ = ('max_acceleration', 'kick_range', 'kick_range_sq', '_opp_goal_x', '_goal_y')
+
+    trusted = True
+
     def __init__(self, team_id: int, player_id: int, max_acceleration: float = 0.5, kick_range: float = 40.0):
         super().__init__(team_id, player_id)
         self.max_acceleration = max_acceleration
         self.kick_range = kick_range
+        self.kick_range_sq = kick_range * kick_range
+
+    def configure(self, field_width: float, field_height: float, goal_height: float) -> None:
+        # Opponent goal position
+        self._opp_goal_x = field_width if self.team_id == 0 else 0.0
+        self._goal_y = field_height / 2
 
     def get_action(self, state: 'GameState') -> Action:
         """Chase ball aggressively, kick toward opponent goal."""
         me = self.get_my_player(state)
         ball = state.ball
 
-        # Opponent goal position
-        if self.team_id == 0:
-            goal_x = state.field_width  # Right goal
-        else:
-            goal_x = 0  # Left goal
-
-        goal_y = state.field_height / 2
-
         # Distance to ball
-        ball_dx = ball.x - me.x
-        ball_dy = ball.y - me.y
-        ball_dist = math.sqrt(ball_dx ** 2 + ball_dy ** 2)
+        ball_dist_sq = state.ball_dist_sq[self._player_index]
 
-        # If close to ball, position behind it relative to goal
-        if ball_dist < 100:
+        # If close to ball (within 100), position behind it relative to goal
+        if ball_dist_sq < 10000:
             # Get behind the ball (opposite side from goal)
-            goal_to_ball_x = ball.x - goal_x
-            goal_to_ball_y = ball.y - goal_y
+            goal_to_ball_x = ball.x - self._opp_goal_x
+            goal_to_ball_y = ball.y - self._goal_y
             gtb_dist = math.sqrt(goal_to_ball_x ** 2 + goal_to_ball_y ** 2)
 
             if gtb_dist > 0:
@@ -163,7 +178,7 @@ class StrikerAgent(BaseAgent):
             ax, ay = 0.0, 0.0
 
         # Kick when close
-        kick = ball_dist <= self.kick_range and me.can_kick()
+        kick = ball_dist_sq <= self.kick_range_sq and me.can_kick()
 
         return Action(ax=ax, ay=ay, kick=kick)
 
@@ -171,27 +186,37 @@ class StrikerAgent(BaseAgent):
 class DefenderAgent(BaseAgent):
     """Defensive player that stays between ball and own goal."""
 
+    __slots__ = (
+        'max_acceleration', 'kick_range', 'kick_range_sq', '_own_goal_x', '_goal_y',
+        '_clamp_lo_x', '_clamp_hi_x',
+    )
+
+    trusted = True
+
     def __init__(self, team_id: int, player_id: int, max_acceleration: float = 0.5, kick_range: float = 40.0):
         super().__init__(team_id, player_id)
         self.max_acceleration = max_acceleration
         self.kick_range = kick_range
+        self.kick_range_sq = kick_range * kick_range
 
-    def get_action(self, state: 'GameState') -> Action:
-        """Position between ball and own goal, clear when close."""
-        me = self.get_my_player(state)
-        ball = state.ball
-
+    def configure(self, field_width: float, field_height: float, goal_height: float) -> None:
         # Own goal position
+        self._own_goal_x = 0.0 if self.team_id == 0 else field_width
+        self._goal_y = field_height / 2
+        # Defensive third
         if self.team_id == 0:
-            goal_x = 0
+            self._clamp_lo_x, self._clamp_hi_x = -math.inf, field_width * 0.4
         else:
-            goal_x = state.field_width
+            self._clamp_lo_x, self._clamp_hi_x = field_width * 0.6, math.inf
 
-        goal_y = state.field_height / 2
+    def get_action(self, state: 'GameState') -> Action:
+        """Position between ball and own goal, clear when close."""
+        me = self.get_my_player(state)
+        ball = state.ball
 
         # Position on line between ball and goal, closer to goal
-        ball_to_goal_x = goal_x - ball.x
-        ball_to_goal_y = goal_y - ball.y
+        ball_to_goal_x = self._own_goal_x - ball.x
+        ball_to_goal_y = self._goal_y - ball.y
         btg_dist = math.sqrt(ball_to_goal_x ** 2 + ball_to_goal_y ** 2)
 
         if btg_dist > 0:
@@ -200,10 +225,7 @@ class DefenderAgent(BaseAgent):
             target_y = ball.y + ball_to_goal_y * 0.3
 
             # Clamp to defensive third
-            if self.team_id == 0:
-                target_x = min(target_x, state.field_width * 0.4)
-            else:
-                target_x = max(target_x, state.field_width * 0.6)
+            target_x = min(max(target_x, self._clamp_lo_x), self._clamp_hi_x)
         else:
             target_x = me.x
             target_y = me.y
@@ -219,10 +241,8 @@ class DefenderAgent(BaseAgent):
             ax, ay = 0.0, 0.0
 
         # Kick if ball is close
-        ball_dx = ball.x - me.x
-        ball_dy = ball.y - me.y
-        ball_dist = math.sqrt(ball_dx ** 2 + ball_dy ** 2)
-        kick = ball_dist <= self.kick_range and me.can_kick()
+        ball_dist_sq = state.ball_dist_sq[self._player_index]
+        kick = ball_dist_sq <= self.kick_range_sq and me.can_kick()
 
         return Action(ax=ax, ay=ay, kick=kick)
 
@@ -230,10 +250,15 @@ class DefenderAgent(BaseAgent):
 class InterceptorAgent(BaseAgent):
     """Agent that predicts ball movement and intercepts."""
 
+    __slots__ = ('max_acceleration', 'kick_range', 'kick_range_sq', 'prediction_ticks')
+
+    trusted = True
+
     def __init__(self, team_id: int, player_id: int, max_acceleration: float = 0.5, kick_range: float = 40.0, prediction_ticks: int = 20):
         super().__init__(team_id, player_id)
         self.max_acceleration = max_acceleration
         self.kick_range = kick_range
+        self.kick_range_sq = kick_range * kick_range
         self.prediction_ticks = prediction_ticks
 
     def get_action(self, state: 'GameState') -> Action:
@@ -261,10 +286,8 @@ class InterceptorAgent(BaseAgent):
             ax, ay = 0.0, 0.0
 
         # Kick if ball is close
-        ball_dx = ball.x - me.x
-        ball_dy = ball.y - me.y
-        ball_dist = math.sqrt(ball_dx ** 2 + ball_dy ** 2)
-        kick = ball_dist <= self.kick_range and me.can_kick()
+        ball_dist_sq = state.ball_dist_sq[self._player_index]
+        kick = ball_dist_sq <= self.kick_range_sq and me.can_kick()
 
         return Action(ax=ax, ay=ay, kick=kick)
 
@@ -272,39 +295,46 @@ class InterceptorAgent(BaseAgent):
 class MidfielderAgent(BaseAgent):
     """Balanced agent that supports both attack and defense."""
 
+    __slots__ = (
+        'max_acceleration', 'kick_range', 'kick_range_sq', '_center_x', '_attack_dir',
+        '_fallback_x', '_clamp_lo_x', '_clamp_hi_x',
+    )
+
+    trusted = True
+
     def __init__(self, team_id: int, player_id: int, max_acceleration: float = 0.5, kick_range: float = 40.0):
         super().__init__(team_id, player_id)
         self.max_acceleration = max_acceleration
         self.kick_range = kick_range
+        self.kick_range_sq = kick_range * kick_range
+
+    def configure(self, field_width: float, field_height: float, goal_height: float) -> None:
+        self._center_x = field_width / 2
+        # Team 0 attacks right, team 1 attacks left
+        self._attack_dir = 1.0 if self.team_id == 0 else -1.0
+        # Don't go too far forward
+        if self.team_id == 0:
+            self._clamp_lo_x, self._clamp_hi_x = -math.inf, field_width * 0.7
+        else:
+            self._clamp_lo_x, self._clamp_hi_x = field_width * 0.3, math.inf
+        # Fall back position just on our side of center
+        self._fallback_x = self._center_x + 50 * self._attack_dir
 
     def get_action(self, state: 'GameState') -> Action:
         """Stay in midfield, support based on ball position."""
         me = self.get_my_player(state)
         ball = state.ball
 
-        center_x = state.field_width / 2
-        center_y = state.field_height / 2
-
         # Determine if we should attack or defend based on ball position
-        if self.team_id == 0:
-            # Team 0 attacks right
-            attacking = ball.x > center_x
-        else:
-            # Team 1 attacks left
-            attacking = ball.x < center_x
+        attacking = (ball.x - self._center_x) * self._attack_dir > 0
 
         if attacking:
             # Move toward ball but stay in midfield area
-            target_x = ball.x
+            target_x = min(max(ball.x, self._clamp_lo_x), self._clamp_hi_x)
             target_y = ball.y
-            # Don't go too far forward
-            if self.team_id == 0:
-                target_x = min(target_x, state.field_width * 0.7)
-            else:
-                target_x = max(target_x, state.field_width * 0.3)
         else:
             # Fall back toward center
-            target_x = center_x + (50 if self.team_id == 0 else -50)
+            target_x = self._fallback_x
             target_y = ball.y  # Track ball vertically
 
         dx = target_x - me.x
@@ -318,10 +348,8 @@ class MidfielderAgent(BaseAgent):
             ax, ay = 0.0, 0.0
 
         # Kick if ball is close
-        ball_dx = ball.x - me.x
-        ball_dy = ball.y - me.y
-        ball_dist = math.sqrt(ball_dx ** 2 + ball_dy ** 2)
-        kick = ball_dist <= self.kick_range and me.can_kick()
+        ball_dist_sq = state.ball_dist_sq[self._player_index]
+        kick = ball_dist_sq <= self.kick_range_sq and me.can_kick()
 
         return Action(ax=ax, ay=ay, kick=kick)
 
@@ -329,10 +357,15 @@ class MidfielderAgent(BaseAgent):
 class AggressorAgent(BaseAgent):
     """Very aggressive ball chaser with maximum speed."""
 
+    __slots__ = ('max_acceleration', 'kick_range', 'kick_range_sq')
+
+    trusted = True
+
     def __init__(self, team_id: int, player_id: int, max_acceleration: float = 0.5, kick_range: float = 45.0):
         super().__init__(team_id, player_id)
         self.max_acceleration = max_acceleration
         self.kick_range = kick_range
+        self.kick_range_sq = kick_range * kick_range
 
     def get_action(self, state: 'GameState') -> Action:
         """Aggressively chase ball at max speed, always kick."""
@@ -342,17 +375,18 @@ class AggressorAgent(BaseAgent):
         # Direct chase - no subtlety
         dx = ball.x - me.x
         dy = ball.y - me.y
-        dist = math.sqrt(dx ** 2 + dy ** 2)
+        dist_sq = state.ball_dist_sq[self._player_index]
 
-        if dist > 0:
+        if dist_sq > 0:
             # Always max acceleration toward ball
+            dist = math.sqrt(dist_sq)
             ax = (dx / dist) * self.max_acceleration
             ay = (dy / dist) * self.max_acceleration
         else:
             ax, ay = 0.0, 0.0
 
         # Always try to kick when possible
-        kick = dist <= self.kick_range and me.can_kick()
+        kick = dist_sq <= self.kick_range_sq and me.can_kick()
 
         return Action(ax=ax, ay=ay, kick=kick)
 
@@ -360,41 +394,48 @@ class AggressorAgent(BaseAgent):
 class WingerAgent(BaseAgent):
     """Fast agent that stays on the flanks and crosses."""
 
+    __slots__ = (
+        'max_acceleration', 'kick_range', 'kick_range_sq', 'preferred_y', '_flank_y_top',
+        '_flank_y_bottom', '_flank_y', '_ahead_dx', '_clamp_lo_x', '_clamp_hi_x',
+    )
+
+    trusted = True
+
     def __init__(self, team_id: int, player_id: int, max_acceleration: float = 0.5, kick_range: float = 40.0, preferred_y: float | None = None):
         super().__init__(team_id, player_id)
         self.max_acceleration = max_acceleration
         self.kick_range = kick_range
+        self.kick_range_sq = kick_range * kick_range
         self.preferred_y = preferred_y  # Top or bottom of field
 
+    def configure(self, field_width: float, field_height: float, goal_height: float) -> None:
+        # Default flank based on player_id
+        self._flank_y_top = field_height * 0.2
+        self._flank_y_bottom = field_height * 0.8
+        self._flank_y = self._flank_y_top if self.player_id % 2 == 0 else self._flank_y_bottom
+        # Stay 100 ahead of the ball, short of the opponent's final fifth
+        if self.team_id == 0:
+            self._ahead_dx = 100.0
+            self._clamp_lo_x, self._clamp_hi_x = -math.inf, field_width * 0.8
+        else:
+            self._ahead_dx = -100.0
+            self._clamp_lo_x, self._clamp_hi_x = field_width * 0.2, math.inf
+
     def get_action(self, state: 'GameState') -> Action:
         """Stay on flanks, move forward when team has ball."""
         me = self.get_my_player(state)
         ball = state.ball
 
-        # Determine preferred y position (top or bottom flank)
-        if self.preferred_y is None:
-            # Default based on player_id
-            if self.player_id % 2 == 0:
-                flank_y = state.field_height * 0.2  # Top
-            else:
-                flank_y = state.field_height * 0.8  # Bottom
-        else:
-            flank_y = self.preferred_y
+        # Preferred y position (top or bottom flank)
+        flank_y = self._flank_y if self.preferred_y is None else self.preferred_y
 
         # X position based on ball position
-        if self.team_id == 0:
-            # Team 0 attacks right
-            target_x = min(ball.x + 100, state.field_width * 0.8)
-        else:
-            # Team 1 attacks left
-            target_x = max(ball.x - 100, state.field_width * 0.2)
+        target_x = min(max(ball.x + self._ahead_dx, self._clamp_lo_x), self._clamp_hi_x)
 
         # If ball is close to our flank, go for it
-        ball_dx = ball.x - me.x
-        ball_dy = ball.y - me.y
-        ball_dist = math.sqrt(ball_dx ** 2 + ball_dy ** 2)
+        ball_dist_sq = state.ball_dist_sq[self._player_index]
 
-        if ball_dist < 150:
+        if ball_dist_sq < 22500:  # Within 150
             target_x = ball.x
             target_y = ball.y
         else:
@@ -410,6 +451,6 @@ class WingerAgent(BaseAgent):
         else:
             ax, ay = 0.0, 0.0
 
-        kick = ball_dist <= self.kick_range and me.can_kick()
+        kick = ball_dist_sq <= self.kick_range_sq and me.can_kick()
 
         return Action(ax=ax, ay=ay, kick=kick)
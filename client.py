@@ -8,6 +8,7 @@ Usage:
     python client.py localhost --agent striker
     python client.py 192.168.1.50 --agent goalie
     python client.py localhost --keyboard
+    python client.py localhost --agent striker --shm
 """
 
 import argparse
@@ -29,11 +30,20 @@ from game.config import GameConfig
 from game.state import GameState
 from network.protocol import (
     MessageType,
+    JSON,
+    MSGPACK,
+    SHM,
+    WEBSOCKET,
+    WIRE_FORMATS,
+    apply_state_delta,
     decode_message,
     decode_config,
     decode_state,
     encode_action,
+    encode_format,
+    message_format,
 )
+from network.shared_memory import SharedStateChannel
 from visualization.renderer import Renderer, PYGAME_AVAILABLE
 
 try:
@@ -115,11 +125,13 @@ class GameClient:
         port: int = 8765,
         agent_type: str = "chaser",
         keyboard: bool = False,
+        shm: bool = False,
     ):
         self.host = host
         self.port = port
         self.agent_type = agent_type
         self.keyboard = keyboard
+        self.shm = shm
 
         self.config: Optional[GameConfig] = None
         self.team_id: Optional[int] = None
@@ -127,6 +139,7 @@ class GameClient:
         self.agent = None
         self.keyboard_client: Optional[KeyboardClient] = None
         self.renderer: Optional[Renderer] = None
+        self.channel: Optional[SharedStateChannel] = None
 
         if keyboard:
             self.keyboard_client = KeyboardClient()
@@ -137,7 +150,11 @@ class GameClient:
             return None  # Keyboard control, no AI agent
 
         agent_class = AGENT_CLASSES.get(self.agent_type, ChaserAgent)
-        return agent_class(team_id, player_id)
+        agent = agent_class(team_id, player_id)
+        if self.config is not None:
+            agent.configure(self.config.field_width, self.config.field_height,
+                            self.config.goal_height)
+        return agent
 
     def get_action(self, state: GameState) -> Action:
         """Get action for the current state."""
@@ -152,6 +169,34 @@ class GameClient:
         else:
             return Action(0.0, 0.0, False)
 
+    async def poll_channel(self, index: int) -> None:
+        """Answer each new state in the shared memory block with an action."""
+        last_tick = None
+        while True:
+            state_data = self.channel.read_state()
+            if state_data is None or state_data['t'] == last_tick:
+                await asyncio.sleep(0.001)
+                continue
+            last_tick = state_data['t']
+            state = decode_state(state_data)
+
+            if self.renderer:
+                if not self.renderer.render(state):
+                    return  # Window closed
+
+            self.channel.send_action(index, self.get_action(state))
+
+            if not self.renderer and state.tick % 60 == 0:
+                print(f"Tick {state.tick}: Score {state.score[0]} - {state.score[1]}", end='\r')
+
+    def close_channel(self, task: Optional[asyncio.Task]) -> None:
+        """Stop polling and detach from the shared memory block."""
+        if task is not None:
+            task.cancel()
+        if self.channel is not None:
+            self.channel.close()
+            self.channel = None
+
     async def run(self) -> None:
         """Connect to server and run the game loop."""
         uri = f"ws://{self.host}:{self.port}"
@@ -160,6 +205,8 @@ class GameClient:
         try:
             async with websockets.connect(uri) as websocket:
                 print("Connected!")
+                state_data: Optional[dict] = None
+                poll_task: Optional[asyncio.Task] = None
 
                 async for message in websocket:
                     try:
@@ -169,6 +216,14 @@ class GameClient:
                             self.config = decode_config(data)
                             print(f"Received config: {self.config.players_per_team}v{self.config.players_per_team}")
 
+                            # Ask for binary states and deltas (or shared
+                            # memory); servers that don't know the request, or
+                            # refuse shared memory, keep using the websocket
+                            wire_format = MSGPACK if MSGPACK in WIRE_FORMATS else JSON
+                            transport = SHM if self.shm else WEBSOCKET
+                            await websocket.send(encode_format(wire_format, deltas=True,
+                                                               transport=transport, compact=True))
+
                             # Create renderer for keyboard mode
                             if self.keyboard and PYGAME_AVAILABLE:
                                 self.renderer = Renderer(self.config, title="Football Client")
@@ -188,23 +243,38 @@ class GameClient:
                             else:
                                 print(f"Using agent: {self.agent_type}")
 
-                        elif msg_type == MessageType.STATE:
-                            # Game state update - compute and send action
-                            state = decode_state(data)
+                        elif msg_type in (MessageType.STATE, MessageType.STATE_DELTA):
+                            # Game state update - compute and send action.
+                            # Deltas patch the last full state we were sent.
+                            if msg_type == MessageType.STATE:
+                                state_data = data
+                            elif state_data is None:
+                                raise ValueError("State delta received before a full state")
+                            else:
+                                apply_state_delta(state_data, data)
+                            state = decode_state(state_data)
 
                             # Render if visualization enabled
                             if self.renderer:
                                 if not self.renderer.render(state):
                                     break  # Window closed
 
+                            # Answer in the format the server sends states in
                             action = self.get_action(state)
-                            await websocket.send(encode_action(action))
+                            await websocket.send(encode_action(action, message_format(message)))
 
                             # Print score occasionally (only if no renderer)
                             if not self.renderer and state.tick % 60 == 0:
                                 print(f"Tick {state.tick}: Score {state.score[0]} - {state.score[1]}", end='\r')
 
+                        elif msg_type == MessageType.SHM:
+                            # States and actions move to shared memory from here
+                            self.channel = SharedStateChannel.attach(data['name'])
+                            poll_task = asyncio.create_task(self.poll_channel(data['index']))
+                            print("Using shared memory transport")
+
                         elif msg_type == MessageType.GAME_OVER:
+                            self.close_channel(poll_task)
                             score = data['score']
                             winner = data['winner']
                             print(f"\nGame Over! Final Score: {score[0]} - {score[1]}")
@@ -235,6 +305,8 @@ class GameClient:
                         print(f"Unexpected error processing message: {e}")
                         traceback.print_exc()
 
+                self.close_channel(poll_task)
+
         except ConnectionRefusedError:
             print(f"Could not connect to {uri}. Is the server running?")
             sys.exit(1)
@@ -339,6 +411,11 @@ Available agents: random, chaser, goalie, striker, defender, interceptor, midfie
         action="store_true",
         help="Use keyboard control (WASD + Space)",
     )
+    parser.add_argument(
+        "--shm",
+        action="store_true",
+        help="Exchange states and actions through shared memory (server on this host)",
+    )
 
     args = parser.parse_args()
 
@@ -347,6 +424,7 @@ Available agents: random, chaser, goalie, striker, defender, interceptor, midfie
         port=args.port,
         agent_type=args.agent,
         keyboard=args.keyboard,
+        shm=args.shm,
     )
 
     try:
@@ -1,5 +1,5 @@
 from .config import GameConfig
-from .entities import Player, Ball, Goal
+from .entities import EntityArrays, Player, Ball, Goal
 from .state import GameState
 from .physics import Physics
 from .engine import Game
@@ -1,4 +1,5 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from operator import attrgetter
 from typing import Tuple
 
 
@@ -104,7 +105,15 @@ class GameConfig:
             'kick_cooldown_ticks': self.kick_cooldown_ticks,
         }
 
+    def to_tuple(self) -> tuple:
+        """All settings in field order, as a hashable key (``GameConfig(*t)`` rebuilds it)."""
+        return _config_values(self)
+
     @classmethod
     def from_dict(cls, data: dict) -> 'GameConfig':
         """Create config from dictionary."""
         return cls(**data)
+
+
+# Reads every GameConfig field in declaration order (faster than dataclasses.astuple)
+_config_values = attrgetter(*(f.name for f in fields(GameConfig)))
@@ -1,17 +1,29 @@
 import concurrent.futures
-import random
-import math
 from typing import List, Tuple, Optional, TYPE_CHECKING
 
+import numpy as np
+
 from .config import GameConfig
-from .entities import Player, Ball, Goal
+from .entities import EntityArrays, Player, Ball, Goal
 from .physics import Physics
-from .state import GameState, GameStatus, PlayerState, BallState
+from . import physics_kernels
+from .state import GameState, GameStateView, GameStatus, PlayerState, PlayerView, BallState
 
 if TYPE_CHECKING:
     from agents.base import BaseAgent, Action
 
 
+# Ticks of agent noise drawn per refill of the noise buffer
+NOISE_BLOCK = 256
+
+# Ball launch directions: a random index into a unit-circle lookup table
+LAUNCH_DIRECTIONS = 1024
+_launch_angles = np.linspace(0.0, 2 * np.pi, LAUNCH_DIRECTIONS, endpoint=False)
+_LAUNCH_COS = np.cos(_launch_angles).tolist()
+_LAUNCH_SIN = np.sin(_launch_angles).tolist()
+del _launch_angles
+
+
 class Game:
     def __init__(
         self,
@@ -19,6 +31,7 @@ class Game:
         team0_agents: List['BaseAgent'],
         team1_agents: List['BaseAgent'],
         logger=None,
+        seed: Optional[int] = None,
     ):
         self.config = config
         self.team0_agents = team0_agents
@@ -38,7 +51,37 @@ class Game:
         self.goal_celebration_remaining: int = 0
         self.pending_goal_scorer: Optional[int] = None
 
+        # All game randomness (ball launch, reset jitter, agent noise) comes
+        # from one generator so a seed makes the whole game reproducible
+        self._rng = np.random.default_rng(seed)
+
+        # Vectorized policy for built-in agents (None if any agent is not batch-capable)
+        self._batch_kernel = None
+        self._batch_out: Optional[np.ndarray] = None
+        self._batch_xy: Optional[np.ndarray] = None
+
+        # Compiled acceleration + kick pass (None without Numba)
+        self._step_actions = None
+        self._step_params: Optional[np.ndarray] = None
+        if physics_kernels.NUMBA_AVAILABLE:
+            physics_kernels.warmup()
+            self._step_actions = physics_kernels.step_actions
+            self._step_params = physics_kernels.step_params(config)
+
+        # Trusted agents run inline; untrusted agents share one persistent
+        # worker pool so a slow agent can time out without stalling the tick
+        all_agents = team0_agents + team1_agents
+        self._inline_agents = [a for a in all_agents if a.trusted]
+        self._timed_agents = [a for a in all_agents if not a.trusted]
+        self._agent_futures: dict = {}
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        if self._timed_agents:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=len(self._timed_agents)
+            )
+
         self._setup_game()
+        self._setup_batch_policy()
 
     def _setup_game(self) -> None:
         """Set up initial game state."""
@@ -46,45 +89,81 @@ class Game:
         self._setup_ball()
         self._setup_goals()
 
+        self._state_view = GameStateView(
+            players=tuple(PlayerView(t, p) for t, p in self._player_keys),
+            field_width=self.config.field_width,
+            field_height=self.config.field_height,
+            goal_height=self.config.goal_height,
+        )
+
+        for agent in self.team0_agents + self.team1_agents:
+            agent.configure(self.config.field_width, self.config.field_height,
+                            self.config.goal_height)
+            i = self._agent_index.get((agent.team_id, agent.player_id))
+            if i is not None:
+                agent.noise_row = self._noise_rows[i]
+                agent._player_index = i
+
     def _setup_players(self) -> None:
         """Create players for both teams."""
-        self.players = []
-
-        # Team 0 (left)
-        positions = self.config.get_initial_player_positions(0)
-        for i, (x, y) in enumerate(positions):
-            player = Player(
-                x=x, y=y, vx=0.0, vy=0.0,
-                radius=self.config.player_radius,
-                team_id=0, player_id=i,
-                mass=self.config.player_mass,
-            )
-            self.players.append(player)
-
-        # Team 1 (right)
-        positions = self.config.get_initial_player_positions(1)
-        for i, (x, y) in enumerate(positions):
-            player = Player(
-                x=x, y=y, vx=0.0, vy=0.0,
-                radius=self.config.player_radius,
-                team_id=1, player_id=i,
-                mass=self.config.player_mass,
-            )
-            self.players.append(player)
+        n = 2 * self.config.players_per_team
+        self.arrays = EntityArrays(n)
+        arrays = self.arrays
+
+        # Team 0 (left) fills slots 0..k-1, team 1 (right) slots k..n-1
+        slot = 0
+        for team_id in (0, 1):
+            positions = self.config.get_initial_player_positions(team_id)
+            for i, (x, y) in enumerate(positions):
+                arrays.xs[slot] = x
+                arrays.ys[slot] = y
+                arrays.team_ids[slot] = team_id
+                arrays.player_ids[slot] = i
+                slot += 1
+        arrays.radii[:n] = self.config.player_radius
+        arrays.masses[:n] = self.config.player_mass
+
+        # Per-field views over the player slots
+        self.players_x = arrays.xs[:n]
+        self.players_y = arrays.ys[:n]
+        self.players_vx = arrays.vxs[:n]
+        self.players_vy = arrays.vys[:n]
+        self.players_cooldown = arrays.kick_cd[:n]
+        self.players_team = arrays.team_ids[:n]
+        self.players_mass = arrays.masses[:n]
+
+        self.players = [Player.view(arrays, i) for i in range(n)]
+        self._player_keys = list(zip(arrays.team_ids[:n].tolist(),
+                                     arrays.player_ids[:n].tolist()))
+        self._agent_index = {key: i for i, key in enumerate(self._player_keys)}
+
+        # Per-tick actions, indexed like the player slots
+        self._actions_ax = np.zeros(n, dtype=np.float64)
+        self._actions_ay = np.zeros(n, dtype=np.float64)
+        self._actions_kick = np.zeros(n, dtype=bool)
+
+        # Uniform(-1, 1) agent noise, pre-drawn in blocks of NOISE_BLOCK ticks.
+        # Per-agent calls read it through one small row per player.
+        self._noise_buf = self._rng.uniform(-1.0, 1.0, size=(NOISE_BLOCK, n, 2))
+        self._noise_idx = 0
+        self._noise_rows = [[0.0, 0.0] for _ in range(n)]
 
     def _setup_ball(self) -> None:
         """Create ball at center of field with random initial velocity."""
+        self.ball = Ball.view(self.arrays, self.arrays.ball_index)
+        self.ball.radius = self.config.ball_radius
+        self.ball.mass = self.config.ball_mass
+        self._launch_ball()
+
+    def _launch_ball(self) -> None:
+        """Place the ball at center with a random initial velocity."""
         x, y = self.config.get_initial_ball_position()
-        # Random initial velocity
-        angle = random.uniform(0, 2 * math.pi)
-        speed = random.uniform(2.0, 5.0)
-        vx = math.cos(angle) * speed
-        vy = math.sin(angle) * speed
-        self.ball = Ball(
-            x=x, y=y, vx=vx, vy=vy,
-            radius=self.config.ball_radius,
-            mass=self.config.ball_mass,
-        )
+        direction = int(self._rng.integers(LAUNCH_DIRECTIONS))
+        speed = self._rng.uniform(2.0, 5.0)
+        self.ball.x = x
+        self.ball.y = y
+        self.ball.vx = _LAUNCH_COS[direction] * speed
+        self.ball.vy = _LAUNCH_SIN[direction] * speed
 
     def _setup_goals(self) -> None:
         """Create goals on both ends of field."""
@@ -105,10 +184,73 @@ class Game:
             ),
         ]
 
-    def get_state(self) -> GameState:
-        """Get current game state snapshot."""
-        player_states = tuple(
-            PlayerState.from_player(p) for p in self.players
+    def _setup_batch_policy(self) -> None:
+        """Use a batch policy kernel for this lineup if every player has a built-in agent."""
+        from agents.batch_policies import build_policy_arrays, lineup_kernel
+
+        agents_by_key = {
+            (agent.team_id, agent.player_id): agent
+            for agent in self.team0_agents + self.team1_agents
+        }
+        agents = [agents_by_key.get(key) for key in self._player_keys]
+        arrays = build_policy_arrays(agents, self.config.field_height)
+        if arrays is None:
+            return
+
+        roles, params = arrays
+        self._batch_out = np.empty((len(self.players), 3), dtype=np.float64)
+        self._batch_xy = np.empty((len(self.players), 2), dtype=np.float64)
+        self._batch_ball = np.empty(4, dtype=np.float64)
+        self._batch_kernel = lineup_kernel(
+            roles, self.players_team, params,
+            self.config.field_width, self.config.field_height, self.config.goal_height,
+        )
+
+    def get_state(self) -> GameStateView:
+        """
+        Get the current game state.
+
+        Returns a view that is refreshed in place and reused every tick; use
+        get_state_snapshot() for a state that outlives the tick.
+        """
+        view = self._state_view
+        ball = view.ball
+        i = self.arrays.ball_index
+        bx = ball.x = self.arrays.xs[i].item()
+        by = ball.y = self.arrays.ys[i].item()
+        ball.vx = self.arrays.vxs[i].item()
+        ball.vy = self.arrays.vys[i].item()
+
+        # Player fields plus each player's squared distance to the ball,
+        # computed once here for every agent that reads it
+        ball_dist_sq = view.ball_dist_sq
+        for j, p, x, y, vx, vy, cd in zip(
+            range(len(ball_dist_sq)), view.players,
+            self.players_x.tolist(), self.players_y.tolist(),
+            self.players_vx.tolist(), self.players_vy.tolist(),
+            self.players_cooldown.tolist(),
+        ):
+            p.x = x
+            p.y = y
+            p.vx = vx
+            p.vy = vy
+            p.kick_cooldown = cd
+            dx = bx - x
+            dy = by - y
+            ball_dist_sq[j] = dx * dx + dy * dy
+
+        view.score = tuple(self.score)
+        view.tick = self.tick
+        view.status = self.status
+        return view
+
+    def get_state_snapshot(self) -> GameState:
+        """Get an immutable snapshot of the current game state."""
+        player_states = PlayerState.from_columns(
+            self.players_x.tolist(), self.players_y.tolist(),
+            self.players_vx.tolist(), self.players_vy.tolist(),
+            self.players_team.tolist(), self.arrays.player_ids[:len(self.players)].tolist(),
+            self.players_cooldown.tolist(),
         )
         ball_state = BallState.from_ball(self.ball)
 
@@ -126,107 +268,146 @@ class Game:
     def reset_positions(self) -> None:
         """Reset players and ball to initial positions after goal."""
         # Reset ball with random velocity
-        x, y = self.config.get_initial_ball_position()
-        angle = random.uniform(0, 2 * math.pi)
-        speed = random.uniform(2.0, 5.0)
-        self.ball.x = x
-        self.ball.y = y
-        self.ball.vx = math.cos(angle) * speed
-        self.ball.vy = math.sin(angle) * speed
+        self._launch_ball()
 
-        # Reset players with slight position jitter
-        team0_positions = self.config.get_initial_player_positions(0)
-        team1_positions = self.config.get_initial_player_positions(1)
+        # Reset players with slight position jitter (slots are team 0 then team 1)
+        positions = np.array(self.config.get_initial_player_positions(0)
+                             + self.config.get_initial_player_positions(1))
         jitter = 20.0  # Max position jitter
-
-        for player in self.players:
-            if player.team_id == 0:
-                x, y = team0_positions[player.player_id]
-            else:
-                x, y = team1_positions[player.player_id]
-            player.x = x + random.uniform(-jitter, jitter)
-            player.y = y + random.uniform(-jitter, jitter)
-            player.vx = 0.0
-            player.vy = 0.0
-            player.kick_cooldown = 0  # Reset kick cooldown
+        offsets = self._rng.uniform(-jitter, jitter, size=positions.shape)
+        self.players_x[:] = positions[:, 0] + offsets[:, 0]
+        self.players_y[:] = positions[:, 1] + offsets[:, 1]
+        self.players_vx[:] = 0.0
+        self.players_vy[:] = 0.0
+        self.players_cooldown[:] = 0  # Reset kick cooldown
 
         # Notify agents of reset
         for agent in self.team0_agents + self.team1_agents:
             agent.reset()
 
-    def _process_kicks(self, actions: dict) -> None:
-        """Process kick actions from all players."""
-        for player in self.players:
-            key = (player.team_id, player.player_id)
-            action = actions.get(key)
-
-            # Decrement cooldown
-            if player.kick_cooldown > 0:
-                player.kick_cooldown -= 1
-
-            # Check if player wants to kick and can kick
-            if action and action.kick and player.kick_cooldown == 0:
-                # Check if ball is in range
-                dx = self.ball.x - player.x
-                dy = self.ball.y - player.y
-                dist = math.sqrt(dx ** 2 + dy ** 2)
-
-                if dist <= self.config.kick_range:
-                    # Kick the ball - apply impulse in direction from player to ball
-                    if dist > 0.001:
-                        # Normalize direction
-                        nx = dx / dist
-                        ny = dy / dist
-                        # Apply kick impulse
-                        self.ball.vx += nx * self.config.kick_power
-                        self.ball.vy += ny * self.config.kick_power
-                    else:
-                        # Ball exactly on player, kick in player's velocity direction
-                        player_speed = math.sqrt(player.vx ** 2 + player.vy ** 2)
-                        if player_speed > 0.001:
-                            self.ball.vx += (player.vx / player_speed) * self.config.kick_power
-                            self.ball.vy += (player.vy / player_speed) * self.config.kick_power
-
-                    # Set cooldown
-                    player.kick_cooldown = self.config.kick_cooldown_ticks
-
-    def _get_agent_actions(self, state: GameState) -> dict:
-        """Get actions from all agents with timeout."""
-        from agents.base import Action
+    def _process_kicks(self, want_kick: np.ndarray) -> None:
+        """Process kick actions from all players in one vectorized pass."""
+        cooldown = np.maximum(self.players_cooldown - 1, 0)
+        if not want_kick.any():
+            self.players_cooldown[:] = cooldown
+            return
+
+        # Only players in range of the ball with an expired cooldown can kick.
+        # Distances use sqrt(dx*dx + dy*dy) rather than np.hypot, and the
+        # impulses are summed kicker by kicker in player order, exactly as
+        # physics_kernels.step_actions does, so both paths stay bit-identical
+        ball = self.arrays.ball_index
+        dx = self.arrays.xs[ball] - self.players_x
+        dy = self.arrays.ys[ball] - self.players_y
+        dist = np.sqrt(dx * dx + dy * dy)
+        eligible = want_kick & (cooldown == 0) & (dist <= self.config.kick_range)
+        self.players_cooldown[:] = np.where(eligible, self.config.kick_cooldown_ticks, cooldown)
+        if not eligible.any():
+            return
+
+        # Kick the ball in the direction from player to ball; if the ball is
+        # exactly on the player, kick in the player's velocity direction
+        vx = self.players_vx
+        vy = self.players_vy
+        centered = dist <= 0.001
+        dx = np.where(centered, vx, dx)
+        dy = np.where(centered, vy, dy)
+        dist = np.where(centered, np.sqrt(vx * vx + vy * vy), dist)
+        kickers = np.flatnonzero(eligible & (dist > 0.001))
+        scale = self.config.kick_power / dist[kickers]
+        impulse_x = 0.0
+        impulse_y = 0.0
+        for ix, iy in zip((dx[kickers] * scale).tolist(), (dy[kickers] * scale).tolist()):
+            impulse_x += ix
+            impulse_y += iy
+        self.arrays.vxs[ball] += impulse_x
+        self.arrays.vys[ball] += impulse_y
+
+    def _get_batch_actions(self) -> None:
+        """Fill the action arrays from the lineup's batch policy kernel."""
+        arrays = self.arrays
+        ball = arrays.ball_index
+        player_xy = self._batch_xy
+        player_xy[:, 0] = self.players_x
+        player_xy[:, 1] = self.players_y
+        ball_xyv = self._batch_ball
+        ball_xyv[0] = arrays.xs[ball]
+        ball_xyv[1] = arrays.ys[ball]
+        ball_xyv[2] = arrays.vxs[ball]
+        ball_xyv[3] = arrays.vys[ball]
+        noise = self._next_noise()
+
+        out = self._batch_out
+        self._batch_kernel(player_xy, self.players_cooldown, ball_xyv, noise, out)
+
+        np.copyto(self._actions_ax, out[:, 0])
+        np.copyto(self._actions_ay, out[:, 1])
+        np.not_equal(out[:, 2], 0.0, out=self._actions_kick)
+
+    def _next_noise(self) -> np.ndarray:
+        """This tick's (N, 2) slice of the noise buffer, refilling it when used up."""
+        if self._noise_idx == NOISE_BLOCK:
+            buf = self._noise_buf
+            self._rng.random(out=buf)
+            buf *= 2.0
+            buf -= 1.0
+            self._noise_idx = 0
+        noise = self._noise_buf[self._noise_idx]
+        self._noise_idx += 1
+        return noise
+
+    def _get_agent_actions(self) -> None:
+        """
+        Fill the action arrays from all agents, with timeout for untrusted agents.
+        Players without an action this tick get the default (0, 0, no kick).
+        """
+        if self._batch_kernel is not None:
+            self._get_batch_actions()
+            return
+
+        state = self.get_state()
+        for row, pair in zip(self._noise_rows, self._next_noise().tolist()):
+            row[:] = pair
 
         actions = {}
         timeout_sec = self.config.agent_timeout_ms / 1000.0
-        all_agents = self.team0_agents + self.team1_agents
-
-        # Use ThreadPoolExecutor for parallel agent calls with timeout
-        with concurrent.futures.ThreadPoolExecutor(max_workers=len(all_agents)) as executor:
-            future_to_agent = {}
-            for agent in all_agents:
-                future = executor.submit(agent.get_action, state)
-                future_to_agent[future] = agent
 
+        # Start untrusted agents first so they run while trusted ones are called.
+        # They may outlive the tick, so they get an immutable snapshot.
+        pending = {}
+        snapshot = None
+        for agent in self._timed_agents:
+            key = (agent.team_id, agent.player_id)
+            running = self._agent_futures.get(key)
+            if running is not None and not running.done():
+                continue  # Still busy with an earlier tick; gets the default action
+            if snapshot is None:
+                snapshot = self.get_state_snapshot()
+            future = self._executor.submit(agent.get_action, snapshot)
+            self._agent_futures[key] = pending[key] = future
+
+        for agent in self._inline_agents:
             try:
-                for future in concurrent.futures.as_completed(
-                    future_to_agent, timeout=timeout_sec
-                ):
-                    agent = future_to_agent[future]
-                    try:
-                        action = future.result(timeout=0.001)
-                        actions[(agent.team_id, agent.player_id)] = action
-                    except (concurrent.futures.TimeoutError, Exception):
-                        # Default action on timeout or error
-                        actions[(agent.team_id, agent.player_id)] = Action(0.0, 0.0)
-            except concurrent.futures.TimeoutError:
-                # Some agents did not respond in time; defaults are filled below.
+                actions[(agent.team_id, agent.player_id)] = agent.get_action(state)
+            except Exception:
+                # Default action on error (filled below)
                 pass
 
-        # Fill in any missing actions with defaults
-        for agent in all_agents:
-            key = (agent.team_id, agent.player_id)
-            if key not in actions:
-                actions[key] = Action(0.0, 0.0)
-
-        return actions
+        if pending:
+            concurrent.futures.wait(pending.values(), timeout=timeout_sec)
+            for key, future in pending.items():
+                if future.done() and future.exception() is None:
+                    actions[key] = future.result()
+
+        n = len(self._player_keys)
+        ax, ay, kick = [0.0] * n, [0.0] * n, [False] * n
+        for key, action in actions.items():
+            i = self._agent_index.get(key)
+            if i is not None and action is not None:
+                ax[i], ay[i], kick[i] = action.ax, action.ay, action.kick
+        self._actions_ax[:] = ax
+        self._actions_ay[:] = ay
+        self._actions_kick[:] = kick
 
     def step(self) -> Optional[int]:
         """
@@ -236,19 +417,17 @@ class Game:
         if self.status != GameStatus.RUNNING:
             return None
 
-        state = self.get_state()
-
         # Log state if logger is present
         if self.logger:
-            self.logger.log_state(state)
+            self.logger.log_arrays(self.tick, self.arrays, self.score, self.status)
 
         scoring_team = None
 
         # Check if we're in goal celebration phase
         if self.goal_celebration_remaining > 0:
             # Agents are frozen - only update physics (ball continues moving)
-            self.physics.update_positions(self.players, self.ball)
-            self.physics.handle_all_collisions(self.players, self.ball, self.goals)
+            self.physics.integrate(self.arrays)
+            self.physics.resolve_collisions(self.arrays)
 
             self.goal_celebration_remaining -= 1
 
@@ -263,22 +442,25 @@ class Game:
                 if self.score[scoring_team] >= self.config.win_score:
                     self.status = GameStatus.ENDED
         else:
-            # Normal gameplay - get actions from agents
-            actions = self._get_agent_actions(state)
-
-            # Apply actions to players
-            for player in self.players:
-                key = (player.team_id, player.player_id)
-                action = actions.get(key)
-                if action:
-                    self.physics.apply_acceleration(player, action.ax, action.ay)
-
-            # Process kicks (before physics update so kick applies before collisions)
-            self._process_kicks(actions)
+            # Normal gameplay - get actions from agents (agents never see
+            # the state during celebration, so it is only built here)
+            self._get_agent_actions()
+
+            # Apply actions to players, then process kicks (before physics
+            # update so kick applies before collisions)
+            if self._step_actions is not None:
+                arrays = self.arrays
+                self._step_actions(
+                    arrays.xs, arrays.ys, arrays.vxs, arrays.vys, self.players_cooldown,
+                    self._actions_ax, self._actions_ay, self._actions_kick, self._step_params,
+                )
+            else:
+                self.physics.apply_accelerations(self.arrays, self._actions_ax, self._actions_ay)
+                self._process_kicks(self._actions_kick)
 
             # Update physics
-            self.physics.update_positions(self.players, self.ball)
-            self.physics.handle_all_collisions(self.players, self.ball, self.goals)
+            self.physics.integrate(self.arrays)
+            self.physics.resolve_collisions(self.arrays)
 
             # Check for goal
             detected_scorer = self.physics.check_goal(self.ball, self.goals)
@@ -304,11 +486,18 @@ class Game:
 
         # Log final state
         if self.logger:
-            self.logger.log_state(self.get_state())
+            self.logger.log_arrays(self.tick, self.arrays, self.score, self.status)
             self.logger.finalize()
 
+        self.close()
         return tuple(self.score)
 
+    def close(self) -> None:
+        """Shut down the agent worker pool, if one was started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
     def get_winner(self) -> Optional[int]:
         """Get winning team (0 or 1), or None if tie/ongoing."""
         if self.status != GameStatus.ENDED:
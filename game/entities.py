@@ -2,18 +2,81 @@ from dataclasses import dataclass
 from typing import Tuple
 import math
 
+import numpy as np
+
+
+class EntityArrays:
+    """
+    Struct-of-arrays storage for moving entities.
+
+    Players occupy indices 0..n_players-1 and the ball sits at index
+    n_players, so per-entity data can be processed as contiguous arrays.
+    """
+
+    def __init__(self, n_players: int):
+        n = n_players + 1
+        self.n_players = n_players
+        self.ball_index = n_players
+        # float64 on purpose: arrays hold at most a few dozen entities, so
+        # float32 saves no measurable time, and the compiled kernels must
+        # match the scalar Python physics bit for bit.
+        self.xs = np.zeros(n, dtype=np.float64)
+        self.ys = np.zeros(n, dtype=np.float64)
+        self.vxs = np.zeros(n, dtype=np.float64)
+        self.vys = np.zeros(n, dtype=np.float64)
+        self.radii = np.zeros(n, dtype=np.float64)
+        self.masses = np.zeros(n, dtype=np.float64)
+        self.kick_cd = np.zeros(n, dtype=np.int64)
+        self.team_ids = np.full(n, -1, dtype=np.int64)
+        self.player_ids = np.full(n, -1, dtype=np.int64)
+
+    # Per-entity columns, in serialization order
+    COLUMNS = ('xs', 'ys', 'vxs', 'vys', 'radii', 'masses', 'kick_cd', 'team_ids', 'player_ids')
 
-@dataclass
-class Player:
-    x: float
-    y: float
-    vx: float
-    vy: float
-    radius: float
-    team_id: int
-    player_id: int
-    mass: float = 1.0
-    kick_cooldown: int = 0  # Ticks until player can kick again
+    def to_dict(self) -> dict:
+        data = {'n_players': self.n_players}
+        for name in self.COLUMNS:
+            data[name] = getattr(self, name).tolist()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'EntityArrays':
+        arrays = cls(data['n_players'])
+        for name in cls.COLUMNS:
+            getattr(arrays, name)[:] = data[name]
+        return arrays
+
+
+def _field(name: str, cast=float) -> property:
+    """Property reading/writing element ``index`` of ``arrays.<name>``."""
+    def fget(self):
+        return cast(getattr(self.arrays, name)[self.index])
+
+    def fset(self, value):
+        getattr(self.arrays, name)[self.index] = value
+
+    return property(fget, fset)
+
+
+class _EntityView:
+    """Base for entities that are views into one slot of an EntityArrays."""
+
+    __slots__ = ('arrays', 'index')
+
+    @classmethod
+    def view(cls, arrays: EntityArrays, index: int):
+        """Create an entity backed by slot ``index`` of existing arrays."""
+        entity = cls.__new__(cls)
+        entity.arrays = arrays
+        entity.index = index
+        return entity
+
+    x = _field('xs')
+    y = _field('ys')
+    vx = _field('vxs')
+    vy = _field('vys')
+    radius = _field('radii')
+    mass = _field('masses')
 
     @property
     def position(self) -> Tuple[float, float]:
@@ -27,6 +90,29 @@ class Player:
     def speed(self) -> float:
         return math.sqrt(self.vx ** 2 + self.vy ** 2)
 
+    def __repr__(self) -> str:
+        fields = ', '.join(f'{k}={v!r}' for k, v in self.to_dict().items())
+        return f'{type(self).__name__}({fields})'
+
+
+class Player(_EntityView):
+    __slots__ = ()
+
+    team_id = _field('team_ids', int)
+    player_id = _field('player_ids', int)
+    kick_cooldown = _field('kick_cd', int)  # Ticks until player can kick again
+
+    def __init__(self, x: float, y: float, vx: float, vy: float, radius: float,
+                 team_id: int, player_id: int, mass: float = 1.0, kick_cooldown: int = 0):
+        self.arrays = EntityArrays(1)
+        self.index = 0
+        self.x, self.y, self.vx, self.vy = x, y, vx, vy
+        self.radius = radius
+        self.team_id = team_id
+        self.player_id = player_id
+        self.mass = mass
+        self.kick_cooldown = kick_cooldown
+
     def to_dict(self) -> dict:
         return {
             'x': self.x,
@@ -45,26 +131,16 @@ class Player:
         return cls(**data)
 
 
-@dataclass
-class Ball:
-    x: float
-    y: float
-    vx: float
-    vy: float
-    radius: float
-    mass: float = 0.5
-
-    @property
-    def position(self) -> Tuple[float, float]:
-        return (self.x, self.y)
-
-    @property
-    def velocity(self) -> Tuple[float, float]:
-        return (self.vx, self.vy)
+class Ball(_EntityView):
+    __slots__ = ()
 
-    @property
-    def speed(self) -> float:
-        return math.sqrt(self.vx ** 2 + self.vy ** 2)
+    def __init__(self, x: float, y: float, vx: float, vy: float, radius: float,
+                 mass: float = 0.5):
+        self.arrays = EntityArrays(0)
+        self.index = self.arrays.ball_index
+        self.x, self.y, self.vx, self.vy = x, y, vx, vy
+        self.radius = radius
+        self.mass = mass
 
     def to_dict(self) -> dict:
         return {
@@ -81,7 +157,7 @@ class Ball:
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class Goal:
     x: float  # Center x position
     y: float  # Center y position
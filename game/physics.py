@@ -1,89 +1,210 @@
-import math
+from math import sqrt as _sqrt
 from typing import List, Optional
 
+import numpy as np
+
+from . import physics_kernels
 from .config import GameConfig
-from .entities import Player, Ball, Goal
+from .entities import EntityArrays, Player, Ball, Goal
+
+
+# Entity count from which the NumPy pair matrix beats scalar pair checks
+BROAD_PHASE_MIN_ENTITIES = 12
+
+
+class _Body:
+    """Plain-attribute scratch copy of one entity for the scalar physics loops."""
+
+    __slots__ = ('x', 'y', 'vx', 'vy', 'radius', 'mass')
+
+    def __init__(self, x, y, vx, vy, radius, mass):
+        self.x = x
+        self.y = y
+        self.vx = vx
+        self.vy = vy
+        self.radius = radius
+        self.mass = mass
+
+
+def _shared_arrays(players: List[Player], ball: Ball) -> Optional[EntityArrays]:
+    """Return the EntityArrays backing all entities in slot order, if there is one."""
+    arrays = getattr(ball, 'arrays', None)
+    if (arrays is None or arrays.n_players != len(players)
+            or ball.index != arrays.ball_index):
+        return None
+    for i, player in enumerate(players):
+        if getattr(player, 'arrays', None) is not arrays or player.index != i:
+            return None
+    return arrays
+
+
+def _load_bodies(arrays: EntityArrays) -> List[_Body]:
+    """Copy every slot of ``arrays`` into scratch bodies (ball last)."""
+    return list(map(
+        _Body,
+        arrays.xs.tolist(), arrays.ys.tolist(),
+        arrays.vxs.tolist(), arrays.vys.tolist(),
+        arrays.radii.tolist(), arrays.masses.tolist(),
+    ))
+
+
+def _store_bodies(bodies: List[_Body], arrays: EntityArrays) -> None:
+    """Write scratch body positions and velocities back into ``arrays``."""
+    arrays.xs[:] = [b.x for b in bodies]
+    arrays.ys[:] = [b.y for b in bodies]
+    arrays.vxs[:] = [b.vx for b in bodies]
+    arrays.vys[:] = [b.vy for b in bodies]
 
 
 class Physics:
     def __init__(self, config: GameConfig):
         self.config = config
+        # Config values read in the per-entity loops, as plain floats
+        self._fw = config.field_width
+        self._fh = config.field_height
+        self._corner_r = config.corner_radius
+        self._goal_depth = config.goal_width  # How deep the net goes
+        self._gtop = config.field_height / 2 - config.goal_height / 2
+        self._gbot = config.field_height / 2 + config.goal_height / 2
+        self._pmax = config.player_max_speed
+        self._bmax = config.ball_max_speed
+        self._pacc = config.player_max_acceleration
+        self._pfriction = config.player_friction
+        self._bfriction = config.ball_friction
+        corner_r = self._corner_r
+        # Corner squares span x < corner_r or x > _corner_right, and likewise in y
+        self._corner_right = self._fw - corner_r
+        self._corner_bottom = self._fh - corner_r
+        # Corner centres indexed by region code: right bit | bottom bit << 1
+        self._corners = (
+            (corner_r, corner_r),                          # Top-left
+            (self._fw - corner_r, corner_r),               # Top-right
+            (corner_r, self._fh - corner_r),               # Bottom-left
+            (self._fw - corner_r, self._fh - corner_r),    # Bottom-right
+        )
+        # Per-slot friction vectors (players, then ball), keyed by player count
+        self._frictions: dict = {}
+
+        # (top, bottom, team_id) per goal, cached by check_goal per goals list
+        self._goal_source: Optional[List[Goal]] = None
+        self._goal_lines: tuple = ()
+
+        # Compiled collision resolution for EntityArrays (None without Numba)
+        self._collision_params: Optional[np.ndarray] = None
+        if physics_kernels.NUMBA_AVAILABLE:
+            physics_kernels.warmup()
+            self._collision_params = physics_kernels.collision_params(config)
 
     def apply_acceleration(self, player: Player, ax: float, ay: float) -> None:
         """Apply acceleration to a player, clamping to max values."""
-        max_acc = self.config.player_max_acceleration
-        acc_mag = math.sqrt(ax ** 2 + ay ** 2)
-        if acc_mag > max_acc:
-            ax = ax / acc_mag * max_acc
-            ay = ay / acc_mag * max_acc
+        max_acc = self._pacc
+        acc_sq = ax * ax + ay * ay
+        if acc_sq > max_acc * max_acc:
+            scale = max_acc / _sqrt(acc_sq)
+            ax = ax * scale
+            ay = ay * scale
 
         player.vx += ax
         player.vy += ay
-        self._clamp_velocity(player, self.config.player_max_speed)
+        self._clamp_velocity(player, self._pmax)
+
+    def apply_accelerations(self, arrays: EntityArrays, ax: np.ndarray,
+                            ay: np.ndarray) -> None:
+        """Apply per-player accelerations to every player in ``arrays`` at once."""
+        n = arrays.n_players
+        ax, ay = self._clamp_vectors(ax, ay, self._pacc)
+        vxs = arrays.vxs[:n]
+        vys = arrays.vys[:n]
+        vxs += ax
+        vys += ay
+        vxs[:], vys[:] = self._clamp_vectors(vxs, vys, self._pmax)
+
+    @staticmethod
+    def _clamp_vectors(xs: np.ndarray, ys: np.ndarray, max_mag: float):
+        """Vectorized counterpart of _clamp_velocity; returns clamped (xs, ys)."""
+        # Compare squared magnitudes; only lanes over the limit need a sqrt
+        mag_sq = xs * xs + ys * ys
+        over = mag_sq > max_mag * max_mag
+        if not over.any():
+            return xs, ys
+        scale = np.divide(max_mag, np.sqrt(mag_sq), out=np.ones_like(mag_sq), where=over)
+        return xs * scale, ys * scale
+
+    def _friction_vector(self, n_players: int) -> np.ndarray:
+        """Friction factor for every slot of an EntityArrays with n_players."""
+        frictions = self._frictions.get(n_players)
+        if frictions is None:
+            frictions = np.full(n_players + 1, self._pfriction)
+            frictions[n_players] = self._bfriction
+            self._frictions[n_players] = frictions
+        return frictions
 
     def _clamp_velocity(self, entity, max_speed: float) -> None:
         """Clamp entity velocity to max speed."""
-        speed = math.sqrt(entity.vx ** 2 + entity.vy ** 2)
-        if speed > max_speed:
-            entity.vx = entity.vx / speed * max_speed
-            entity.vy = entity.vy / speed * max_speed
+        vx = entity.vx
+        vy = entity.vy
+        speed_sq = vx * vx + vy * vy
+        if speed_sq > max_speed * max_speed:
+            scale = max_speed / _sqrt(speed_sq)
+            entity.vx = vx * scale
+            entity.vy = vy * scale
 
     def update_positions(self, players: List[Player], ball: Ball) -> None:
         """Update all entity positions based on velocities."""
+        arrays = _shared_arrays(players, ball)
+        if arrays is not None:
+            self.integrate(arrays)
+            return
+
+        friction = self._pfriction
         for player in players:
             player.x += player.vx
             player.y += player.vy
             # Apply friction to players
-            player.vx *= self.config.player_friction
-            player.vy *= self.config.player_friction
+            player.vx *= friction
+            player.vy *= friction
 
         ball.x += ball.vx
         ball.y += ball.vy
 
         # Apply friction to ball
-        ball.vx *= self.config.ball_friction
-        ball.vy *= self.config.ball_friction
-        self._clamp_velocity(ball, self.config.ball_max_speed)
-
-    def _is_in_corner_region(self, x: float, y: float) -> Optional[tuple]:
-        """
-        Check if position is in a corner region.
-        Returns (corner_center_x, corner_center_y) if in corner, None otherwise.
-        """
-        field_w = self.config.field_width
-        field_h = self.config.field_height
-        corner_r = self.config.corner_radius
-
-        corners = [
-            (corner_r, corner_r),                      # Top-left
-            (field_w - corner_r, corner_r),           # Top-right
-            (corner_r, field_h - corner_r),           # Bottom-left
-            (field_w - corner_r, field_h - corner_r), # Bottom-right
-        ]
-
-        # Check each corner
-        if x < corner_r and y < corner_r:
-            return corners[0]
-        elif x > field_w - corner_r and y < corner_r:
-            return corners[1]
-        elif x < corner_r and y > field_h - corner_r:
-            return corners[2]
-        elif x > field_w - corner_r and y > field_h - corner_r:
-            return corners[3]
-
-        return None
+        ball.vx *= self._bfriction
+        ball.vy *= self._bfriction
+        self._clamp_velocity(ball, self._bmax)
+
+    def integrate(self, arrays: EntityArrays) -> None:
+        """update_positions for entities stored in ``arrays``."""
+        # Ball is the last slot, so one ufunc per axis covers every entity.
+        # Explicit out= keeps each step in place on the contiguous arrays.
+        xs, ys, vxs, vys = arrays.xs, arrays.ys, arrays.vxs, arrays.vys
+        frictions = self._friction_vector(arrays.n_players)
+        np.add(xs, vxs, out=xs)
+        np.add(ys, vys, out=ys)
+        np.multiply(vxs, frictions, out=vxs)
+        np.multiply(vys, frictions, out=vys)
+
+        # Only the ball has a speed limit here
+        ball = arrays.ball_index
+        vx = arrays.vxs[ball].item()
+        vy = arrays.vys[ball].item()
+        max_speed = self._bmax
+        speed_sq = vx * vx + vy * vy
+        if speed_sq > max_speed * max_speed:
+            scale = max_speed / _sqrt(speed_sq)
+            arrays.vxs[ball] = vx * scale
+            arrays.vys[ball] = vy * scale
 
     def _enforce_boundary(self, entity, radius: float, is_ball: bool = False) -> None:
         """Enforce that entity stays within field boundaries."""
-        field_w = self.config.field_width
-        field_h = self.config.field_height
-        corner_r = self.config.corner_radius
-        goal_depth = self.config.goal_width  # How deep the net goes
+        field_w = self._fw
+        field_h = self._fh
+        corner_r = self._corner_r
+        goal_depth = self._goal_depth
         restitution = 0.8 if is_ball else 0.5
 
         # Goal area check for ball
-        goal_top = field_h / 2 - self.config.goal_height / 2
-        goal_bottom = field_h / 2 + self.config.goal_height / 2
+        goal_top = self._gtop
+        goal_bottom = self._gbot
 
         # Check if ball is inside a goal net area
         in_left_goal = is_ball and entity.x < 0 and (goal_top <= entity.y <= goal_bottom)
@@ -120,23 +241,32 @@ class Physics:
                 entity.vy = 0  # Stop against side netting
             return  # Skip other boundary checks
 
-        # Check if in corner region
-        corner = self._is_in_corner_region(entity.x, entity.y)
+        # Check if in corner region: a 2-bit code (right, bottom) picks the
+        # corner, and off-corner entities are rejected by the first test
+        x = entity.x
+        y = entity.y
+        right = x > self._corner_right
+        bottom = y > self._corner_bottom
+        if (x < corner_r or right) and (y < corner_r or bottom):
+            corner = self._corners[right + 2 * bottom]
+        else:
+            corner = None
 
         if corner is not None:
             cx, cy = corner
             # Distance from corner center
             dx = entity.x - cx
             dy = entity.y - cy
-            dist = math.sqrt(dx ** 2 + dy ** 2)
+            dist_sq = dx * dx + dy * dy
 
             # In corner region, entity must be CLOSER to corner center than corner_r
             # (the playable area is inside the quarter circle)
             max_dist = corner_r - radius
 
-            if dist > max_dist:
+            if dist_sq > max_dist * max_dist:
                 # Entity is outside playable area, push toward corner center
-                if dist > 0.001:
+                if dist_sq > 1e-6:
+                    dist = _sqrt(dist_sq)
                     nx = dx / dist
                     ny = dy / dist
                     entity.x = cx + nx * max_dist
@@ -187,19 +317,22 @@ class Physics:
         """
         dx = e2.x - e1.x
         dy = e2.y - e1.y
-        dist = math.sqrt(dx ** 2 + dy ** 2)
+        dist_sq = dx * dx + dy * dy
         min_dist = r1 + r2
 
-        if dist >= min_dist:
+        # Squared test first: no sqrt for pairs that don't touch
+        if dist_sq >= min_dist * min_dist:
             return False  # No collision
 
-        if dist < 0.001:
+        if dist_sq < 1e-6:
             # Overlapping centers, push apart arbitrarily
-            dx, dy, dist = 1.0, 0.0, 1.0
-
-        # Normalize
-        nx = dx / dist
-        ny = dy / dist
+            nx, ny, dist = 1.0, 0.0, 1.0
+        else:
+            # Normalize with one division
+            dist = _sqrt(dist_sq)
+            inv_dist = 1.0 / dist
+            nx = dx * inv_dist
+            ny = dy * inv_dist
 
         # Separate the entities (push apart)
         overlap = min_dist - dist
@@ -217,25 +350,27 @@ class Physics:
         # Only resolve if moving toward each other
         if dvn < 0:
             # Impulse
-            j = -(1 + restitution) * dvn / (1 / m1 + 1 / m2)
+            inv_m1 = 1.0 / m1
+            inv_m2 = 1.0 / m2
+            j = -(1 + restitution) * dvn / (inv_m1 + inv_m2)
 
-            e1.vx -= j / m1 * nx
-            e1.vy -= j / m1 * ny
-            e2.vx += j / m2 * nx
-            e2.vy += j / m2 * ny
+            e1.vx -= j * inv_m1 * nx
+            e1.vy -= j * inv_m1 * ny
+            e2.vx += j * inv_m2 * nx
+            e2.vy += j * inv_m2 * ny
 
         return True
 
     def _is_valid_position(self, entity, radius: float, is_ball: bool = False) -> bool:
         """Check if entity is within field boundaries."""
-        field_w = self.config.field_width
-        field_h = self.config.field_height
-        corner_r = self.config.corner_radius
-        goal_depth = self.config.goal_width
+        field_w = self._fw
+        field_h = self._fh
+        corner_r = self._corner_r
+        goal_depth = self._goal_depth
 
         # Goal area for ball
-        goal_top = field_h / 2 - self.config.goal_height / 2
-        goal_bottom = field_h / 2 + self.config.goal_height / 2
+        goal_top = self._gtop
+        goal_bottom = self._gbot
 
         # Check if ball is validly inside a goal net
         if is_ball:
@@ -245,15 +380,21 @@ class Physics:
             if in_goal_y and (in_left_net or in_right_net):
                 return True
 
-        # Check corner regions
-        corner = self._is_in_corner_region(entity.x, entity.y)
+        # Check corner regions (same classification as _enforce_boundary)
+        x = entity.x
+        y = entity.y
+        right = x > self._corner_right
+        bottom = y > self._corner_bottom
+        if (x < corner_r or right) and (y < corner_r or bottom):
+            corner = self._corners[right + 2 * bottom]
+        else:
+            corner = None
         if corner is not None:
             cx, cy = corner
             dx = entity.x - cx
             dy = entity.y - cy
-            dist = math.sqrt(dx ** 2 + dy ** 2)
-            max_dist = corner_r - radius
-            if dist > max_dist + 0.001:  # Small tolerance
+            limit = corner_r - radius + 0.001  # Small tolerance
+            if dx * dx + dy * dy > limit * limit:
                 return False
             return True
 
@@ -275,9 +416,8 @@ class Physics:
         """Check if two circular entities overlap."""
         dx = e2.x - e1.x
         dy = e2.y - e1.y
-        dist = math.sqrt(dx ** 2 + dy ** 2)
-        min_dist = r1 + r2
-        return dist < min_dist - 0.001  # Small tolerance
+        limit = r1 + r2 - 0.001  # Small tolerance
+        return dx * dx + dy * dy < limit * limit
 
     def validate_state(self, players: List[Player], ball: Ball) -> bool:
         """
@@ -286,6 +426,11 @@ class Physics:
         - All entities within boundaries
         Returns True if state is valid.
         """
+        arrays = _shared_arrays(players, ball)
+        if arrays is not None:
+            bodies = _load_bodies(arrays)
+            players, ball = bodies[:-1], bodies[-1]
+
         # Check all entities are within boundaries
         for player in players:
             if not self._is_valid_position(player, player.radius, is_ball=False):
@@ -294,6 +439,14 @@ class Physics:
         if not self._is_valid_position(ball, ball.radius, is_ball=True):
             return False
 
+        entities = list(players) + [ball]
+        if len(entities) >= BROAD_PHASE_MIN_ENTITIES:
+            # Same test as _has_overlap for every pair; the diagonal
+            # (d2 == 0) always passes, so count past it
+            d2, r_sum = self._pair_distances(entities)
+            limit = r_sum - 0.001
+            return int(np.count_nonzero(d2 < limit * limit)) == len(entities)
+
         # Check no player-ball overlaps
         for player in players:
             if self._has_overlap(player, player.radius, ball, ball.radius):
@@ -307,10 +460,61 @@ class Physics:
 
         return True
 
+    def _touching_rows(self, entities) -> list:
+        """
+        Nested lists where [i][j] is False only if entities i and j cannot touch.
+
+        Small rosters mark every pair; larger ones use the exact pair matrix.
+        (The resolution loop still visits every pair, since pairs whose
+        entities moved earlier in the pass are re-tested, so a sparser
+        structure would not make a pass cheaper.)
+        """
+        m = len(entities)
+        if m < BROAD_PHASE_MIN_ENTITIES:
+            return [[True] * m] * m  # Test every pair
+        d2, r_sum = self._pair_distances(entities)
+        return (d2 < r_sum * r_sum).tolist()
+
+    @staticmethod
+    def _pair_distances(entities) -> tuple:
+        """
+        Pairwise squared center distances and radius sums for ``entities``.
+
+        Entry [i, j] uses entities[j] - entities[i], matching the scalar
+        pair routines operation for operation.
+        """
+        xs, ys, radii = np.array([(e.x, e.y, e.radius) for e in entities]).T
+        dx = xs[None, :] - xs[:, None]
+        dy = ys[None, :] - ys[:, None]
+        return dx * dx + dy * dy, radii[None, :] + radii[:, None]
+
     def handle_all_collisions(self, players: List[Player], ball: Ball,
                               goals: List[Goal]) -> None:  # noqa: ARG002
         """Handle all collisions with iterations until state is valid."""
+        arrays = _shared_arrays(players, ball)
+        if arrays is not None:
+            self.resolve_collisions(arrays)
+        else:
+            self._resolve_all(players, ball)
+
+    def resolve_collisions(self, arrays: EntityArrays) -> None:
+        """handle_all_collisions for entities stored in ``arrays``."""
+        if self._collision_params is not None:
+            physics_kernels.resolve_collisions(
+                arrays.xs, arrays.ys, arrays.vxs, arrays.vys, arrays.radii, arrays.masses,
+                self._collision_params,
+            )
+            return
+
+        # Run the scalar loops on plain attributes rather than array views
+        bodies = _load_bodies(arrays)
+        self._resolve_all(bodies[:-1], bodies[-1])
+        _store_bodies(bodies, arrays)
+
+    def _resolve_all(self, players: List[Player], ball: Ball) -> None:
+        """Iterate boundary and collision resolution until the state is valid."""
         max_iterations = 20  # Increased for safety
+        n = len(players)
 
         for _ in range(max_iterations):
             # Enforce boundaries for all entities
@@ -318,29 +522,44 @@ class Physics:
                 self._enforce_boundary(player, player.radius, is_ball=False)
             self._enforce_boundary(ball, ball.radius, is_ball=True)
 
+            # Broad phase: which pairs touch before any resolution this pass.
+            # A pair can only start touching mid-pass if an earlier resolution
+            # moved one of its entities, so only those pairs are re-tested.
+            touching = self._touching_rows(list(players) + [ball])
+            moved = [False] * (n + 1)
+
             # Resolve player-ball collisions
-            for player in players:
-                self._resolve_circle_collision(
-                    player, player.radius,
-                    ball, ball.radius,
-                    player.mass, ball.mass,
-                    restitution=0.9
-                )
+            for i, player in enumerate(players):
+                if touching[i][n] or moved[i] or moved[n]:
+                    if self._resolve_circle_collision(
+                        player, player.radius,
+                        ball, ball.radius,
+                        player.mass, ball.mass,
+                        restitution=0.9
+                    ):
+                        moved[i] = moved[n] = True
 
             # Resolve player-player collisions
             for i, p1 in enumerate(players):
-                for p2 in players[i + 1:]:
-                    self._resolve_circle_collision(
-                        p1, p1.radius,
-                        p2, p2.radius,
-                        p1.mass, p2.mass,
-                        restitution=0.5
-                    )
-
-            # Final boundary enforcement
-            for player in players:
-                self._enforce_boundary(player, player.radius, is_ball=False)
-            self._enforce_boundary(ball, ball.radius, is_ball=True)
+                row = touching[i]
+                for j in range(i + 1, n):
+                    if row[j] or moved[i] or moved[j]:
+                        p2 = players[j]
+                        if self._resolve_circle_collision(
+                            p1, p1.radius,
+                            p2, p2.radius,
+                            p1.mass, p2.mass,
+                            restitution=0.5
+                        ):
+                            moved[i] = moved[j] = True
+
+            # Final boundary enforcement, only for entities a collision
+            # displaced; the rest were clamped at the top of this pass
+            for player, player_moved in zip(players, moved):
+                if player_moved:
+                    self._enforce_boundary(player, player.radius, is_ball=False)
+            if moved[n]:
+                self._enforce_boundary(ball, ball.radius, is_ball=True)
 
             # Check if state is now valid
             if self.validate_state(players, ball):
@@ -390,7 +609,7 @@ class Physics:
         """Push two overlapping entities apart equally."""
         dx = e2.x - e1.x
         dy = e2.y - e1.y
-        dist = math.sqrt(dx ** 2 + dy ** 2)
+        dist = _sqrt(dx * dx + dy * dy)
         min_dist = r1 + r2
 
         if dist < 0.001:
@@ -412,20 +631,28 @@ class Physics:
         Check if entire ball has crossed the goal line.
         Returns the team_id that SCORED (opponent of the goal owner), or None.
         """
-        for goal in goals:
+        # Goals are fixed for a game, so their bounds are read once per list
+        if goals is not self._goal_source:
+            self._goal_source = goals
+            self._goal_lines = tuple((goal.top, goal.bottom, goal.team_id) for goal in goals)
+
+        x = ball.x
+        y = ball.y
+        radius = ball.radius
+        for top, bottom, team_id in self._goal_lines:
             # Check if ball is within goal height (y-range)
-            if not (goal.top <= ball.y <= goal.bottom):
+            if not (top <= y <= bottom):
                 continue
 
             # Check if entire ball has crossed the goal line
             # Left goal (team 0 defends): ball must fully cross x=0 going left
             # Right goal (team 1 defends): ball must fully cross x=field_width going right
-            if goal.team_id == 0:
+            if team_id == 0:
                 # Left goal - entire ball must be past x=0
-                if ball.x + ball.radius <= 0:
-                    return 1 - goal.team_id
+                if x + radius <= 0:
+                    return 1 - team_id
             else:
                 # Right goal - entire ball must be past field width
-                if ball.x - ball.radius >= self.config.field_width:
-                    return 1 - goal.team_id
+                if x - radius >= self._fw:
+                    return 1 - team_id
         return None
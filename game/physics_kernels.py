@@ -0,0 +1,475 @@
+"""Compiled per-tick kernels for the struct-of-arrays game state.
+
+Each kernel is a plain scalar loop over the ``EntityArrays`` columns
+(players in slots ``0..n-1``, ball in slot ``n``) that Numba compiles to
+machine code with no per-tick allocations. Without Numba the engine and
+``Physics`` keep using their NumPy / Python paths; the loops here are
+still importable and correct, just slow as pure Python.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+from .config import GameConfig
+
+# Entries of the step_actions params vector
+S_MAX_ACC = 0
+S_MAX_SPEED = 1
+S_KICK_RANGE = 2
+S_KICK_POWER = 3
+S_KICK_COOLDOWN = 4
+NUM_STEP_PARAMS = 5
+
+# Entries of the resolve_collisions params vector
+C_FIELD_WIDTH = 0
+C_FIELD_HEIGHT = 1
+C_CORNER_RADIUS = 2
+C_GOAL_DEPTH = 3
+C_GOAL_TOP = 4
+C_GOAL_BOTTOM = 5
+NUM_COLLISION_PARAMS = 6
+
+
+def step_params(config: GameConfig) -> np.ndarray:
+    """Pack the config values step_actions needs into a params vector."""
+    params = np.empty(NUM_STEP_PARAMS, dtype=np.float64)
+    params[S_MAX_ACC] = config.player_max_acceleration
+    params[S_MAX_SPEED] = config.player_max_speed
+    params[S_KICK_RANGE] = config.kick_range
+    params[S_KICK_POWER] = config.kick_power
+    params[S_KICK_COOLDOWN] = config.kick_cooldown_ticks
+    return params
+
+
+def collision_params(config: GameConfig) -> np.ndarray:
+    """Pack the field geometry resolve_collisions needs into a params vector."""
+    params = np.empty(NUM_COLLISION_PARAMS, dtype=np.float64)
+    params[C_FIELD_WIDTH] = config.field_width
+    params[C_FIELD_HEIGHT] = config.field_height
+    params[C_CORNER_RADIUS] = config.corner_radius
+    params[C_GOAL_DEPTH] = config.goal_width
+    params[C_GOAL_TOP] = config.field_height / 2 - config.goal_height / 2
+    params[C_GOAL_BOTTOM] = config.field_height / 2 + config.goal_height / 2
+    return params
+
+
+def _step_actions(xs, ys, vxs, vys, cooldown, ax, ay, kick, params):
+    """
+    Apply one tick of player actions in place.
+
+    Same result as ``Physics.apply_accelerations`` followed by
+    ``Game._process_kicks``: clamp and apply each player's acceleration,
+    tick down kick cooldowns, and add the impulse of every eligible kicker
+    to the ball velocity.
+
+    Args:
+        xs, ys, vxs, vys: EntityArrays columns (ball at index len(ax))
+        cooldown: Player kick cooldowns (int64, modified in place)
+        ax, ay: Requested accelerations per player slot
+        kick: Kick flags per player slot
+        params: Vector built by step_params()
+    """
+    n = ax.shape[0]
+    max_acc = params[S_MAX_ACC]
+    max_speed = params[S_MAX_SPEED]
+    kick_range = params[S_KICK_RANGE]
+    kick_power = params[S_KICK_POWER]
+    kick_cooldown = np.int64(params[S_KICK_COOLDOWN])
+    ball_x = xs[n]
+    ball_y = ys[n]
+    impulse_x = 0.0
+    impulse_y = 0.0
+
+    for i in range(n):
+        # Acceleration, clamped to max_acc, then speed clamped to max_speed
+        a_x = ax[i]
+        a_y = ay[i]
+        mag_sq = a_x * a_x + a_y * a_y
+        if mag_sq > max_acc * max_acc:
+            scale = max_acc / math.sqrt(mag_sq)
+            a_x = a_x * scale
+            a_y = a_y * scale
+        vx = vxs[i] + a_x
+        vy = vys[i] + a_y
+        speed_sq = vx * vx + vy * vy
+        if speed_sq > max_speed * max_speed:
+            scale = max_speed / math.sqrt(speed_sq)
+            vx = vx * scale
+            vy = vy * scale
+        vxs[i] = vx
+        vys[i] = vy
+
+        cd = cooldown[i] - 1
+        if cd < 0:
+            cd = 0
+        cooldown[i] = cd
+        if not kick[i] or cd != 0:
+            continue
+
+        dx = ball_x - xs[i]
+        dy = ball_y - ys[i]
+        dist = math.sqrt(dx * dx + dy * dy)
+        if dist > kick_range:
+            continue
+        cooldown[i] = kick_cooldown
+
+        # Kick from player to ball; if the ball is exactly on the player,
+        # kick in the player's velocity direction. Impulses are summed in
+        # player order, as Game._process_kicks does
+        if dist <= 0.001:
+            dx = vx
+            dy = vy
+            dist = math.sqrt(vx * vx + vy * vy)
+        if dist > 0.001:
+            impulse_x += dx * (kick_power / dist)
+            impulse_y += dy * (kick_power / dist)
+
+    vxs[n] += impulse_x
+    vys[n] += impulse_y
+
+
+# The collision kernels below mirror Physics._enforce_boundary,
+# _resolve_circle_collision, _is_valid_position, _has_overlap,
+# _separate_entities, _resolve_all and _force_valid_state operation for
+# operation, so compiled and interpreted games stay bit-identical. (That is
+# also why they are compiled without fastmath.)
+
+def _enforce_boundary(xs, ys, vxs, vys, i, radius, is_ball, params):
+    """Keep entity ``i`` inside the field, corners and goal nets."""
+    field_w = params[C_FIELD_WIDTH]
+    field_h = params[C_FIELD_HEIGHT]
+    corner_r = params[C_CORNER_RADIUS]
+    goal_depth = params[C_GOAL_DEPTH]
+    goal_top = params[C_GOAL_TOP]
+    goal_bottom = params[C_GOAL_BOTTOM]
+    restitution = 0.8 if is_ball else 0.5
+
+    # Ball inside a goal net: only the net walls apply
+    if is_ball and (xs[i] < 0 or xs[i] > field_w) and goal_top <= ys[i] <= goal_bottom:
+        if xs[i] < 0:
+            if xs[i] - radius < -goal_depth:
+                xs[i] = -goal_depth + radius
+                vxs[i] = 0.0
+        elif xs[i] + radius > field_w + goal_depth:
+            xs[i] = field_w + goal_depth - radius
+            vxs[i] = 0.0
+        if ys[i] - radius < goal_top:
+            ys[i] = goal_top + radius
+            vys[i] = 0.0
+        if ys[i] + radius > goal_bottom:
+            ys[i] = goal_bottom - radius
+            vys[i] = 0.0
+        return
+
+    # Corner regions: stay inside the quarter circle
+    x = xs[i]
+    y = ys[i]
+    in_corner = True
+    if x < corner_r and y < corner_r:
+        cx = corner_r
+        cy = corner_r
+    elif x > field_w - corner_r and y < corner_r:
+        cx = field_w - corner_r
+        cy = corner_r
+    elif x < corner_r and y > field_h - corner_r:
+        cx = corner_r
+        cy = field_h - corner_r
+    elif x > field_w - corner_r and y > field_h - corner_r:
+        cx = field_w - corner_r
+        cy = field_h - corner_r
+    else:
+        in_corner = False
+        cx = 0.0
+        cy = 0.0
+
+    if in_corner:
+        dx = x - cx
+        dy = y - cy
+        dist_sq = dx * dx + dy * dy
+        max_dist = corner_r - radius
+        if dist_sq > max_dist * max_dist and dist_sq > 1e-6:
+            dist = math.sqrt(dist_sq)
+            nx = dx / dist
+            ny = dy / dist
+            xs[i] = cx + nx * max_dist
+            ys[i] = cy + ny * max_dist
+            dot = vxs[i] * nx + vys[i] * ny
+            if dot > 0:
+                vxs[i] -= 2 * dot * nx * restitution
+                vys[i] -= 2 * dot * ny * restitution
+        return
+
+    # Straight walls, written as selects rather than nested branches so the
+    # compiler can emit conditional moves. The ball may pass the goal lines.
+    vx = vxs[i]
+    vy = vys[i]
+    side_walls = not is_ball or not (goal_top <= y <= goal_bottom)
+
+    hit = side_walls and x - radius < 0
+    x = radius if hit else x
+    vx = -vx * restitution if hit and vx < 0 else vx
+    hit = side_walls and x + radius > field_w
+    x = field_w - radius if hit else x
+    vx = -vx * restitution if hit and vx > 0 else vx
+
+    hit = y - radius < 0
+    y = radius if hit else y
+    vy = -vy * restitution if hit and vy < 0 else vy
+    hit = y + radius > field_h
+    y = field_h - radius if hit else y
+    vy = -vy * restitution if hit and vy > 0 else vy
+
+    xs[i] = x
+    ys[i] = y
+    vxs[i] = vx
+    vys[i] = vy
+
+
+def _resolve_pair(xs, ys, vxs, vys, i, j, r1, r2, m1, m2, restitution):
+    """Separate entities ``i`` and ``j`` and exchange impulse if they overlap."""
+    dx = xs[j] - xs[i]
+    dy = ys[j] - ys[i]
+    dist_sq = dx * dx + dy * dy
+    min_dist = r1 + r2
+    if dist_sq >= min_dist * min_dist:
+        return
+
+    if dist_sq < 1e-6:
+        # Overlapping centers, push apart arbitrarily
+        nx = 1.0
+        ny = 0.0
+        dist = 1.0
+    else:
+        dist = math.sqrt(dist_sq)
+        inv_dist = 1.0 / dist
+        nx = dx * inv_dist
+        ny = dy * inv_dist
+
+    overlap = min_dist - dist
+    total_mass = m1 + m2
+    xs[i] -= nx * overlap * (m2 / total_mass)
+    ys[i] -= ny * overlap * (m2 / total_mass)
+    xs[j] += nx * overlap * (m1 / total_mass)
+    ys[j] += ny * overlap * (m1 / total_mass)
+
+    dvx = vxs[j] - vxs[i]
+    dvy = vys[j] - vys[i]
+    dvn = dvx * nx + dvy * ny
+    if dvn < 0:
+        inv_m1 = 1.0 / m1
+        inv_m2 = 1.0 / m2
+        impulse = -(1 + restitution) * dvn / (inv_m1 + inv_m2)
+        vxs[i] -= impulse * inv_m1 * nx
+        vys[i] -= impulse * inv_m1 * ny
+        vxs[j] += impulse * inv_m2 * nx
+        vys[j] += impulse * inv_m2 * ny
+
+
+def _is_valid_position(xs, ys, i, radius, is_ball, params):
+    """Whether entity ``i`` lies within the field (with a small tolerance)."""
+    field_w = params[C_FIELD_WIDTH]
+    field_h = params[C_FIELD_HEIGHT]
+    corner_r = params[C_CORNER_RADIUS]
+    goal_depth = params[C_GOAL_DEPTH]
+    goal_top = params[C_GOAL_TOP]
+    goal_bottom = params[C_GOAL_BOTTOM]
+    x = xs[i]
+    y = ys[i]
+
+    if is_ball:
+        in_goal_y = goal_top - 0.001 <= y <= goal_bottom + 0.001
+        in_left_net = x < 0 and x - radius >= -goal_depth - 0.001
+        in_right_net = x > field_w and x + radius <= field_w + goal_depth + 0.001
+        if in_goal_y and (in_left_net or in_right_net):
+            return True
+
+    in_corner = True
+    if x < corner_r and y < corner_r:
+        cx = corner_r
+        cy = corner_r
+    elif x > field_w - corner_r and y < corner_r:
+        cx = field_w - corner_r
+        cy = corner_r
+    elif x < corner_r and y > field_h - corner_r:
+        cx = corner_r
+        cy = field_h - corner_r
+    elif x > field_w - corner_r and y > field_h - corner_r:
+        cx = field_w - corner_r
+        cy = field_h - corner_r
+    else:
+        in_corner = False
+        cx = 0.0
+        cy = 0.0
+
+    if in_corner:
+        dx = x - cx
+        dy = y - cy
+        limit = corner_r - radius + 0.001
+        return dx * dx + dy * dy <= limit * limit
+
+    if x - radius < -0.001:
+        if not is_ball or not (goal_top <= y <= goal_bottom):
+            return False
+    if x + radius > field_w + 0.001:
+        if not is_ball or not (goal_top <= y <= goal_bottom):
+            return False
+    if y - radius < -0.001:
+        return False
+    if y + radius > field_h + 0.001:
+        return False
+    return True
+
+
+def _touching(xs, ys, i, j, r1, r2):
+    """Whether entities ``i`` and ``j`` are in contact (``_resolve_pair``'s test)."""
+    dx = xs[j] - xs[i]
+    dy = ys[j] - ys[i]
+    min_dist = r1 + r2
+    return dx * dx + dy * dy < min_dist * min_dist
+
+
+def _has_overlap(xs, ys, i, j, r1, r2):
+    """Whether entities ``i`` and ``j`` overlap (beyond a small tolerance)."""
+    dx = xs[j] - xs[i]
+    dy = ys[j] - ys[i]
+    limit = r1 + r2 - 0.001
+    return dx * dx + dy * dy < limit * limit
+
+
+def _is_valid_state(xs, ys, radii, params):
+    """No entity outside the field and no overlapping pair."""
+    n = xs.shape[0] - 1
+    for i in range(n):
+        if not _is_valid_position(xs, ys, i, radii[i], False, params):
+            return False
+    if not _is_valid_position(xs, ys, n, radii[n], True, params):
+        return False
+    for i in range(n):
+        if _has_overlap(xs, ys, i, n, radii[i], radii[n]):
+            return False
+    for i in range(n):
+        for j in range(i + 1, n):
+            if _has_overlap(xs, ys, i, j, radii[i], radii[j]):
+                return False
+    return True
+
+
+def _enforce_all(xs, ys, vxs, vys, radii, params):
+    n = xs.shape[0] - 1
+    for i in range(n):
+        _enforce_boundary(xs, ys, vxs, vys, i, radii[i], False, params)
+    _enforce_boundary(xs, ys, vxs, vys, n, radii[n], True, params)
+
+
+def _separate(xs, ys, i, j, r1, r2):
+    """Push two overlapping entities apart equally, ignoring momentum."""
+    dx = xs[j] - xs[i]
+    dy = ys[j] - ys[i]
+    dist = math.sqrt(dx * dx + dy * dy)
+    min_dist = r1 + r2
+    if dist < 0.001:
+        dx = 1.0
+        dy = 0.0
+        dist = 1.0
+    nx = dx / dist
+    ny = dy / dist
+    overlap = min_dist - dist + 0.01  # Extra margin
+    xs[i] -= nx * overlap * 0.5
+    ys[i] -= ny * overlap * 0.5
+    xs[j] += nx * overlap * 0.5
+    ys[j] += ny * overlap * 0.5
+
+
+def _resolve_collisions(xs, ys, vxs, vys, radii, masses, params):
+    """
+    Iterate boundary and collision resolution until the state is valid.
+
+    Same result as ``Physics.handle_all_collisions`` on the entities of an
+    ``EntityArrays`` (ball at the last index), modifying the arrays in place.
+    """
+    n = xs.shape[0] - 1
+    ball = n
+    moved = np.zeros(n + 1, dtype=np.bool_)
+    for _ in range(20):
+        _enforce_all(xs, ys, vxs, vys, radii, params)
+        moved[:] = False
+        for i in range(n):
+            if _touching(xs, ys, i, ball, radii[i], radii[ball]):
+                _resolve_pair(xs, ys, vxs, vys, i, ball, radii[i], radii[ball],
+                              masses[i], masses[ball], 0.9)
+                moved[i] = True
+                moved[ball] = True
+        for i in range(n):
+            for j in range(i + 1, n):
+                if _touching(xs, ys, i, j, radii[i], radii[j]):
+                    _resolve_pair(xs, ys, vxs, vys, i, j, radii[i], radii[j],
+                                  masses[i], masses[j], 0.5)
+                    moved[i] = True
+                    moved[j] = True
+        # Only entities a collision displaced can have left the field again
+        for i in range(n + 1):
+            if moved[i]:
+                _enforce_boundary(xs, ys, vxs, vys, i, radii[i], i == ball, params)
+        if _is_valid_state(xs, ys, radii, params):
+            return
+
+    # Did not converge: separate overlaps without regard for momentum
+    _enforce_all(xs, ys, vxs, vys, radii, params)
+    for _ in range(10):
+        all_clear = True
+        for i in range(n):
+            if _has_overlap(xs, ys, i, ball, radii[i], radii[ball]):
+                all_clear = False
+                _separate(xs, ys, i, ball, radii[i], radii[ball])
+        for i in range(n):
+            for j in range(i + 1, n):
+                if _has_overlap(xs, ys, i, j, radii[i], radii[j]):
+                    all_clear = False
+                    _separate(xs, ys, i, j, radii[i], radii[j])
+        _enforce_all(xs, ys, vxs, vys, radii, params)
+        if all_clear:
+            break
+
+
+if NUMBA_AVAILABLE:
+    _jit = njit(cache=True, boundscheck=False)
+    # Helpers are rebound first so the kernels compile against the JIT versions
+    _enforce_boundary = _jit(_enforce_boundary)
+    _resolve_pair = _jit(_resolve_pair)
+    _is_valid_position = _jit(_is_valid_position)
+    _touching = _jit(_touching)
+    _has_overlap = _jit(_has_overlap)
+    _is_valid_state = _jit(_is_valid_state)
+    _enforce_all = _jit(_enforce_all)
+    _separate = _jit(_separate)
+    step_actions = _jit(_step_actions)
+    resolve_collisions = _jit(_resolve_collisions)
+else:
+    step_actions = _step_actions
+    resolve_collisions = _resolve_collisions
+
+
+_warmed_up = False
+
+
+def warmup() -> None:
+    """Compile the JIT kernels ahead of the first game tick (no-op without Numba)."""
+    global _warmed_up
+    if _warmed_up or not NUMBA_AVAILABLE:
+        return
+    step_actions(
+        np.zeros(2), np.zeros(2), np.zeros(2), np.zeros(2), np.zeros(1, dtype=np.int64),
+        np.zeros(1), np.zeros(1), np.zeros(1, dtype=bool), np.zeros(NUM_STEP_PARAMS),
+    )
+    resolve_collisions(
+        np.zeros(2), np.zeros(2), np.zeros(2), np.zeros(2), np.ones(2), np.ones(2),
+        collision_params(GameConfig()),
+    )
+    _warmed_up = True
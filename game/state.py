@@ -1,5 +1,6 @@
 from dataclasses import dataclass
-from typing import List, Tuple
+from functools import cached_property
+from typing import Dict, List, Tuple
 from enum import Enum
 
 from .entities import Player, Ball, Goal
@@ -10,7 +11,7 @@ class GameStatus(Enum):
     ENDED = "ended"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PlayerState:
     x: float
     y: float
@@ -39,6 +40,40 @@ class PlayerState:
     def from_dict(cls, data: dict) -> 'PlayerState':
         return cls(**data)
 
+    @classmethod
+    def from_columns(cls, xs, ys, vxs, vys, team_ids, player_ids,
+                     cooldowns) -> Tuple['PlayerState', ...]:
+        """
+        Build one PlayerState per row of the given per-field lists.
+
+        Fills each instance's slots directly through the slot descriptors
+        instead of going through the frozen __init__ (one object.__setattr__
+        per field), which makes per-tick snapshots about 2x cheaper. The
+        results are ordinary frozen PlayerStates.
+        """
+        new = object.__new__
+        set_x = cls.x.__set__
+        set_y = cls.y.__set__
+        set_vx = cls.vx.__set__
+        set_vy = cls.vy.__set__
+        set_team_id = cls.team_id.__set__
+        set_player_id = cls.player_id.__set__
+        set_cooldown = cls.kick_cooldown.__set__
+        states = []
+        for x, y, vx, vy, team_id, player_id, cooldown in zip(
+            xs, ys, vxs, vys, team_ids, player_ids, cooldowns,
+        ):
+            state = new(cls)
+            set_x(state, x)
+            set_y(state, y)
+            set_vx(state, vx)
+            set_vy(state, vy)
+            set_team_id(state, team_id)
+            set_player_id(state, player_id)
+            set_cooldown(state, cooldown)
+            states.append(state)
+        return tuple(states)
+
     @classmethod
     def from_player(cls, player: Player) -> 'PlayerState':
         return cls(
@@ -52,7 +87,7 @@ class PlayerState:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BallState:
     x: float
     y: float
@@ -81,6 +116,7 @@ class BallState:
         )
 
 
+# Not slotted: the cached_property lookups below need an instance __dict__
 @dataclass(frozen=True)
 class GameState:
     players: Tuple[PlayerState, ...]
@@ -94,14 +130,36 @@ class GameState:
 
     def get_player(self, team_id: int, player_id: int) -> PlayerState:
         """Get a specific player by team and player ID."""
-        for p in self.players:
-            if p.team_id == team_id and p.player_id == player_id:
-                return p
-        raise ValueError(f"Player not found: team={team_id}, player={player_id}")
+        try:
+            return self._player_index[(team_id, player_id)]
+        except KeyError:
+            raise ValueError(f"Player not found: team={team_id}, player={player_id}") from None
 
     def get_team_players(self, team_id: int) -> List[PlayerState]:
         """Get all players of a team."""
-        return [p for p in self.players if p.team_id == team_id]
+        return list(self._team_players.get(team_id, ()))
+
+    @cached_property
+    def _player_index(self) -> Dict[Tuple[int, int], PlayerState]:
+        """Players keyed by (team_id, player_id), built on first lookup."""
+        return _index_players(self.players)
+
+    @cached_property
+    def _team_players(self) -> Dict[int, Tuple[PlayerState, ...]]:
+        """Players grouped by team_id, built on first lookup."""
+        return _group_teams(self.players)
+
+    @cached_property
+    def ball_dist_sq(self) -> List[float]:
+        """Squared distance from each player (in ``players`` order) to the ball."""
+        bx = self.ball.x
+        by = self.ball.y
+        dists = []
+        for p in self.players:
+            dx = bx - p.x
+            dy = by - p.y
+            dists.append(dx * dx + dy * dy)
+        return dists
 
     def to_dict(self) -> dict:
         return {
@@ -127,3 +185,122 @@ class GameState:
             field_height=data['field_height'],
             goal_height=data['goal_height'],
         )
+
+    def to_wire(self) -> dict:
+        """
+        Compact form of to_dict() for network messages: positional lists
+        instead of one dict per player, and short keys.
+
+        ``p`` holds one ``[x, y, vx, vy, kick_cooldown, team_id, player_id]``
+        row per player, ``b`` the ball's ``[x, y, vx, vy]``, ``s`` the score,
+        ``t`` the tick, ``st`` the status value and ``f`` the field's
+        ``[width, height, goal_height]``.
+        """
+        ball = self.ball
+        return {
+            'p': [[p.x, p.y, p.vx, p.vy, p.kick_cooldown, p.team_id, p.player_id]
+                  for p in self.players],
+            'b': [ball.x, ball.y, ball.vx, ball.vy],
+            's': list(self.score),
+            't': self.tick,
+            'st': self.status.value,
+            'f': [self.field_width, self.field_height, self.goal_height],
+        }
+
+    @classmethod
+    def from_wire(cls, data: dict) -> 'GameState':
+        """Inverse of to_wire()."""
+        rows = data['p']
+        if rows:
+            xs, ys, vxs, vys, cooldowns, team_ids, player_ids = zip(*rows)
+            players = PlayerState.from_columns(xs, ys, vxs, vys, team_ids, player_ids, cooldowns)
+        else:
+            players = ()
+        field_width, field_height, goal_height = data['f']
+        return cls(
+            players=players,
+            ball=BallState(*data['b']),
+            score=tuple(data['s']),
+            tick=data['t'],
+            status=GameStatus(data['st']),
+            field_width=field_width,
+            field_height=field_height,
+            goal_height=goal_height,
+        )
+
+
+class PlayerView:
+    """Mutable PlayerState stand-in that the game refreshes in place each tick."""
+
+    __slots__ = ('x', 'y', 'vx', 'vy', 'team_id', 'player_id', 'kick_cooldown')
+
+    def __init__(self, team_id: int, player_id: int):
+        self.x = self.y = self.vx = self.vy = 0.0
+        self.team_id = team_id
+        self.player_id = player_id
+        self.kick_cooldown = 0
+
+    can_kick = PlayerState.can_kick
+    to_dict = PlayerState.to_dict
+
+
+class BallView:
+    """Mutable BallState stand-in that the game refreshes in place each tick."""
+
+    __slots__ = ('x', 'y', 'vx', 'vy')
+
+    def __init__(self):
+        self.x = self.y = self.vx = self.vy = 0.0
+
+    to_dict = BallState.to_dict
+
+
+def _index_players(players) -> dict:
+    """Map (team_id, player_id) to player, first occurrence winning like a scan."""
+    index = {}
+    for p in players:
+        index.setdefault((p.team_id, p.player_id), p)
+    return index
+
+
+def _group_teams(players) -> dict:
+    """Map team_id to the tuple of its players, in ``players`` order."""
+    teams: dict = {}
+    for p in players:
+        teams.setdefault(p.team_id, []).append(p)
+    return {team_id: tuple(members) for team_id, members in teams.items()}
+
+
+class GameStateView:
+    """
+    Reusable, mutable counterpart of GameState.
+
+    Game.get_state() updates one instance in place every tick instead of
+    allocating new snapshots. It is only valid until the next step; use
+    Game.get_state_snapshot() for a state that must be kept or shared
+    across threads.
+    """
+
+    __slots__ = ('players', 'ball', 'ball_dist_sq', 'score', 'tick', 'status',
+                 'field_width', 'field_height', 'goal_height',
+                 '_player_index', '_team_players')
+
+    def __init__(self, players: Tuple[PlayerView, ...], field_width: float,
+                 field_height: float, goal_height: float):
+        self.players = players
+        # The player objects are fixed for the view's lifetime
+        self._player_index = _index_players(players)
+        self._team_players = _group_teams(players)
+        self.ball = BallView()
+        self.ball_dist_sq = [0.0] * len(players)
+        self.score = (0, 0)
+        self.tick = 0
+        self.status = GameStatus.RUNNING
+        self.field_width = field_width
+        self.field_height = field_height
+        self.goal_height = goal_height
+
+    get_player = GameState.get_player
+    get_team_players = GameState.get_team_players
+    to_dict = GameState.to_dict
+    to_wire = GameState.to_wire
@@ -1,15 +1,83 @@
 import json
 from pathlib import Path
-from typing import List, Optional, TYPE_CHECKING
+from typing import IO, Iterator, List, Optional, Sequence, Tuple, TYPE_CHECKING
 from datetime import datetime
 
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
 if TYPE_CHECKING:
-    from game.state import GameState
+    from game.entities import EntityArrays
+    from game.state import GameState, GameStatus
     from game.config import GameConfig
 
 
+def _dumps(obj) -> bytes:
+    """Serialize to UTF-8 JSON, with orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def _loads(data):
+    """Parse JSON text or bytes, with orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _state_dict(row, team_ids: List[int], player_ids: List[int], config: dict) -> dict:
+    """
+    One logged tick in GameState.to_dict() form.
+
+    ``row`` is ``((xs, ys, vxs, vys), cooldowns, (tick, score0, score1), status)``
+    with the ball in the last column of the position/velocity lists.
+    """
+    (xs, ys, vxs, vys), cooldowns, (tick, score0, score1), status = row
+    return {
+        'players': [
+            {'x': x, 'y': y, 'vx': vx, 'vy': vy, 'team_id': team_id,
+             'player_id': player_id, 'kick_cooldown': cooldown}
+            for x, y, vx, vy, team_id, player_id, cooldown
+            in zip(xs, ys, vxs, vys, team_ids, player_ids, cooldowns)
+        ],
+        'ball': {'x': xs[-1], 'y': ys[-1], 'vx': vxs[-1], 'vy': vys[-1]},
+        'score': [score0, score1],
+        'tick': tick,
+        'status': status,
+        'field_width': config['field_width'],
+        'field_height': config['field_height'],
+        'goal_height': config['goal_height'],
+    }
+
+
 class GameLogger:
-    """Logger for recording game states for replay."""
+    """
+    Logger for recording game states for replay.
+
+    The format follows the output path's extension:
+      - ``.jsonl``: a header line with version and config, then one state per
+        line, written as each tick is logged (nothing is kept in memory).
+      - ``.npz``: the frame buffers themselves, compressed, written by
+        finalize(); no per-state dicts are built at all.
+      - ``.msgpack``: the JSON document's layout as one MessagePack blob
+        written by finalize() (requires msgpack).
+      - anything else (``.json``): one JSON document written by finalize().
+
+    Buffered formats copy logged ticks into preallocated NumPy frame
+    buffers (one row per logged tick).
+    """
 
     def __init__(
         self,
@@ -22,27 +90,149 @@ class GameLogger:
 
         Args:
             config: Game configuration
-            output_path: Path to save log file. If None, generates timestamped name.
+            output_path: Path to save log file (``.jsonl`` streams, ``.npz``,
+                ``.msgpack`` and ``.json`` are written at finalize). If None,
+                generates a timestamped ``.jsonl`` name.
             log_interval: Log every N ticks (1 = every tick)
         """
         self.config = config
+        self._config_dict = config.to_dict()
         self.log_interval = log_interval
-        self.states: List[dict] = []
         self.finalized = False
 
+        # Frame buffers, allocated on the first logged tick:
+        #   _frames    (capacity, 4, N+1) x/y/vx/vy rows, ball in the last column
+        #   _cooldowns (capacity, N) player kick cooldowns
+        #   _meta      (capacity, 3) tick, score[0], score[1]
+        self._frames: Optional[np.ndarray] = None
+        self._cooldowns: Optional[np.ndarray] = None
+        self._meta: Optional[np.ndarray] = None
+        self._statuses: List[str] = []
+        self._team_ids: List[int] = []
+        self._player_ids: List[int] = []
+        self._allocated = False  # Ids recorded (and buffers allocated, unless streaming)
+        self._count = 0
+
         if output_path is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_path = f"game_log_{timestamp}.json"
+            output_path = f"game_log_{timestamp}.jsonl"
 
         self.output_path = Path(output_path)
+        if self.output_path.suffix == '.msgpack' and not MSGPACK_AVAILABLE:
+            raise ImportError("msgpack is required for .msgpack logs. Install with: pip install msgpack")
+
+        # Line-delimited logs stream to an open file from the start
+        self._stream: Optional[IO[bytes]] = None
+        if self.output_path.suffix == '.jsonl':
+            self._stream = open(self.output_path, 'wb')
+            self._stream.write(_dumps({
+                'version': '1.0',
+                'config': self._config_dict,
+            }) + b'\n')
+
+    def log_arrays(
+        self,
+        tick: int,
+        arrays: 'EntityArrays',
+        score: Sequence[int],
+        status: 'GameStatus',
+    ) -> None:
+        """Log a tick straight from the engine's entity arrays (copied, not kept)."""
+        if self.finalized or tick % self.log_interval != 0:
+            return
+
+        n = arrays.n_players
+        if not self._allocated:
+            self._allocate(arrays.team_ids[:n].tolist(), arrays.player_ids[:n].tolist())
+        if self._stream is not None:
+            self._write_line(
+                (arrays.xs.tolist(), arrays.ys.tolist(), arrays.vxs.tolist(), arrays.vys.tolist()),
+                arrays.kick_cd[:n].tolist(), (tick, score[0], score[1]), status.value,
+            )
+            return
+        row = self._next_row()
+        frame = self._frames[row]
+        np.copyto(frame[0], arrays.xs)
+        np.copyto(frame[1], arrays.ys)
+        np.copyto(frame[2], arrays.vxs)
+        np.copyto(frame[3], arrays.vys)
+        np.copyto(self._cooldowns[row], arrays.kick_cd[:n])
+        self._meta[row] = (tick, score[0], score[1])
+        self._statuses.append(status.value)
 
     def log_state(self, state: 'GameState') -> None:
-        """Log a game state."""
-        if self.finalized:
+        """Log a game state snapshot (for callers without entity arrays)."""
+        if self.finalized or state.tick % self.log_interval != 0:
             return
 
-        if state.tick % self.log_interval == 0:
-            self.states.append(state.to_dict())
+        players = state.players
+        if not self._allocated:
+            self._allocate([p.team_id for p in players], [p.player_id for p in players])
+        if self._stream is not None:
+            self._stream.write(_dumps(state.to_dict()) + b'\n')
+            return
+        row = self._next_row()
+        ball = state.ball
+        self._frames[row] = [
+            [p.x for p in players] + [ball.x],
+            [p.y for p in players] + [ball.y],
+            [p.vx for p in players] + [ball.vx],
+            [p.vy for p in players] + [ball.vy],
+        ]
+        self._cooldowns[row] = [p.kick_cooldown for p in players]
+        self._meta[row] = (state.tick, state.score[0], state.score[1])
+        self._statuses.append(state.status.value)
+
+    def _allocate(self, team_ids: List[int], player_ids: List[int]) -> None:
+        """Allocate frame buffers sized for a full game at this log interval."""
+        n = len(team_ids)
+        capacity = self.config.max_ticks // self.log_interval + 2
+        self._team_ids = team_ids
+        self._player_ids = player_ids
+        self._allocated = True
+        if self._stream is not None:
+            return  # Streamed logs only need the ids
+        self._frames = np.empty((capacity, 4, n + 1), dtype=np.float64)
+        self._cooldowns = np.empty((capacity, n), dtype=np.int64)
+        self._meta = np.empty((capacity, 3), dtype=np.int64)
+
+    def _next_row(self) -> int:
+        """Claim the next buffer row, doubling the buffers if they are full."""
+        row = self._count
+        if row == len(self._frames):
+            self._frames = np.concatenate([self._frames, np.empty_like(self._frames)])
+            self._cooldowns = np.concatenate([self._cooldowns, np.empty_like(self._cooldowns)])
+            self._meta = np.concatenate([self._meta, np.empty_like(self._meta)])
+        self._count = row + 1
+        return row
+
+    def get_states(self) -> List[dict]:
+        """Logged states in GameState.to_dict() form."""
+        if self._stream is not None:
+            # Nothing is buffered; read back what has been written so far
+            if not self._stream.closed:
+                self._stream.flush()
+            return load_game_log(str(self.output_path))['states']
+        if self._frames is None:
+            return []
+
+        count = self._count
+        team_ids = self._team_ids
+        player_ids = self._player_ids
+        config = self._config_dict
+        return [
+            _state_dict(row, team_ids, player_ids, config)
+            for row in zip(
+                self._frames[:count].tolist(), self._cooldowns[:count].tolist(),
+                self._meta[:count].tolist(), self._statuses,
+            )
+        ]
+
+    def _write_line(self, frame, cooldowns, meta, status) -> None:
+        """Append one state to the open line-delimited log."""
+        row = (frame, cooldowns, meta, status)
+        state = _state_dict(row, self._team_ids, self._player_ids, self._config_dict)
+        self._stream.write(_dumps(state) + b'\n')
 
     def finalize(self) -> None:
         """Finalize and save the log."""
@@ -51,22 +241,175 @@ class GameLogger:
 
         self.finalized = True
 
+        if self._stream is not None:
+            self._stream.close()
+            return
+
+        if self.output_path.suffix == '.npz':
+            self._save_npz()
+            return
+
+        states = self.get_states()
         log_data = {
             'version': '1.0',
-            'config': self.config.to_dict(),
-            'states': self.states,
-            'total_ticks': len(self.states),
+            'config': self._config_dict,
+            'states': states,
+            'total_ticks': len(states),
         }
 
-        with open(self.output_path, 'w') as f:
-            json.dump(log_data, f)
+        with open(self.output_path, 'wb') as f:
+            if self.output_path.suffix == '.msgpack':
+                f.write(msgpack.packb(log_data))
+            else:
+                f.write(_dumps(log_data))
+
+    def _save_npz(self) -> None:
+        """Write the frame buffers as a compressed NumPy archive."""
+        count = self._count
+        n = len(self._team_ids)
+        frames = self._frames[:count] if self._frames is not None else np.empty((0, 4, n + 1))
+        meta = self._meta[:count] if self._meta is not None else np.empty((0, 3), dtype=np.int64)
+        cooldowns = (self._cooldowns[:count] if self._cooldowns is not None
+                     else np.empty((0, n), dtype=np.int64))
+        save_game_log_npz(
+            str(self.output_path), self._config_dict,
+            players=frames[:, :, :n].transpose(0, 2, 1),
+            ball=frames[:, :, n],
+            kick_cooldowns=cooldowns,
+            ticks=meta[:, 0],
+            scores=meta[:, 1:],
+            statuses=self._statuses,
+            team_ids=self._team_ids,
+            player_ids=self._player_ids,
+        )
 
     def get_output_path(self) -> str:
         """Get the path where log will be/was saved."""
         return str(self.output_path)
 
 
+def save_game_log_npz(
+    path: str,
+    config: dict,
+    players: np.ndarray,
+    ball: np.ndarray,
+    kick_cooldowns: np.ndarray,
+    ticks: np.ndarray,
+    scores: np.ndarray,
+    statuses: Sequence[str],
+    team_ids: Sequence[int],
+    player_ids: Sequence[int],
+) -> None:
+    """
+    Write a game log as a compressed ``.npz`` frame archive.
+
+    Args:
+        path: Output file (written as given, even without a .npz suffix)
+        config: GameConfig.to_dict()
+        players: (ticks, N, 4) player x/y/vx/vy per logged tick
+        ball: (ticks, 4) ball x/y/vx/vy per logged tick
+        kick_cooldowns: (ticks, N) player kick cooldowns
+        ticks: (ticks,) game tick of each row
+        scores: (ticks, 2) score after each row
+        statuses: GameStatus value of each row
+        team_ids, player_ids: (N,) ids of the players, in column order
+    """
+    # np.savez appends .npz to names without it; open the file ourselves
+    with open(path, 'wb') as f:
+        np.savez_compressed(
+            f,
+            version=np.array('1.0'),
+            config=np.array(json.dumps(config)),
+            players=players,
+            ball=ball,
+            kick_cooldowns=kick_cooldowns,
+            ticks=ticks,
+            scores=scores,
+            statuses=np.array(statuses, dtype=str),
+            team_ids=np.array(team_ids, dtype=np.int64),
+            player_ids=np.array(player_ids, dtype=np.int64),
+        )
+
+
+def load_game_log_npz(path: str) -> dict:
+    """
+    Read a ``.npz`` frame archive as arrays, without building state dicts.
+
+    Returns the save_game_log_npz() fields (``config`` parsed back to a dict,
+    ``version`` a str, the rest NumPy arrays).
+    """
+    with np.load(path) as archive:
+        log = {name: archive[name] for name in archive.files}
+    log['version'] = log['version'].item()
+    log['config'] = json.loads(log['config'].item())
+    return log
+
+
+def _load_npz(path: str) -> dict:
+    """Rebuild the JSON log layout from a ``.npz`` frame archive."""
+    archive = load_game_log_npz(path)
+    config = archive['config']
+    frames = np.concatenate(
+        [archive['players'].transpose(0, 2, 1), archive['ball'][:, :, None]], axis=2
+    )
+    meta = np.column_stack([archive['ticks'], archive['scores']])
+    team_ids = archive['team_ids'].tolist()
+    player_ids = archive['player_ids'].tolist()
+    states = [
+        _state_dict(row, team_ids, player_ids, config)
+        for row in zip(
+            frames.tolist(), archive['kick_cooldowns'].tolist(),
+            meta.tolist(), archive['statuses'].tolist(),
+        )
+    ]
+    return {
+        'version': archive['version'],
+        'config': config,
+        'states': states,
+        'total_ticks': len(states),
+    }
+
+
 def load_game_log(path: str) -> dict:
-    """Load a game log from file."""
-    with open(path, 'r') as f:
-        return json.load(f)
+    """Load a game log from file (``.jsonl`` line-delimited, ``.npz``, ``.msgpack`` or ``.json``)."""
+    suffix = Path(path).suffix
+    if suffix == '.npz':
+        return _load_npz(path)
+    with open(path, 'rb') as f:
+        if suffix == '.msgpack':
+            if not MSGPACK_AVAILABLE:
+                raise ImportError("msgpack is required for .msgpack logs. Install with: pip install msgpack")
+            return msgpack.unpackb(f.read())
+        if suffix != '.jsonl':
+            return _loads(f.read())
+
+        log_data = _loads(f.readline())
+        states = [_loads(line) for line in f if line.strip()]
+    log_data['states'] = states
+    log_data['total_ticks'] = len(states)
+    return log_data
+
+
+def iter_game_log(path: str) -> Tuple[dict, Iterator[dict]]:
+    """
+    Load a game log's header and iterate over its states.
+
+    Returns the log without its ``states`` (version, config, ...) and an
+    iterator over the states. ``.jsonl`` lines are parsed only as the
+    iterator advances, so a consumer that keeps its own representation never
+    holds every state dict at once; other formats are loaded whole.
+    """
+    if Path(path).suffix != '.jsonl':
+        log_data = load_game_log(path)
+        return log_data, iter(log_data.pop('states'))
+
+    f = open(path, 'rb')
+    header = _loads(f.readline())
+
+    def states() -> Iterator[dict]:
+        with f:
+            for line in f:
+                if line.strip():
+                    yield _loads(line)
+
+    return header, states()
@@ -5,7 +5,7 @@ AI Football Competition Environment
 Usage:
     python main.py                   # Run game with visualization
     python main.py --no-viz          # Run game without visualization
-    python main.py --replay LOG.json # Replay a game log
+    python main.py --replay LOG.jsonl # Replay a game log
     python main.py --help            # Show help
 """
 
@@ -41,6 +41,20 @@ AGENT_CLASSES = {
 # Strategy presets (for backward compatibility)
 STRATEGY_PRESETS = ["mixed", "tactical", "aggressive", "balanced", "wings", "diverse", "randomized"]
 
+# Fixed preset formations: player i gets formation[i], the last entry repeating
+FORMATIONS = {
+    "mixed": [GoalieAgent, ChaserAgent],                          # Goalie, rest chasers
+    "tactical": [GoalieAgent, DefenderAgent, StrikerAgent],       # Goalie + Defender + Strikers
+    "aggressive": [AggressorAgent],                               # All aggressors
+    "balanced": [GoalieAgent, MidfielderAgent, StrikerAgent],     # Goalie + Midfielder + Strikers
+    "wings": [GoalieAgent, WingerAgent],                          # Goalie + Wingers
+}
+
+# "diverse" cycles through these roles; "randomized" draws from the pool
+DIVERSE_ROTATION = [GoalieAgent, DefenderAgent, StrikerAgent, MidfielderAgent,
+                    InterceptorAgent, AggressorAgent, WingerAgent]
+RANDOMIZED_POOL = DIVERSE_ROTATION + [ChaserAgent]
+
 DEFAULT_AGENT_TYPE = "chaser"
 
 
@@ -98,92 +112,26 @@ def create_agents(config: GameConfig, agent_type: str = "mixed") -> tuple:
 
         return team0_agents, team1_agents
 
-    if agent_type == "random":
-        for i in range(n):
-            team0_agents.append(RandomAgent(team_id=0, player_id=i))
-            team1_agents.append(RandomAgent(team_id=1, player_id=i))
-
-    elif agent_type == "chaser":
-        for i in range(n):
-            team0_agents.append(ChaserAgent(team_id=0, player_id=i))
-            team1_agents.append(ChaserAgent(team_id=1, player_id=i))
-
-    elif agent_type == "mixed":
-        # First player is goalie, rest are chasers
-        for i in range(n):
-            if i == 0:
-                team0_agents.append(GoalieAgent(team_id=0, player_id=i))
-                team1_agents.append(GoalieAgent(team_id=1, player_id=i))
-            else:
-                team0_agents.append(ChaserAgent(team_id=0, player_id=i))
-                team1_agents.append(ChaserAgent(team_id=1, player_id=i))
-
-    elif agent_type == "tactical":
-        # Goalie + Defender + Striker formation
+    if agent_type in FORMATIONS:
+        # Fixed formation; the last listed role fills any remaining slots
+        formation = FORMATIONS[agent_type]
         for i in range(n):
-            if i == 0:
-                team0_agents.append(GoalieAgent(team_id=0, player_id=i))
-                team1_agents.append(GoalieAgent(team_id=1, player_id=i))
-            elif i == 1:
-                team0_agents.append(DefenderAgent(team_id=0, player_id=i))
-                team1_agents.append(DefenderAgent(team_id=1, player_id=i))
-            else:
-                team0_agents.append(StrikerAgent(team_id=0, player_id=i))
-                team1_agents.append(StrikerAgent(team_id=1, player_id=i))
-
-    elif agent_type == "aggressive":
-        # All aggressors
-        for i in range(n):
-            team0_agents.append(AggressorAgent(team_id=0, player_id=i))
-            team1_agents.append(AggressorAgent(team_id=1, player_id=i))
-
-    elif agent_type == "interceptor":
-        # Goalie + Interceptors
-        for i in range(n):
-            if i == 0:
-                team0_agents.append(GoalieAgent(team_id=0, player_id=i))
-                team1_agents.append(GoalieAgent(team_id=1, player_id=i))
-            else:
-                team0_agents.append(InterceptorAgent(team_id=0, player_id=i))
-                team1_agents.append(InterceptorAgent(team_id=1, player_id=i))
-
-    elif agent_type == "balanced":
-        # Goalie + Midfielder + Striker
-        for i in range(n):
-            if i == 0:
-                team0_agents.append(GoalieAgent(team_id=0, player_id=i))
-                team1_agents.append(GoalieAgent(team_id=1, player_id=i))
-            elif i == 1:
-                team0_agents.append(MidfielderAgent(team_id=0, player_id=i))
-                team1_agents.append(MidfielderAgent(team_id=1, player_id=i))
-            else:
-                team0_agents.append(StrikerAgent(team_id=0, player_id=i))
-                team1_agents.append(StrikerAgent(team_id=1, player_id=i))
-
-    elif agent_type == "wings":
-        # Goalie + Wingers
-        for i in range(n):
-            if i == 0:
-                team0_agents.append(GoalieAgent(team_id=0, player_id=i))
-                team1_agents.append(GoalieAgent(team_id=1, player_id=i))
-            else:
-                team0_agents.append(WingerAgent(team_id=0, player_id=i))
-                team1_agents.append(WingerAgent(team_id=1, player_id=i))
+            cls = formation[min(i, len(formation) - 1)]
+            team0_agents.append(cls(team_id=0, player_id=i))
+            team1_agents.append(cls(team_id=1, player_id=i))
 
     elif agent_type == "diverse":
-        # Each team gets different agent types
-        agent_classes = [GoalieAgent, DefenderAgent, StrikerAgent, MidfielderAgent, InterceptorAgent, AggressorAgent, WingerAgent]
+        # Cycle through the roles so each player differs from its neighbours
         for i in range(n):
-            cls = agent_classes[i % len(agent_classes)]
+            cls = DIVERSE_ROTATION[i % len(DIVERSE_ROTATION)]
             team0_agents.append(cls(team_id=0, player_id=i))
             team1_agents.append(cls(team_id=1, player_id=i))
 
     elif agent_type == "randomized":
         # Randomly assign agent types to each player
-        agent_classes = [GoalieAgent, DefenderAgent, StrikerAgent, MidfielderAgent, InterceptorAgent, AggressorAgent, WingerAgent, ChaserAgent]
         for i in range(n):
-            cls0 = random.choice(agent_classes)
-            cls1 = random.choice(agent_classes)
+            cls0 = random.choice(RANDOMIZED_POOL)
+            cls1 = random.choice(RANDOMIZED_POOL)
             team0_agents.append(cls0(team_id=0, player_id=i))
             team1_agents.append(cls1(team_id=1, player_id=i))
 
@@ -232,10 +180,9 @@ def run_game(
             print("Warning: pygame not available, running without visualization")
             visualize = False
 
-    # Link keyboard agents to renderer's key state
+    # Feed renderer key events to the keyboard controller
     if keyboard_controller and renderer:
-        for agent in keyboard_controller.agents:
-            agent.set_key_state(renderer.pressed_keys)
+        renderer.key_listener = keyboard_controller
         # Set initial active player highlight
         renderer.set_active_player(0, keyboard_controller.get_active_player_id())
 
@@ -264,13 +211,14 @@ def run_game(
                 renderer.tick(60)
 
         renderer.close()
+        game.close()
     else:
         # Run without visualization
         game.run()
 
     # Finalize logger
     if logger and not logger.finalized:
-        logger.log_state(game.get_state())
+        logger.log_state(game.get_state_snapshot())
         logger.finalize()
 
     return tuple(game.score), logger.get_output_path() if logger else None
@@ -292,7 +240,7 @@ Examples:
   python main.py                                          # Run with default settings
   python main.py --players 3                              # 3v3 game
   python main.py --no-viz --ticks 5000                    # Long game, no visualization
-  python main.py --replay game.json                       # Replay a saved game
+  python main.py --replay game.jsonl                      # Replay a saved game
   python main.py --agents tactical                        # Use tactical preset
   python main.py --agents goalie,striker                  # Specify each player's agent
   python main.py --agents goalie,striker,goalie,defender  # Full team specification (2v2)
@@ -1,14 +1,18 @@
 """Server-side network agent wrapper."""
 
-import threading
 from typing import Optional, TYPE_CHECKING
 
 from agents.base import BaseAgent, Action
+from network.protocol import JSON
 
 if TYPE_CHECKING:
     from game.state import GameState
+    from network.shared_memory import SharedStateChannel
     import websockets
 
+# Returned until the client's first action arrives (the engine never mutates actions)
+_DEFAULT_ACTION = Action(0.0, 0.0, False)
+
 
 class NetworkAgent(BaseAgent):
     """
@@ -18,6 +22,9 @@ class NetworkAgent(BaseAgent):
     and receiving actions back via WebSocket.
     """
 
+    # get_action only reads the last received action, it never blocks on I/O
+    trusted = True
+
     def __init__(
         self,
         team_id: int,
@@ -26,18 +33,28 @@ class NetworkAgent(BaseAgent):
     ):
         super().__init__(team_id, player_id)
         self.websocket = websocket
+        self.wire_format = JSON  # Switched by the client's FORMAT message
+        self.wants_deltas = False  # Client accepts STATE_DELTA messages
+        # Client accepts states in GameState.to_wire() form; clients that
+        # never say so get to_dict() states and no deltas
+        self.wants_compact = False
+        self.has_baseline = False  # Client holds the server's last broadcast state
+        self.wants_shm = False  # Client asked for the shared memory transport
+        # Set by the server once the client is attached to a shared memory
+        # block; states and actions then bypass the websocket
+        self.channel: Optional['SharedStateChannel'] = None
+        self.channel_index = -1
+        # Written by the server's receive loop and read by the engine. A
+        # single attribute store/load is atomic, so no lock is needed
         self._pending_action: Optional[Action] = None
-        self._lock = threading.Lock()
 
     def set_pending_action(self, action: Action) -> None:
         """Set the pending action received from the client."""
-        with self._lock:
-            self._pending_action = action
+        self._pending_action = action
 
     def clear_pending_action(self) -> None:
         """Clear the pending action."""
-        with self._lock:
-            self._pending_action = None
+        self._pending_action = None
 
     def get_action(self, state: 'GameState') -> Action:
         """
@@ -48,13 +65,15 @@ class NetworkAgent(BaseAgent):
         or a default action if none is available.
 
         The server should have already sent the state and received the
-        action before this is called.
+        action before this is called. Shared memory clients are read
+        directly from their action slot.
         """
-        with self._lock:
-            if self._pending_action is not None:
-                return self._pending_action
+        if self.channel is not None:
+            values = self.channel.read_action(self.channel_index)
+            return Action(*values) if values is not None else _DEFAULT_ACTION
+        action = self._pending_action
         # Default action if no response received
-        return Action(0.0, 0.0, False)
+        return action if action is not None else _DEFAULT_ACTION
 
     def is_connected(self) -> bool:
         """Check if the websocket is still connected."""
@@ -63,5 +82,6 @@ class NetworkAgent(BaseAgent):
 
     def reset(self) -> None:
         """Called when game resets (after goal scored)."""
-        with self._lock:
-            self._pending_action = None
+        self._pending_action = None
+        # Resend a full state after kickoff
+        self.has_baseline = False
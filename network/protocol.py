@@ -1,9 +1,23 @@
 """Network protocol for football game multiplayer."""
 
 import json
+import math
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
 from agents.base import Action
 from game.config import GameConfig
 from game.state import GameState
@@ -13,42 +27,96 @@ class MessageType(Enum):
     """Types of messages exchanged between server and client."""
     CONFIG = "config"        # Server -> Client: game configuration
     STATE = "state"          # Server -> Client: current game state
+    STATE_DELTA = "state_delta"  # Server -> Client: changes since the last state
     ACTION = "action"        # Client -> Server: agent action
     ASSIGN = "assign"        # Server -> Client: player assignment (team_id, player_id)
     GAME_OVER = "game_over"  # Server -> Client: game ended with final score
     ERROR = "error"          # Either direction: error message
+    FORMAT = "format"        # Client -> Server: preferred wire format / deltas / transport
+    SHM = "shm"              # Server -> Client: shared memory block name and player slot
 
 
-def encode_message(msg_type: MessageType, data: Any) -> str:
-    """Encode a message as JSON string."""
-    return json.dumps({
-        'type': msg_type.value,
-        'data': data,
-    })
+# Wire formats. JSON is the default every peer understands; a client asks for
+# MessagePack with a FORMAT message, and each side answers in the format of
+# the frames it receives, so peers without msgpack keep talking JSON.
+JSON = "json"
+MSGPACK = "msgpack"
+WIRE_FORMATS = (JSON, MSGPACK) if MSGPACK_AVAILABLE else (JSON,)
+
+# State/action transports. Clients on the server's host may ask for states and
+# actions to go through shared memory (network.shared_memory); control
+# messages (CONFIG, ASSIGN, GAME_OVER, ...) always use the websocket.
+WEBSOCKET = "websocket"
+SHM = "shm"
 
 
-def decode_message(msg: str) -> tuple[MessageType, Any]:
-    """Decode a JSON message. Returns (message_type, data)."""
-    parsed = json.loads(msg)
+if ORJSON_AVAILABLE:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+    _loads = json.loads
+
+
+def encode_message(msg_type: MessageType, data: Any, wire_format: str = JSON) -> bytes:
+    """Encode a message as UTF-8 JSON bytes (orjson when installed) or MessagePack."""
+    message = {
+        'type': msg_type.value,
+        'data': data,
+    }
+    if wire_format == MSGPACK:
+        return msgpack.packb(message, use_bin_type=True)
+    return _dumps(message)
+
+
+def message_format(msg: str | bytes) -> str:
+    """Wire format of an encoded message (JSON objects always start with '{')."""
+    if isinstance(msg, str) or msg[:1] == b'{':
+        return JSON
+    return MSGPACK
+
+
+def decode_message(msg: str | bytes) -> tuple[MessageType, Any]:
+    """Decode a JSON or MessagePack message. Returns (message_type, data)."""
+    if message_format(msg) == MSGPACK:
+        if not MSGPACK_AVAILABLE:
+            raise ValueError("Received a MessagePack message but msgpack is not installed")
+        parsed = msgpack.unpackb(msg, raw=False)
+    else:
+        parsed = _loads(msg)
     return MessageType(parsed['type']), parsed['data']
 
 
-def encode_config(config: GameConfig) -> str:
+def encode_config(config: GameConfig) -> bytes:
     """Encode game config for transmission."""
-    return encode_message(MessageType.CONFIG, config.to_dict())
+    # Keyed by value, so later edits to a (mutable) config are never served stale
+    return _encode_config(config.to_tuple())
+
 
+@lru_cache(maxsize=16)
+def _encode_config(values: tuple) -> bytes:
+    return encode_message(MessageType.CONFIG, GameConfig(*values).to_dict())
 
-def encode_state(state: GameState) -> str:
-    """Encode game state for transmission."""
-    return encode_message(MessageType.STATE, state.to_dict())
 
+def encode_state(state: GameState, wire_format: str = JSON, compact: bool = False) -> bytes:
+    """
+    Encode game state for transmission: GameState.to_wire() form for clients
+    that asked for it (see encode_format), else the to_dict() form every
+    client understands.
+    """
+    return encode_message(MessageType.STATE, state.to_wire() if compact else state.to_dict(),
+                          wire_format)
 
-def encode_action(action: Action) -> str:
+
+def encode_action(action: Action, wire_format: str = JSON) -> bytes:
     """Encode agent action for transmission."""
-    return encode_message(MessageType.ACTION, action.to_dict())
+    return encode_message(MessageType.ACTION, action.to_dict(), wire_format)
 
 
-def encode_assign(team_id: int, player_id: int) -> str:
+@lru_cache(maxsize=64)
+def encode_assign(team_id: int, player_id: int) -> bytes:
     """Encode player assignment for transmission."""
     return encode_message(MessageType.ASSIGN, {
         'team_id': team_id,
@@ -56,7 +124,7 @@ def encode_assign(team_id: int, player_id: int) -> str:
     })
 
 
-def encode_game_over(score: tuple[int, int], winner: Optional[int]) -> str:
+def encode_game_over(score: tuple[int, int], winner: Optional[int]) -> bytes:
     """Encode game over message."""
     return encode_message(MessageType.GAME_OVER, {
         'score': list(score),
@@ -64,7 +132,65 @@ def encode_game_over(score: tuple[int, int], winner: Optional[int]) -> str:
     })
 
 
-def encode_error(message: str) -> str:
+def state_delta(prev: Dict[str, Any], cur: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Changes from one GameState.to_wire() to the next, for STATE_DELTA
+    (only sent to clients that asked for compact states).
+
+    Players that changed are sent as ``[index, x, y, vx, vy, kick_cooldown]``
+    rows and the ball as ``[x, y, vx, vy]`` (omitted if unchanged). Values are
+    compared exactly, so applying the delta reproduces ``cur``. Team/player
+    ids and field dimensions never change within a game and are not sent.
+    """
+    rows = []
+    for i, (old, new) in enumerate(zip(prev['p'], cur['p'])):
+        if old != new:
+            rows.append([i, *new[:5]])
+    delta = {
+        't': cur['t'],
+        's': cur['s'],
+        'st': cur['st'],
+        'p': rows,
+    }
+    ball = cur['b']
+    if ball != prev['b']:
+        delta['b'] = ball
+    return delta
+
+
+def apply_state_delta(base: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+    """Patch a cached to_wire() state in place with a STATE_DELTA and return it."""
+    players = base['p']
+    for i, *values in delta['p']:
+        players[i][:5] = values
+    if 'b' in delta:
+        base['b'] = delta['b']
+    base['t'] = delta['t']
+    base['s'] = delta['s']
+    base['st'] = delta['st']
+    return base
+
+
+def encode_format(wire_format: str, deltas: bool = False, transport: str = WEBSOCKET,
+                  compact: bool = False) -> bytes:
+    """
+    Encode a request to receive messages in ``wire_format``, states in the
+    compact to_wire() form and, with ``compact``, STATE_DELTAs.
+    """
+    return encode_message(MessageType.FORMAT, {
+        'format': wire_format,
+        'deltas': deltas,
+        'transport': transport,
+        'compact': compact,
+    })
+
+
+def encode_shm(name: str, index: int) -> bytes:
+    """Encode the shared memory block and player slot a client should attach to."""
+    return encode_message(MessageType.SHM, {'name': name, 'index': index})
+
+
+def encode_error(message: str) -> bytes:
     """Encode error message."""
     return encode_message(MessageType.ERROR, {'message': message})
 
@@ -74,11 +200,40 @@ def decode_action(data: dict) -> Action:
     return Action.from_dict(data)
 
 
+_new_action = object.__new__
+_isfinite = math.isfinite
+
+
+def decode_action_fast(data: dict) -> Action:
+    """
+    Decode action from message data on the server's receive loop.
+
+    Same result as decode_action for messages from encode_action, but reads
+    the three keys directly (missing keys raise KeyError instead of
+    defaulting) and clamps inline instead of going through the dataclass
+    __init__/__post_init__. Client values are still sanitized, since they
+    feed straight into physics.
+    """
+    ax = float(data['ax'])
+    ay = float(data['ay'])
+    if not _isfinite(ax):
+        ax = 0.0
+    if not _isfinite(ay):
+        ay = 0.0
+    action = _new_action(Action)
+    action.ax = -1.0 if ax < -1.0 else (1.0 if ax > 1.0 else ax)
+    action.ay = -1.0 if ay < -1.0 else (1.0 if ay > 1.0 else ay)
+    action.kick = bool(data['kick'])
+    return action
+
+
 def decode_config(data: dict) -> GameConfig:
     """Decode config from message data."""
     return GameConfig.from_dict(data)
 
 
 def decode_state(data: dict) -> GameState:
-    """Decode game state from message data."""
+    """Decode game state from message data (to_wire() or to_dict() form)."""
+    if 'p' in data:
+        return GameState.from_wire(data)
     return GameState.from_dict(data)
@@ -0,0 +1,226 @@
+"""Shared-memory state/action channel for clients on the server's host."""
+
+import sys
+from multiprocessing import shared_memory
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+from agents.base import Action
+from game.state import GameStatus
+
+try:
+    from multiprocessing import resource_tracker
+except ImportError:  # pragma: no cover - platforms without the tracker
+    resource_tracker = None
+
+
+# Frames kept in the ring. Readers only want the newest frame; the extra slots
+# let a slow reader finish copying one while the next ones are written.
+RING_SLOTS = 4
+
+# Retries before a player's action slot is treated as unreadable this tick
+ACTION_READ_ATTEMPTS = 100
+
+_STATUSES = tuple(GameStatus)
+_STATUS_CODES = {status: i for i, status in enumerate(_STATUSES)}
+
+
+def _frame_dtype(n_players: int) -> np.dtype:
+    """One state frame; ``seq`` is odd while the frame is being written."""
+    return np.dtype([
+        ('seq', '<u8'),
+        ('tick', '<i8'),
+        ('score', '<i8', 2),
+        ('status', 'u1'),
+        ('players', '<f8', (n_players, 4)),  # x, y, vx, vy
+        ('cooldowns', '<i8', n_players),
+        ('ball', '<f8', 4),                   # x, y, vx, vy
+    ], align=True)
+
+
+def _action_dtype() -> np.dtype:
+    """One player's latest action; ``seq`` is odd while it is being written."""
+    return np.dtype([
+        ('seq', '<u8'),
+        ('ax', '<f8'),
+        ('ay', '<f8'),
+        ('kick', 'u1'),
+    ], align=True)
+
+
+def _block_dtype(n_players: int) -> np.dtype:
+    """Layout of the whole shared block. ``n_players`` comes first so attaching
+    processes can read it before knowing the rest of the layout."""
+    return np.dtype([
+        ('n_players', '<u8'),
+        ('written', '<u8'),  # Frames published so far; newest is (written - 1) % RING_SLOTS
+        ('field', '<f8', 3),  # field_width, field_height, goal_height
+        ('team_ids', '<i8', n_players),
+        ('player_ids', '<i8', n_players),
+        ('frames', _frame_dtype(n_players), RING_SLOTS),
+        ('actions', _action_dtype(), n_players),
+    ], align=True)
+
+
+class SharedStateChannel:
+    """
+    Game states and player actions exchanged through one shared memory block.
+
+    The server creates the block and publishes a frame per tick; clients on
+    the same host attach by name, read the newest frame and write their
+    player's action into its slot. Frames and actions each have a single
+    writer and are guarded by a sequence number (odd while being written),
+    so readers never see a half-written record.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool):
+        self._shm = shm
+        self._owner = owner
+        n = int(np.ndarray((), dtype='<u8', buffer=shm.buf))
+        block = np.ndarray((), dtype=_block_dtype(n), buffer=shm.buf)
+        self.n_players = n
+        self._written = block['written']
+        self._field = block['field']
+        self._team_ids = block['team_ids']
+        self._player_ids = block['player_ids']
+        frames = block['frames']
+        self._seq = frames['seq']
+        self._tick = frames['tick']
+        self._score = frames['score']
+        self._status = frames['status']
+        self._players = frames['players']
+        self._cooldowns = frames['cooldowns']
+        self._ball = frames['ball']
+        actions = block['actions']
+        self._action_seq = actions['seq']
+        self._ax = actions['ax']
+        self._ay = actions['ay']
+        self._kick = actions['kick']
+
+    @classmethod
+    def create(cls, team_ids: Sequence[int], player_ids: Sequence[int], field_width: float,
+               field_height: float, goal_height: float) -> 'SharedStateChannel':
+        """Allocate a block for players with these ids, in state order."""
+        n = len(team_ids)
+        dtype = _block_dtype(n)
+        shm = shared_memory.SharedMemory(create=True, size=dtype.itemsize)
+        block = np.ndarray((), dtype=dtype, buffer=shm.buf)
+        block[...] = np.zeros((), dtype=dtype)
+        block['n_players'] = n
+        block['field'] = (field_width, field_height, goal_height)
+        block['team_ids'] = team_ids
+        block['player_ids'] = player_ids
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> 'SharedStateChannel':
+        """Open a block created by another process."""
+        # Only the creator may unlink the block. Before Python 3.13 attaching
+        # registers it with this process's resource tracker too, which would
+        # unlink it when this process exits
+        if sys.version_info >= (3, 13):
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        elif resource_tracker is not None:
+            register = resource_tracker.register
+            resource_tracker.register = lambda *args: None
+            try:
+                shm = shared_memory.SharedMemory(name=name)
+            finally:
+                resource_tracker.register = register
+        else:
+            shm = shared_memory.SharedMemory(name=name)
+        return cls(shm, owner=False)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def index_of(self, team_id: int, player_id: int) -> int:
+        """Slot of a player in frames and actions."""
+        for i, (t, p) in enumerate(zip(self._team_ids.tolist(), self._player_ids.tolist())):
+            if t == team_id and p == player_id:
+                return i
+        raise ValueError(f"Player not found: team={team_id}, player={player_id}")
+
+    def publish(self, state) -> None:
+        """Write a GameState (or GameStateView) as the newest frame."""
+        k = int(self._written)
+        slot = k % RING_SLOTS
+        players = state.players
+        ball = state.ball
+        self._seq[slot] = 2 * k + 1
+        self._tick[slot] = state.tick
+        self._score[slot] = state.score
+        self._status[slot] = _STATUS_CODES[state.status]
+        self._players[slot] = [(p.x, p.y, p.vx, p.vy) for p in players]
+        self._cooldowns[slot] = [p.kick_cooldown for p in players]
+        self._ball[slot] = (ball.x, ball.y, ball.vx, ball.vy)
+        self._seq[slot] = 2 * k + 2
+        self._written[...] = k + 1
+
+    def read_state(self) -> Optional[dict]:
+        """Newest frame in GameState.to_wire() form, or None if none is readable yet."""
+        for _ in range(RING_SLOTS):
+            k = int(self._written)
+            if k == 0:
+                return None
+            slot = (k - 1) % RING_SLOTS
+            seq = int(self._seq[slot])
+            if seq != 2 * k:
+                continue  # Being overwritten; look again
+            state = self._frame_wire(slot)
+            if int(self._seq[slot]) == seq:
+                return state
+        return None
+
+    def _frame_wire(self, slot: int) -> dict:
+        """Copy one frame out of shared memory."""
+        return {
+            'p': [[x, y, vx, vy, cooldown, team_id, player_id]
+                  for (x, y, vx, vy), cooldown, team_id, player_id in zip(
+                      self._players[slot].tolist(), self._cooldowns[slot].tolist(),
+                      self._team_ids.tolist(), self._player_ids.tolist(),
+                  )],
+            'b': self._ball[slot].tolist(),
+            's': self._score[slot].tolist(),
+            't': int(self._tick[slot]),
+            'st': _STATUSES[self._status[slot]].value,
+            'f': self._field.tolist(),
+        }
+
+    def send_action(self, index: int, action: Action) -> None:
+        """Write a player's action (client side)."""
+        seq = int(self._action_seq[index])
+        self._action_seq[index] = seq + 1
+        self._ax[index] = action.ax
+        self._ay[index] = action.ay
+        self._kick[index] = action.kick
+        self._action_seq[index] = seq + 2
+
+    def read_action(self, index: int) -> Optional[Tuple[float, float, bool]]:
+        """
+        A player's latest (ax, ay, kick), or None before its first action (or
+        if the client keeps the slot mid-write, e.g. because it died there).
+        """
+        for _ in range(ACTION_READ_ATTEMPTS):
+            seq = int(self._action_seq[index])
+            if seq == 0:
+                return None
+            if seq % 2:
+                continue  # Being written; the writer finishes within a few stores
+            action = (float(self._ax[index]), float(self._ay[index]), bool(self._kick[index]))
+            if int(self._action_seq[index]) == seq:
+                return action
+        return None
+
+    def close(self) -> None:
+        """Detach from the block, and free it if this process created it."""
+        # Drop the NumPy views first; the buffer can't be released while exported
+        for name in ('_written', '_field', '_team_ids', '_player_ids', '_seq', '_tick',
+                     '_score', '_status', '_players', '_cooldowns', '_ball',
+                     '_action_seq', '_ax', '_ay', '_kick'):
+            setattr(self, name, None)
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
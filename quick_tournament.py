@@ -204,6 +204,11 @@ Examples:
         type=str,
         help="Save results to JSON file",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Processes to play matches in (default: one per CPU; 1 = serial)",
+    )
     parser.add_argument(
         "--no-duplicates",
         action="store_true",
@@ -296,6 +301,7 @@ Examples:
         ticks=args.ticks,
         win_score=args.win_score,
         verbose=True,
+        workers=args.workers,
     )
 
     # Display results
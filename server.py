@@ -11,6 +11,7 @@ Usage:
 
 import argparse
 import asyncio
+import ipaddress
 import sys
 from typing import Any, Dict, List, Optional
 
@@ -22,18 +23,31 @@ from game.state import GameStatus
 from agents.random_agent import ChaserAgent
 from network.protocol import (
     MessageType,
+    SHM,
+    WIRE_FORMATS,
     decode_message,
-    decode_action,
+    decode_action_fast,
+    encode_message,
     encode_config,
-    encode_state,
+    state_delta,
     encode_assign,
     encode_game_over,
     encode_error,
+    encode_shm,
 )
 from network.network_agent import NetworkAgent
+from network.shared_memory import SharedStateChannel
 from visualization.renderer import Renderer, PYGAME_AVAILABLE
 
 
+def _is_loopback(websocket) -> bool:
+    """Whether a client connected from this host."""
+    try:
+        return ipaddress.ip_address(websocket.remote_address[0]).is_loopback
+    except (TypeError, ValueError, IndexError):
+        return False
+
+
 class GameServer:
     """Server that hosts a network football game."""
 
@@ -64,6 +78,8 @@ class GameServer:
                 self.player_slots[(team_id, player_id)] = None
 
         self.game: Optional[Game] = None
+        self._last_state: Optional[dict] = None  # Last broadcast, the delta baseline
+        self.channel: Optional[SharedStateChannel] = None  # For local shm clients
         self.game_started = False
         self.start_event = asyncio.Event()
 
@@ -116,8 +132,18 @@ class GameServer:
                     msg_type, data = decode_message(message)
 
                     if msg_type == MessageType.ACTION:
-                        action = decode_action(data)
+                        action = decode_action_fast(data)
                         agent.set_pending_action(action)
+                    elif msg_type == MessageType.FORMAT:
+                        # Unsupported formats keep the client on JSON
+                        if data['format'] in WIRE_FORMATS:
+                            agent.wire_format = data['format']
+                        agent.wants_deltas = bool(data.get('deltas'))
+                        agent.wants_compact = bool(data.get('compact'))
+                        # Shared memory only works on this host, and frames
+                        # are read back in the compact form
+                        agent.wants_shm = (data.get('transport') == SHM and agent.wants_compact
+                                           and _is_loopback(websocket))
 
                 except Exception as e:
                     print(f"Error processing message from {slot}: {e}")
@@ -135,13 +161,45 @@ class GameServer:
         if not self.game:
             return
 
-        state = self.game.get_state()
-        message = encode_state(state)
-
-        # Send to all connected clients
+        view = self.game.get_state()
+        if self.channel is not None:
+            self.channel.publish(view)
+
+        state = view.to_wire()
+        prev = self._last_state
+        self._last_state = state
+
+        # Send to all connected clients, encoding each (format, payload)
+        # once. Clients that never asked for compact states get to_dict()
+        # states; the others get a full compact state until they hold the
+        # previous broadcast, then deltas if they asked for them.
+        messages: Dict[tuple[str, str], bytes] = {}
+        delta = None
+        legacy_state = None
         tasks = []
         for agent in self.player_slots.values():
-            if agent is not None and agent.is_connected():
+            if agent is not None and agent.channel is None and agent.is_connected():
+                if not agent.wants_compact:
+                    payload = 'dict'
+                elif agent.wants_deltas and agent.has_baseline and prev is not None:
+                    payload = 'delta'
+                else:
+                    payload = 'wire'
+                key = (agent.wire_format, payload)
+                message = messages.get(key)
+                if message is None:
+                    if payload == 'delta':
+                        if delta is None:
+                            delta = state_delta(prev, state)
+                        message = encode_message(MessageType.STATE_DELTA, delta, agent.wire_format)
+                    elif payload == 'wire':
+                        message = encode_message(MessageType.STATE, state, agent.wire_format)
+                    else:
+                        if legacy_state is None:
+                            legacy_state = view.to_dict()
+                        message = encode_message(MessageType.STATE, legacy_state, agent.wire_format)
+                    messages[key] = message
+                agent.has_baseline = True
                 tasks.append(agent.websocket.send(message))
 
         if tasks:
@@ -174,6 +232,7 @@ class GameServer:
 
         # Create game
         self.game = Game(self.config, team0_agents, team1_agents)
+        await self.open_channel()
 
         # Initialize renderer if visualization enabled
         if self.viz and PYGAME_AVAILABLE:
@@ -204,6 +263,8 @@ class GameServer:
             # Maintain tick rate
             await asyncio.sleep(self.tick_interval * 0.2)
 
+        self.game.close()
+
         # Game over - send final results
         final_state = self.game.get_state()
         winner = self.game.get_winner()
@@ -230,6 +291,38 @@ class GameServer:
                 except websockets.exceptions.ConnectionClosed:
                     pass
 
+        if self.channel is not None:
+            for agent in self.player_slots.values():
+                if agent is not None:
+                    agent.channel = None
+            self.channel.close()
+            self.channel = None
+
+    async def open_channel(self) -> None:
+        """Move clients that asked for shared memory onto one shared block."""
+        agents = [agent for agent in self.player_slots.values()
+                  if agent is not None and agent.wants_shm and agent.is_connected()]
+        if not agents:
+            return
+
+        players = self.game.get_state().players
+        self.channel = SharedStateChannel.create(
+            [p.team_id for p in players],
+            [p.player_id for p in players],
+            self.config.field_width,
+            self.config.field_height,
+            self.config.goal_height,
+        )
+        for agent in agents:
+            index = self.channel.index_of(agent.team_id, agent.player_id)
+            try:
+                await agent.websocket.send(encode_shm(self.channel.name, index))
+            except websockets.exceptions.ConnectionClosed:
+                continue
+            agent.channel_index = index
+            agent.channel = self.channel
+        print(f"Shared memory transport for {len(agents)} local client(s)")
+
     async def start(self) -> None:
         """Start the server and wait for game to complete."""
         print(f"Football Server starting on {self.host}:{self.port}")
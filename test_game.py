@@ -205,6 +205,54 @@ def test_physics_determinism():
     print("  Determinism verified!")
 
 
+def test_entity_arrays_match_objects():
+    """Test that physics on shared EntityArrays matches standalone entities."""
+    print("Testing EntityArrays physics path...")
+    import random
+    from game.config import GameConfig
+    from game.entities import EntityArrays, Player, Ball
+    from game.physics import Physics
+
+    config = GameConfig()
+    physics = Physics(config)
+    random.seed(7)
+
+    for _ in range(50):
+        n = 6
+        arrays = EntityArrays(n)
+        loose = []
+        for i in range(n):
+            player = Player(
+                x=random.uniform(0, config.field_width), y=random.uniform(0, config.field_height),
+                vx=random.uniform(-8, 8), vy=random.uniform(-8, 8),
+                radius=config.player_radius, team_id=i % 2, player_id=i // 2,
+            )
+            loose.append(player)
+            view = Player.view(arrays, i)
+            for field, value in player.to_dict().items():
+                setattr(view, field, value)
+        loose_ball = Ball(x=random.uniform(0, config.field_width), y=random.uniform(0, config.field_height),
+                          vx=random.uniform(-20, 20), vy=random.uniform(-20, 20), radius=config.ball_radius)
+        ball = Ball.view(arrays, arrays.ball_index)
+        for field, value in loose_ball.to_dict().items():
+            setattr(ball, field, value)
+        players = [Player.view(arrays, i) for i in range(n)]
+
+        for physics_players, physics_ball in ((loose, loose_ball), (players, ball)):
+            physics.update_positions(physics_players, physics_ball)
+            physics.handle_all_collisions(physics_players, physics_ball, [])
+
+        for a, b in zip(loose + [loose_ball], players + [ball]):
+            assert a.to_dict() == b.to_dict(), f"{a} != {b}"
+
+        # Whole-store serialization round-trips
+        data = arrays.to_dict()
+        assert EntityArrays.from_dict(data).to_dict() == data
+        assert all(type(v) is float for v in data['xs'])
+
+    print("  Array and object physics agree!")
+
+
 def test_goal_net_physics():
     """Test that ball enters goal net properly and stops at back."""
     print("Testing goal net physics...")
@@ -329,6 +377,264 @@ def test_game_engine():
     print(f"  Ball position: ({state.ball.x:.1f}, {state.ball.y:.1f})")
 
 
+def test_process_kicks():
+    """Test kick impulses, simultaneous kickers and cooldowns."""
+    print("Testing kick processing...")
+    import numpy as np
+    from agents.random_agent import ChaserAgent
+    from game.config import GameConfig
+    from game.engine import Game
+
+    config = GameConfig(players_per_team=1)
+    game = Game(config, [ChaserAgent(0, 0)], [ChaserAgent(1, 0)])
+    p0, p1 = game.players
+    kick = np.array([True, True])
+
+    # Single kicker: impulse along player->ball, cooldown set
+    game.ball.x, game.ball.y, game.ball.vx, game.ball.vy = 500.0, 300.0, 0.0, 0.0
+    p0.x, p0.y = 470.0, 300.0
+    p1.x, p1.y = 800.0, 300.0
+    game._process_kicks(kick)
+    assert abs(game.ball.vx - config.kick_power) < 1e-9 and game.ball.vy == 0.0
+    assert p0.kick_cooldown == config.kick_cooldown_ticks and p1.kick_cooldown == 0
+
+    # Cooling down: no impulse, cooldown ticks down
+    game._process_kicks(kick)
+    assert abs(game.ball.vx - config.kick_power) < 1e-9
+    assert p0.kick_cooldown == config.kick_cooldown_ticks - 1
+
+    # Two kickers from opposite sides cancel out
+    game.ball.vx = 0.0
+    p0.kick_cooldown = 0
+    p1.x = 530.0
+    game._process_kicks(kick)
+    assert abs(game.ball.vx) < 1e-9 and abs(game.ball.vy) < 1e-9
+    assert p0.kick_cooldown == p1.kick_cooldown == config.kick_cooldown_ticks
+
+    # Ball exactly on the player: kick along the player's velocity
+    p0.kick_cooldown = 0
+    p0.x, p0.y, p0.vx, p0.vy = 500.0, 300.0, 0.0, 2.0
+    game._process_kicks(np.array([True, False]))
+    assert abs(game.ball.vy - config.kick_power) < 1e-9
+
+    print("  Kicks processed correctly!")
+
+
+def test_step_actions_kernel():
+    """Test the compiled action kernel matches the NumPy acceleration + kick path."""
+    print("Testing step_actions kernel...")
+    import numpy as np
+    from agents.random_agent import ChaserAgent
+    from game.config import GameConfig
+    from game.engine import Game
+    from game.physics_kernels import step_actions, step_params
+
+    config = GameConfig(players_per_team=5)
+    rng = np.random.default_rng(3)
+    games = [Game(config, [ChaserAgent(0, i) for i in range(5)],
+                  [ChaserAgent(1, i) for i in range(5)]) for _ in range(2)]
+    ref, fast = games
+    n = len(ref.players)
+
+    for _ in range(20):
+        # Crowd the ball so kicks, cooldowns and clamping all happen
+        xs = 500.0 + rng.uniform(-40.0, 40.0, n + 1)
+        ys = 300.0 + rng.uniform(-40.0, 40.0, n + 1)
+        vxs = rng.uniform(-4.0, 4.0, n + 1)
+        vys = rng.uniform(-4.0, 4.0, n + 1)
+        ax = rng.uniform(-1.0, 1.0, n)
+        ay = rng.uniform(-1.0, 1.0, n)
+        kick = rng.random(n) < 0.5
+        for game in games:
+            game.arrays.xs[:] = xs
+            game.arrays.ys[:] = ys
+            game.arrays.vxs[:] = vxs
+            game.arrays.vys[:] = vys
+
+        ref.physics.apply_accelerations(ref.arrays, ax, ay)
+        ref._process_kicks(kick)
+        a = fast.arrays
+        step_actions(a.xs, a.ys, a.vxs, a.vys, fast.players_cooldown,
+                     ax, ay, kick, step_params(config))
+
+        assert np.array_equal(ref.arrays.vxs, fast.arrays.vxs)
+        assert np.array_equal(ref.arrays.vys, fast.arrays.vys)
+        assert np.array_equal(ref.players_cooldown, fast.players_cooldown)
+
+    print("  Kernel matches NumPy path!")
+
+
+def test_collision_kernel():
+    """Test the collision kernel matches the Python resolution loop exactly."""
+    print("Testing collision kernel...")
+    import random
+    from game.config import GameConfig
+    from game.entities import EntityArrays
+    from game.physics import Physics, _load_bodies
+    from game.physics_kernels import collision_params, resolve_collisions
+
+    config = GameConfig()
+    physics = Physics(config)
+    params = collision_params(config)
+    random.seed(11)
+
+    for _ in range(100):
+        # Crowd players into one spot (often a corner or goal mouth) so
+        # collisions, net walls and the non-converging fallback all run
+        n = random.choice([2, 4, 10, 22])
+        cx = random.choice([10.0, 500.0, 990.0, -20.0, 1020.0])
+        cy = random.choice([10.0, 300.0, 590.0])
+        arrays = EntityArrays(n)
+        for i in range(n + 1):
+            arrays.xs[i] = cx + random.uniform(-40, 40)
+            arrays.ys[i] = cy + random.uniform(-40, 40)
+            arrays.vxs[i] = random.uniform(-10, 10)
+            arrays.vys[i] = random.uniform(-10, 10)
+        arrays.radii[:n] = config.player_radius
+        arrays.masses[:n] = config.player_mass
+        arrays.radii[n] = config.ball_radius
+        arrays.masses[n] = config.ball_mass
+
+        bodies = _load_bodies(arrays)
+        physics._resolve_all(bodies[:-1], bodies[-1])
+        resolve_collisions(arrays.xs, arrays.ys, arrays.vxs, arrays.vys,
+                           arrays.radii, arrays.masses, params)
+
+        for i, b in enumerate(bodies):
+            got = (arrays.xs[i], arrays.ys[i], arrays.vxs[i], arrays.vys[i])
+            assert got == (b.x, b.y, b.vx, b.vy), f"slot {i}: {got} != {(b.x, b.y, b.vx, b.vy)}"
+
+    print("  Kernel matches Python collisions!")
+
+
+def test_collision_broad_phase():
+    """Test the pair-matrix broad phase resolves exactly like checking every pair."""
+    print("Testing collision broad phase...")
+    import random
+    from game import physics as physics_module
+    from game.config import GameConfig
+    from game.entities import EntityArrays
+    from game.physics import Physics, _load_bodies
+
+    config = GameConfig()
+    physics = Physics(config)
+    random.seed(5)
+
+    for _ in range(50):
+        n = 22
+        arrays = EntityArrays(n)
+        for i in range(n + 1):
+            arrays.xs[i] = 500.0 + random.uniform(-60, 60)
+            arrays.ys[i] = 300.0 + random.uniform(-60, 60)
+            arrays.vxs[i] = random.uniform(-10, 10)
+            arrays.vys[i] = random.uniform(-10, 10)
+        arrays.radii[:n] = config.player_radius
+        arrays.masses[:n] = config.player_mass
+        arrays.radii[n] = config.ball_radius
+        arrays.masses[n] = config.ball_mass
+
+        wide = _load_bodies(arrays)
+        assert physics.validate_state(wide[:-1], wide[-1]) is False
+        physics._resolve_all(wide[:-1], wide[-1])
+        wide_valid = physics.validate_state(wide[:-1], wide[-1])
+
+        # Testing every pair must land on the same state
+        saved = physics_module.BROAD_PHASE_MIN_ENTITIES
+        bodies = _load_bodies(arrays)
+        physics_module.BROAD_PHASE_MIN_ENTITIES = n + 2
+        try:
+            assert physics.validate_state(bodies[:-1], bodies[-1]) is False
+            physics._resolve_all(bodies[:-1], bodies[-1])
+            valid = physics.validate_state(bodies[:-1], bodies[-1])
+        finally:
+            physics_module.BROAD_PHASE_MIN_ENTITIES = saved
+
+        for a, b in zip(wide, bodies):
+            assert (a.x, a.y, a.vx, a.vy) == (b.x, b.y, b.vx, b.vy)
+        assert valid is wide_valid
+
+    print("  Broad phase matches all-pairs resolution!")
+
+
+def test_state_view_and_snapshot():
+    """Test that get_state reuses one view and snapshots stay frozen."""
+    print("Testing state view and snapshot...")
+    from agents.random_agent import ChaserAgent
+    from game.config import GameConfig
+    from game.engine import Game
+
+    config = GameConfig(players_per_team=2)
+    game = Game(config, [ChaserAgent(0, i) for i in range(2)], [ChaserAgent(1, i) for i in range(2)])
+
+    view = game.get_state()
+    snapshot = game.get_state_snapshot()
+    assert view.to_dict() == snapshot.to_dict(), "View and snapshot should agree"
+
+    for _ in range(5):
+        game.step()
+
+    assert game.get_state() is view, "get_state should reuse the same view"
+    assert view.tick == 5 and snapshot.tick == 0
+    assert view.to_dict() == game.get_state_snapshot().to_dict()
+    assert view.get_player(1, 1).x == game.players[3].x
+    assert view.ball_dist_sq == game.get_state_snapshot().ball_dist_sq
+    p = game.players[2]
+    assert view.ball_dist_sq[2] == (game.ball.x - p.x) ** 2 + (game.ball.y - p.y) ** 2
+
+    # Indexed lookups agree with a scan over players
+    snapshot = game.get_state_snapshot()
+    for state in (view, snapshot):
+        for p in state.players:
+            assert state.get_player(p.team_id, p.player_id) is p
+        assert state.get_team_players(1) == [p for p in state.players if p.team_id == 1]
+        try:
+            state.get_player(0, 9)
+            assert False, "Missing player should raise"
+        except ValueError:
+            pass
+
+    # Snapshot players are ordinary frozen PlayerStates
+    from dataclasses import FrozenInstanceError
+    from game.state import PlayerState
+    first = game.get_state_snapshot().players[0]
+    assert type(first) is PlayerState
+    assert first == PlayerState(**first.to_dict()) and hash(first) == hash(PlayerState(**first.to_dict()))
+    try:
+        first.x = 0.0
+        assert False, "Snapshot players should be frozen"
+    except FrozenInstanceError:
+        pass
+    assert not hasattr(first, '__dict__'), "PlayerState should be slotted"
+
+    print("  State view refreshes in place!")
+
+
+def test_seeded_game_is_reproducible():
+    """Test that games with the same seed play out identically."""
+    print("Testing seeded reproducibility...")
+    from agents.random_agent import ChaserAgent, GoalieAgent, RandomAgent
+    from game.config import GameConfig
+    from game.engine import Game
+
+    class CustomChaser(ChaserAgent):
+        """Not a built-in class, so the game calls agents one by one."""
+
+    def play(seed, chaser_class):
+        config = GameConfig(players_per_team=3, max_ticks=400)
+        team0 = [GoalieAgent(0, 0), chaser_class(0, 1), RandomAgent(0, 2)]
+        team1 = [GoalieAgent(1, 0), chaser_class(1, 1), RandomAgent(1, 2)]
+        game = Game(config, team0, team1, seed=seed)
+        game.run()
+        return game.get_state_snapshot().to_dict()
+
+    for chaser_class in (ChaserAgent, CustomChaser):
+        assert play(11, chaser_class) == play(11, chaser_class), \
+            f"Same seed should reproduce the game ({chaser_class.__name__})"
+        assert play(11, chaser_class) != play(12, chaser_class)
+
+    print("  Seeded games are reproducible!")
+
+
 def test_game_step_handles_agent_timeouts():
     """Test that slow agents don't crash the game loop on timeout."""
     print("Testing agent timeout handling...")
@@ -346,9 +652,16 @@ def test_game_step_handles_agent_timeouts():
     game = Game(config, [SlowAgent(0, 0)], [SlowAgent(1, 0)])
 
     # Should not raise TimeoutError even though both agents exceed timeout.
+    start = time.perf_counter()
     game.step()
     assert game.tick == 1, "Game tick should advance after a timed-out agent step"
 
+    # Still-running agents are not resubmitted and do not block the next tick
+    game.step()
+    assert game.tick == 2
+    assert time.perf_counter() - start < 0.15, "Slow agents should not stall the game loop"
+    game.close()
+
 
 def test_logging():
     """Test game logging."""
@@ -376,6 +689,264 @@ def test_logging():
     print(f"  Log contains {log_data['total_ticks']} states")
 
 
+def test_logger_buffers():
+    """Test array and snapshot logging produce GameState.to_dict() records."""
+    print("Testing logger frame buffers...")
+    from game.config import GameConfig
+    from game.engine import Game
+    from agents.random_agent import ChaserAgent
+    import os
+    from game_logging.logger import GameLogger, load_game_log, MSGPACK_AVAILABLE
+
+    # max_ticks far below the logged count forces the buffers to grow
+    config = GameConfig(players_per_team=2, max_ticks=5)
+    logger = GameLogger(config, output_path="test_log.json")
+    game = Game(config, [ChaserAgent(0, i) for i in range(2)],
+                [ChaserAgent(1, i) for i in range(2)], seed=1)
+
+    expected = []
+    for tick in range(20):
+        game.tick = tick
+        game.step()
+        snapshot = game.get_state_snapshot()
+        expected.append(snapshot.to_dict())
+        if tick % 2:
+            logger.log_state(snapshot)
+        else:
+            logger.log_arrays(game.tick, game.arrays, game.score, game.status)
+
+    assert logger.get_states() == expected
+    logger.finalize()
+    assert load_game_log("test_log.json")['states'] == expected
+    print(f"  {len(expected)} states round-trip through the buffers")
+
+    # Line-delimited logs stream the same records; .npz archives the buffers
+    paths = ["test_log.jsonl", "test_log.npz"]
+    if MSGPACK_AVAILABLE:
+        paths.append("test_log.msgpack")
+    for path in paths:
+        file_logger = GameLogger(config, output_path=path)
+        game = Game(config, [ChaserAgent(0, i) for i in range(2)],
+                    [ChaserAgent(1, i) for i in range(2)], seed=1)
+        for tick in range(20):
+            game.tick = tick
+            game.step()
+            if tick % 2:
+                file_logger.log_state(game.get_state_snapshot())
+            else:
+                file_logger.log_arrays(game.tick, game.arrays, game.score, game.status)
+            if tick == 9:
+                assert file_logger.get_states() == expected[:10]
+        file_logger.finalize()
+
+        log_data = load_game_log(path)
+        os.remove(path)
+        assert log_data['config'] == config.to_dict()
+        assert log_data['states'] == expected
+        assert log_data['total_ticks'] == len(expected)
+        print(f"  {path} holds the same states")
+
+
+def test_replay_frames():
+    """Test the replay viewer's per-frame arrays rebuild the logged states."""
+    print("Testing replay frames...")
+    from agents.keyboard_agent import PYGAME_AVAILABLE
+    if not PYGAME_AVAILABLE:
+        print("  pygame not installed, skipping")
+        return
+    import os
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    from game.config import GameConfig
+    from game.engine import Game
+    from game.state import GameState
+    from agents.random_agent import ChaserAgent
+    from game_logging.logger import GameLogger, load_game_log
+    import pygame
+    from visualization.renderer import EXPOSE_EVENTS
+    from visualization.replay import ReplayViewer
+
+    config = GameConfig(players_per_team=2, max_ticks=50)
+    for path in ("test_replay.json", "test_replay.jsonl", "test_replay.npz"):
+        logger = GameLogger(config, output_path=path)
+        game = Game(config, [ChaserAgent(0, i) for i in range(2)],
+                    [ChaserAgent(1, i) for i in range(2)], seed=3, logger=logger)
+        game.run()
+
+        try:
+            viewer = ReplayViewer(path)
+            states = load_game_log(path)['states']
+            assert viewer.n_frames == len(states)
+            assert viewer.config == config
+            for i, expected in enumerate(states):
+                frame = viewer.get_frame(i)
+                assert GameState.from_dict(frame.to_dict()) == GameState.from_dict(expected)
+            viewer.renderer.draw(viewer.get_frame(viewer.n_frames - 1))
+            viewer._draw_controls()
+            viewer.renderer.present()
+
+            # An uncovered window is repainted in full, then QUIT ends run()
+            renderer = viewer.renderer
+            present = renderer.present
+            full_redraws = []
+            def spy_present():
+                full_redraws.append(renderer._full_redraw)
+                present()
+            renderer.present = spy_present
+            for event_type in EXPOSE_EVENTS[:1] + (pygame.QUIT,):
+                pygame.event.post(pygame.event.Event(event_type))
+            viewer.run()
+            assert full_redraws == [bool(EXPOSE_EVENTS)]
+        finally:
+            os.remove(path)
+        print(f"  {path}: {viewer.n_frames} frames match the log")
+
+
+def test_protocol_round_trip():
+    """Test network messages encode to bytes and decode back unchanged."""
+    print("Testing network protocol...")
+    from game.config import GameConfig
+    from game.engine import Game
+    from agents.base import Action
+    from agents.random_agent import ChaserAgent
+    from network.protocol import (
+        MessageType, JSON, MSGPACK, WIRE_FORMATS, decode_message, decode_state,
+        decode_action, encode_state, encode_action, encode_assign, encode_message,
+        message_format,
+    )
+
+    config = GameConfig(players_per_team=2)
+    game = Game(config, [ChaserAgent(0, i) for i in range(2)],
+                [ChaserAgent(1, i) for i in range(2)], seed=1)
+    game.step()
+    state = game.get_state_snapshot()
+
+    message = encode_state(state)
+    assert isinstance(message, bytes)
+    msg_type, data = decode_message(message)
+    assert msg_type == MessageType.STATE
+    assert decode_state(data) == state
+
+    action = Action(ax=0.5, ay=-0.25, kick=True)
+    msg_type, data = decode_message(encode_action(action))
+    assert msg_type == MessageType.ACTION and decode_action(data) == action
+
+    # Config messages are cached by value, so edits to the config show up
+    from network.protocol import encode_config, decode_config
+    assert encode_config(config) is encode_config(GameConfig(players_per_team=2))
+    edited = GameConfig(players_per_team=2)
+    edited.max_ticks = 123
+    assert decode_config(decode_message(encode_config(edited))[1]) == edited
+
+    # Text frames still decode
+    assert decode_message(encode_assign(1, 0).decode()) == (MessageType.ASSIGN, {'team_id': 1, 'player_id': 0})
+
+    # Every available wire format carries the same messages
+    for wire_format in WIRE_FORMATS:
+        message = encode_state(state, wire_format)
+        assert message_format(message) == wire_format
+        assert decode_state(decode_message(message)[1]) == state
+        assert decode_action(decode_message(encode_action(action, wire_format))[1]) == action
+    if MSGPACK in WIRE_FORMATS:
+        assert len(encode_state(state, MSGPACK)) < len(encode_state(state, JSON))
+
+    # Clients that ask for it get the compact positional form instead of to_dict()
+    from game.state import GameState
+    assert GameState.from_wire(state.to_wire()) == state
+    assert game.get_state().to_wire() == state.to_wire()
+    assert decode_state(decode_message(encode_state(state, compact=True))[1]) == state
+    assert len(encode_state(state, compact=True)) < len(encode_state(state))
+
+    # The server only sends the compact form to clients that negotiated it,
+    # so a client that never sent FORMAT still decodes with from_dict
+    import asyncio
+    from network.network_agent import NetworkAgent
+    from server import GameServer
+
+    class RecordingSocket:
+        close_code = None
+
+        def __init__(self):
+            self.sent = []
+
+        async def send(self, message):
+            self.sent.append(message)
+
+    legacy, compact = RecordingSocket(), RecordingSocket()
+    game_server = GameServer(config)
+    game_server.game = game
+    game_server.player_slots[(0, 0)] = NetworkAgent(0, 0, legacy)
+    game_server.player_slots[(1, 0)] = NetworkAgent(1, 0, compact)
+    game_server.player_slots[(1, 0)].wants_compact = True
+    asyncio.run(game_server.broadcast_state())
+    msg_type, data = decode_message(legacy.sent[0])
+    assert msg_type == MessageType.STATE
+    assert GameState.from_dict(data) == state
+    assert GameState.from_wire(decode_message(compact.sent[0])[1]) == state
+
+    # The server's fast action decoder sanitizes exactly like Action
+    from network.protocol import decode_action_fast
+    for data in (action.to_dict(), {'ax': 3, 'ay': float('nan'), 'kick': 1},
+                 {'ax': float('-inf'), 'ay': -2.5, 'kick': False}):
+        assert decode_action_fast(data) == decode_action(data)
+
+    # Deltas applied to the first full state reproduce every later state
+    import copy
+    from network.protocol import state_delta, apply_state_delta
+    prev = state.to_wire()
+    client_state = copy.deepcopy(prev)
+    for _ in range(30):
+        game.step()
+        cur = game.get_state_snapshot().to_wire()
+        delta = state_delta(prev, cur)
+        assert apply_state_delta(client_state, delta) == cur
+        prev = cur
+    assert state_delta(prev, prev)['p'] == [] and 'b' not in state_delta(prev, prev)
+    print("  Messages round-trip!")
+
+
+def test_shared_memory_channel():
+    """Test states and actions pass through a shared memory block unchanged."""
+    print("Testing shared memory channel...")
+    from game.config import GameConfig
+    from game.engine import Game
+    from game.state import GameState
+    from agents.base import Action
+    from agents.random_agent import ChaserAgent
+    from network.network_agent import NetworkAgent
+    from network.shared_memory import SharedStateChannel
+
+    config = GameConfig(players_per_team=2)
+    game = Game(config, [ChaserAgent(0, i) for i in range(2)],
+                [ChaserAgent(1, i) for i in range(2)], seed=3)
+    players = game.get_state().players
+    server = SharedStateChannel.create(
+        [p.team_id for p in players], [p.player_id for p in players],
+        config.field_width, config.field_height, config.goal_height,
+    )
+    client = SharedStateChannel.attach(server.name)
+    try:
+        assert client.read_state() is None
+
+        # More frames than ring slots, so slots get reused
+        for _ in range(10):
+            game.step()
+            server.publish(game.get_state())
+            assert GameState.from_wire(client.read_state()) == game.get_state_snapshot()
+
+        # The server-side agent reads the client's action from its slot
+        agent = NetworkAgent(1, 1, websocket=None)
+        agent.channel = server
+        agent.channel_index = client.index_of(1, 1)
+        assert agent.get_action(None) == Action(0.0, 0.0, False)
+        client.send_action(agent.channel_index, Action(0.5, -0.25, True))
+        assert agent.get_action(None) == Action(0.5, -0.25, True)
+        print(f"  {server.n_players} players through block {server.name}")
+    finally:
+        client.close()
+        server.close()
+    print("  Shared memory round-trips!")
+
+
 def test_agents():
     """Test different agent types."""
     print("Testing agents...")
@@ -412,6 +983,175 @@ def test_agents():
     action = goalie.get_action(state)
     print(f"  GoalieAgent action: ({action.ax:.2f}, {action.ay:.2f})")
 
+    # Built-in agents declare __slots__ all the way down
+    for agent in (random_agent, chaser, goalie):
+        assert not hasattr(agent, '__dict__'), f"{type(agent).__name__} has a __dict__"
+
+
+def test_keyboard_mask():
+    """Test keyboard agent reads movement and kick from the controller key mask."""
+    print("Testing keyboard key mask...")
+    from agents.keyboard_agent import KeyboardAgent, KeyboardController, PYGAME_AVAILABLE
+    if not PYGAME_AVAILABLE:
+        print("  pygame not available, skipping")
+        return
+    import pygame
+
+    agent = KeyboardAgent(0, 0)
+    controller = KeyboardController([agent])
+
+    controller.on_key(pygame.K_w, True)
+    controller.on_key(pygame.K_d, True)
+    action = agent.get_action(None)
+    assert (action.ax, action.ay, action.kick) == (0.5, -0.5, False)
+
+    # Opposite keys cancel, unrelated keys are ignored
+    controller.on_key(pygame.K_a, True)
+    controller.on_key(pygame.K_SPACE, True)
+    controller.on_key(pygame.K_TAB, True)
+    action = agent.get_action(None)
+    assert (action.ax, action.ay, action.kick) == (0.0, -0.5, True)
+
+    for key in (pygame.K_w, pygame.K_a, pygame.K_d, pygame.K_SPACE):
+        controller.on_key(key, False)
+    assert controller._key_mask == 0
+    print("  Key mask decoding OK")
+
+
+def test_get_my_player_index():
+    """Test agents find their player by slot index, falling back to a scan."""
+    print("Testing get_my_player index...")
+    from dataclasses import replace
+    from agents.random_agent import ChaserAgent
+    from game.config import GameConfig
+    from game.engine import Game
+
+    config = GameConfig(players_per_team=2)
+    team0 = [ChaserAgent(0, i) for i in range(2)]
+    team1 = [ChaserAgent(1, i) for i in range(2)]
+    game = Game(config, team0, team1)
+    state = game.get_state_snapshot()
+
+    for agent in team0 + team1:
+        me = agent.get_my_player(state)
+        assert state.players[agent._player_index] is me
+        assert (me.team_id, me.player_id) == (agent.team_id, agent.player_id)
+
+    # A state with another player order still resolves correctly
+    shuffled = replace(state, players=state.players[::-1])
+    for agent in team0 + team1:
+        me = agent.get_my_player(shuffled)
+        assert (me.team_id, me.player_id) == (agent.team_id, agent.player_id)
+    print("  Player lookup OK")
+
+
+def test_agent_configure():
+    """Test that the game configures agents with its field geometry."""
+    print("Testing agent configure...")
+    from agents.random_agent import GoalieAgent, WingerAgent
+    from game.config import GameConfig
+    from game.engine import Game
+
+    config = GameConfig(players_per_team=1, field_width=800.0, field_height=400.0)
+    goalie = GoalieAgent(team_id=1, player_id=0, noise=0.0)
+    winger = WingerAgent(team_id=0, player_id=0)
+    game = Game(config, [winger], [goalie])
+
+    # Goalie on the right holds x = field_width - 50, not the default 950
+    goalie_player = game.players[1]
+    goalie_player.x, goalie_player.y = 760.0, 200.0
+    game.ball.x, game.ball.y = 400.0, 200.0
+    action = goalie.get_action(game.get_state())
+    assert action.ax < 0, f"Goalie should move left toward x=750, got ax={action.ax}"
+
+    # Winger stays ahead of the ball, capped at 80% of this field's width
+    winger_player = game.players[0]
+    winger_player.x, winger_player.y = 700.0, 80.0
+    game.ball.x, game.ball.y = 700.0, 350.0
+    action = winger.get_action(game.get_state())
+    assert action.ax < 0, f"Winger should pull back to x=640, got ax={action.ax}"
+
+    print("  Agents use the configured field!")
+
+
+def test_batch_policies():
+    """Test that the vectorized policy kernel matches each agent's get_action."""
+    print("Testing batch policies...")
+    import random
+    import numpy as np
+    from game.state import GameState, PlayerState, BallState, GameStatus
+    from agents.random_agent import (
+        RandomAgent, ChaserAgent, GoalieAgent, StrikerAgent, DefenderAgent,
+        InterceptorAgent, MidfielderAgent, AggressorAgent, WingerAgent,
+    )
+    from agents.batch_policies import (
+        build_policy_arrays, compute_actions, specialize_actions, _actions_numpy, _actions_loop,
+    )
+
+    classes = [RandomAgent, ChaserAgent, GoalieAgent, StrikerAgent, DefenderAgent,
+               InterceptorAgent, MidfielderAgent, AggressorAgent, WingerAgent]
+    agents = []
+    for team_id in range(2):
+        for player_id, cls in enumerate(classes):
+            agents.append(cls(team_id=team_id, player_id=player_id))
+    roles, params = build_policy_arrays(agents, 600)
+    teams = np.array([a.team_id for a in agents])
+    specialized = specialize_actions(roles, teams, params, 1000.0, 600.0, 120.0)
+    rng = np.random.default_rng(7)
+
+    random.seed(7)
+    for _ in range(200):
+        # Agents and kernel read the same pre-drawn noise, as inside Game
+        noise = rng.uniform(-1.0, 1.0, size=(len(agents), 2))
+        for agent, row in zip(agents, noise.tolist()):
+            agent.noise_row = row
+
+        players = tuple(
+            PlayerState(x=random.uniform(0, 1000), y=random.uniform(0, 600),
+                        vx=0, vy=0, team_id=a.team_id, player_id=a.player_id,
+                        kick_cooldown=random.choice([0, 0, 5]))
+            for a in agents
+        )
+        ball = BallState(x=random.uniform(0, 1000), y=random.uniform(0, 600),
+                         vx=random.uniform(-15, 15), vy=random.uniform(-15, 15))
+        if random.random() < 0.3:
+            # Put the ball next to a player to exercise near-ball branches
+            p = random.choice(players)
+            ball = BallState(x=p.x + 20, y=p.y, vx=ball.vx, vy=ball.vy)
+        state = GameState(players=players, ball=ball, score=(0, 0), tick=0,
+                          status=GameStatus.RUNNING, field_width=1000,
+                          field_height=600, goal_height=120)
+
+        args = (
+            np.array([(p.x, p.y) for p in players]), teams,
+            np.array([p.kick_cooldown for p in players]),
+            np.array([ball.x, ball.y, ball.vx, ball.vy]),
+            roles, params, noise, 1000.0, 600.0, 120.0,
+        )
+        out = compute_actions(*args)
+
+        # NumPy and per-player loop kernels must agree with each other too
+        out_numpy = np.empty_like(out)
+        out_loop = np.empty_like(out)
+        _actions_numpy(*args, out_numpy)
+        _actions_loop(*args, out_loop)
+        assert np.array_equal(out_numpy, out_loop), "Kernel variants disagree"
+
+        # Generated per-lineup kernel
+        out_specialized = np.empty_like(out)
+        specialized(args[0], args[2], args[3], noise, out_specialized)
+        assert np.array_equal(out_specialized, out_loop), "Specialized kernel disagrees"
+        assert np.array_equal(out, out_loop), "Compiled kernel disagrees"
+
+        for agent, (ax, ay, kick) in zip(agents, out):
+            action = agent.get_action(state)
+            name = type(agent).__name__
+            assert abs(action.ax - ax) < 1e-9, f"{name} ax: {action.ax} != {ax}"
+            assert abs(action.ay - ay) < 1e-9, f"{name} ay: {action.ay} != {ay}"
+            assert action.kick == bool(kick), f"{name} kick mismatch"
+
+    print("  Batch policies match per-agent actions!")
+
 
 def main():
     print("=" * 50)
@@ -437,6 +1177,9 @@ def main():
     test_physics_determinism()
     print()
 
+    test_entity_arrays_match_objects()
+    print()
+
     test_goal_net_physics()
     print()
 
@@ -446,15 +1189,57 @@ def main():
     test_agents()
     print()
 
+    test_agent_configure()
+    print()
+
+    test_keyboard_mask()
+    print()
+
+    test_get_my_player_index()
+    print()
+
+    test_batch_policies()
+    print()
+
     test_game_engine()
     print()
 
+    test_process_kicks()
+    print()
+
+    test_step_actions_kernel()
+    print()
+
+    test_collision_kernel()
+    print()
+
+    test_collision_broad_phase()
+    print()
+
+    test_state_view_and_snapshot()
+    print()
+
+    test_seeded_game_is_reproducible()
+    print()
+
     test_game_step_handles_agent_timeouts()
     print()
 
     test_logging()
     print()
 
+    test_logger_buffers()
+    print()
+
+    test_replay_frames()
+    print()
+
+    test_protocol_round_trip()
+    print()
+
+    test_shared_memory_channel()
+    print()
+
     print("=" * 50)
     print("All tests passed!")
     print("=" * 50)
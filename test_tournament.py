@@ -33,3 +33,23 @@ def test_self_match_counts_once():
     assert team.losses == 0
     assert team.draws == 1
 
+
+def test_parallel_tournament_counts_every_match():
+    """Matches played in worker processes should all land in the stats."""
+    compositions = [["chaser"], ["goalie"], ["striker"]]
+    stats, results = run_tournament(
+        compositions=compositions,
+        matches_per_pairing=2,
+        ticks=50,
+        win_score=1,
+        verbose=False,
+        workers=2,
+    )
+
+    # 3 cross pairings and 3 self-matches, twice each
+    assert len(results) == 12
+    assert [r.team0_composition for r in results[:2]] == [["chaser"], ["chaser"]]
+    for comp in compositions:
+        team = stats[tuple(comp)]
+        assert team.games_played == 6
+        assert team.wins + team.draws + team.losses == team.games_played
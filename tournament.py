@@ -9,8 +9,10 @@ to find optimal strategies and agent combinations.
 import argparse
 import itertools
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, asdict
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 import sys
 
 from game.config import GameConfig
@@ -195,6 +197,7 @@ def run_tournament(
     ticks: int = 3000,
     win_score: int = 5,
     verbose: bool = True,
+    workers: Optional[int] = None,
 ) -> Tuple[Dict[Tuple[str, ...], TeamStats], List[MatchResult]]:
     """
     Run a round-robin tournament with all compositions.
@@ -205,6 +208,8 @@ def run_tournament(
         ticks: Max ticks per match
         win_score: Score needed to win
         verbose: Print progress
+        workers: Processes playing matches in parallel (None = one per CPU,
+            1 = play every match in this process)
 
     Returns:
         Tuple of (team_stats_dict, all_match_results)
@@ -226,53 +231,69 @@ def run_tournament(
         print(f"Total matches: {total_matches}")
         print("-" * 60)
 
-    match_count = 0
-
     # Round-robin: each team plays each other team (including itself)
+    team0_comps = []
+    team1_comps = []
     for i, team0_comp in enumerate(compositions):
         for j, team1_comp in enumerate(compositions):
             if i > j:
                 continue  # Avoid duplicate pairings (A vs B and B vs A)
-
             for match_num in range(matches_per_pairing):
-                match_count += 1
-
-                if verbose and match_count % 10 == 0:
-                    print(f"Progress: {match_count}/{total_matches} matches completed")
-
-                # Play match
-                result = play_match(team0_comp, team1_comp, ticks, win_score)
-                all_results.append(result)
+                team0_comps.append(team0_comp)
+                team1_comps.append(team1_comp)
+
+    # Matches are independent, so they can be played in worker processes;
+    # map() yields results in match order either way
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(team0_comps))
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    args = (team0_comps, team1_comps,
+            itertools.repeat(ticks), itertools.repeat(win_score))
+    results = executor.map(play_match, *args) if executor else map(play_match, *args)
 
-                # Update stats
-                comp0 = tuple(team0_comp)
-                comp1 = tuple(team1_comp)
-
-                if comp0 == comp1:
-                    # Same composition on both sides: count one mirror match.
-                    stats[comp0].games_played += 1
-                    goals_total = result.team0_score + result.team1_score
-                    stats[comp0].goals_scored += goals_total
-                    stats[comp0].goals_conceded += goals_total
+    match_count = 0
+    try:
+        for result in results:
+            match_count += 1
+
+            if verbose and match_count % 10 == 0:
+                print(f"Progress: {match_count}/{total_matches} matches completed")
+
+            all_results.append(result)
+
+            # Update stats
+            comp0 = tuple(result.team0_composition)
+            comp1 = tuple(result.team1_composition)
+
+            if comp0 == comp1:
+                # Same composition on both sides: count one mirror match.
+                stats[comp0].games_played += 1
+                goals_total = result.team0_score + result.team1_score
+                stats[comp0].goals_scored += goals_total
+                stats[comp0].goals_conceded += goals_total
+                stats[comp0].draws += 1
+            else:
+                stats[comp0].games_played += 1
+                stats[comp0].goals_scored += result.team0_score
+                stats[comp0].goals_conceded += result.team1_score
+
+                stats[comp1].games_played += 1
+                stats[comp1].goals_scored += result.team1_score
+                stats[comp1].goals_conceded += result.team0_score
+
+                if result.winner == 0:
+                    stats[comp0].wins += 1
+                    stats[comp1].losses += 1
+                elif result.winner == 1:
+                    stats[comp0].losses += 1
+                    stats[comp1].wins += 1
+                else:  # draw
                     stats[comp0].draws += 1
-                else:
-                    stats[comp0].games_played += 1
-                    stats[comp0].goals_scored += result.team0_score
-                    stats[comp0].goals_conceded += result.team1_score
-
-                    stats[comp1].games_played += 1
-                    stats[comp1].goals_scored += result.team1_score
-                    stats[comp1].goals_conceded += result.team0_score
-
-                    if result.winner == 0:
-                        stats[comp0].wins += 1
-                        stats[comp1].losses += 1
-                    elif result.winner == 1:
-                        stats[comp0].losses += 1
-                        stats[comp1].wins += 1
-                    else:  # draw
-                        stats[comp0].draws += 1
-                        stats[comp1].draws += 1
+                    stats[comp1].draws += 1
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
 
     # Calculate final stats
     for team_stats in stats.values():
@@ -410,6 +431,11 @@ Examples:
         type=str,
         help="Save detailed results to JSON file",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Processes to play matches in (default: one per CPU; 1 = serial)",
+    )
     parser.add_argument(
         "--no-duplicates",
         action="store_true",
@@ -452,6 +478,7 @@ Examples:
         ticks=args.ticks,
         win_score=args.win_score,
         verbose=True,
+        workers=args.workers,
     )
 
     # Display results
@@ -1,3 +1,4 @@
+import math
 from typing import TYPE_CHECKING, Optional
 
 try:
@@ -6,6 +7,12 @@ try:
 except ImportError:
     PYGAME_AVAILABLE = False
 
+# Window events after which the whole display has to be repainted
+EXPOSE_EVENTS = tuple(
+    getattr(pygame, name) for name in ('VIDEOEXPOSE', 'WINDOWEXPOSED', 'WINDOWRESTORED')
+    if PYGAME_AVAILABLE and hasattr(pygame, name)
+)
+
 if TYPE_CHECKING:
     from game.state import GameState
     from game.config import GameConfig
@@ -21,6 +28,9 @@ BLUE = (50, 100, 220)
 YELLOW = (255, 255, 0)
 GRAY = (128, 128, 128)
 
+# Rendered text surfaces kept before the cache is cleared and refilled
+TEXT_CACHE_SIZE = 256
+
 
 class Renderer:
     """Pygame-based game renderer."""
@@ -52,6 +62,17 @@ class Renderer:
         self.field_height = int(config.field_height * scale)
         self.width = self.field_width + 2 * self.padding
         self.height = self.field_height
+        self._player_radius = self._scale_val(config.player_radius)
+        self._ball_radius = self._scale_val(config.ball_radius)
+
+        # Per-frame geometry, worked out once: sprite top-left offsets from
+        # an entity's scaled center (padding included) and HUD anchors
+        self._player_offset = (self.padding - self._player_radius - 1, -self._player_radius - 1)
+        self._ball_offset = (self.padding - self._ball_radius - 1, -self._ball_radius - 1)
+        self._score_center = (self.width // 2, 25)
+        self._status_center = (self.width // 2, self.height // 2)
+        self._tick_pos = (self.padding + 10, 10)
+        self._tick_suffix = f"/{config.max_ticks}"
 
         pygame.init()
         pygame.display.set_caption(title)
@@ -60,8 +81,36 @@ class Renderer:
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
 
+        # The pitch never changes, so it is drawn once; goals are added per
+        # goal height (see _background()) and the result restores the screen
+        self._field_bg = self._build_field_background()
+        self._frame_bg: Optional['pygame.Surface'] = None
+        self._frame_bg_goal_height: Optional[float] = None
+
+        # Screen areas drawn this frame and last frame. Only these change
+        # between frames, so only they are restored and pushed to the display
+        self._dirty: list = []
+        self._prev_dirty: list = []
+        self._full_redraw = True
+
+        # Players and ball look the same every frame; their sprites are
+        # drawn once (players on first use, keyed by (team_id, player_id))
+        self._player_sprites: dict = {}
+        self._ball_sprite = self._build_sprite(self._ball_radius, YELLOW, BLACK)
+
+        # (font, text, color) -> rendered surface; see render_text()
+        self._text_cache: dict = {}
+
+        # Score and end-of-game banners (text on its background box) with
+        # their screen rects, rebuilt only when the text changes
+        self._score_banner: Optional[tuple] = None
+        self._last_score: Optional[str] = None
+        self._status_banner: Optional[tuple] = None
+        self._last_status: Optional[str] = None
+
         # Keyboard state tracking
         self.pressed_keys: set = set()
+        self.key_listener = None  # Optional object with on_key(key, pressed)
         self.active_player_id: Optional[int] = None  # For highlighting controlled player
         self.active_team_id: Optional[int] = None
 
@@ -77,6 +126,19 @@ class Renderer:
         """
         Render current game state.
 
+        Returns:
+            False if window was closed, True otherwise
+        """
+        if not self.draw(state):
+            return False
+        self.present()
+        return True
+
+    def draw(self, state: 'GameState') -> bool:
+        """
+        Handle window events and draw ``state`` to the screen surface without
+        updating the display; call present() once the frame is complete.
+
         Returns:
             False if window was closed, True otherwise
         """
@@ -84,25 +146,28 @@ class Renderer:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 return False
+            if event.type in EXPOSE_EVENTS:
+                self.invalidate()
             if event.type == pygame.KEYDOWN:
                 self.pressed_keys.add(event.key)
+                if self.key_listener is not None:
+                    self.key_listener.on_key(event.key, True)
                 if event.key == pygame.K_ESCAPE:
                     return False
             elif event.type == pygame.KEYUP:
                 self.pressed_keys.discard(event.key)
-
-        # Clear screen with background color (for goal areas)
-        self.screen.fill(DARK_GREEN)
-
-        # Draw field area
-        pygame.draw.rect(self.screen, GREEN,
-                         (self.padding, 0, self.field_width, self.field_height))
-
-        # Draw field markings
-        self._draw_field()
-
-        # Draw goals
-        self._draw_goals(state)
+                if self.key_listener is not None:
+                    self.key_listener.on_key(event.key, False)
+
+        # Background, field area, field markings and goals: restore only what
+        # was drawn over last frame, unless the whole window needs repainting
+        background = self._background(state.goal_height)
+        if self._full_redraw:
+            self.screen.blit(background, (0, 0))
+        else:
+            self.screen.blits([(background, rect, rect) for rect in self._dirty], False)
+        self._prev_dirty = self._dirty
+        self._dirty = []
 
         # Draw players
         self._draw_players(state)
@@ -112,14 +177,50 @@ class Renderer:
 
         # Draw score and info
         self._draw_info(state)
-
-        pygame.display.flip()
         return True
 
-    def _draw_field(self) -> None:
-        """Draw field markings with rounded corners."""
-        import math
+    def invalidate(self) -> None:
+        """Repaint and push the whole window next frame (e.g. after it was uncovered)."""
+        self._full_redraw = True
+
+    def mark_dirty(self, rect: 'pygame.Rect') -> None:
+        """Record a screen area drawn this frame (for callers drawing overlays)."""
+        self._dirty.append(rect)
+
+    def present(self) -> None:
+        """Push this frame's changes (and erase last frame's) to the display."""
+        if self._full_redraw:
+            pygame.display.flip()
+            self._full_redraw = False
+        else:
+            pygame.display.update(self._prev_dirty + self._dirty)
+
+    def _background(self, goal_height: float) -> 'pygame.Surface':
+        """The field background with goals of ``goal_height`` drawn in."""
+        if goal_height != self._frame_bg_goal_height:
+            self._frame_bg = self._field_bg.copy()
+            self._draw_goals(self._frame_bg, goal_height)
+            self._frame_bg_goal_height = goal_height
+            self._full_redraw = True
+        return self._frame_bg
+
+    def _build_field_background(self) -> 'pygame.Surface':
+        """Render the background, field area and markings to an off-screen surface."""
+        surface = pygame.Surface((self.width, self.height)).convert()
+
+        # Background color (for goal areas)
+        surface.fill(DARK_GREEN)
+
+        # Field area
+        pygame.draw.rect(surface, GREEN,
+                         (self.padding, 0, self.field_width, self.field_height))
+
+        # Field markings
+        self._draw_field(surface)
+        return surface
 
+    def _draw_field(self, surface: 'pygame.Surface') -> None:
+        """Draw field markings with rounded corners onto ``surface``."""
         corner_r = self._scale_val(self.config.corner_radius)
         p = self.padding  # Shorthand for padding
         fw = self.field_width
@@ -127,42 +228,42 @@ class Renderer:
 
         # Draw rounded corner borders
         # Top-left corner arc
-        pygame.draw.arc(self.screen, WHITE,
+        pygame.draw.arc(surface, WHITE,
                         (p, 0, corner_r * 2, corner_r * 2),
                         math.pi / 2, math.pi, 3)
         # Top-right corner arc
-        pygame.draw.arc(self.screen, WHITE,
+        pygame.draw.arc(surface, WHITE,
                         (p + fw - corner_r * 2, 0, corner_r * 2, corner_r * 2),
                         0, math.pi / 2, 3)
         # Bottom-left corner arc
-        pygame.draw.arc(self.screen, WHITE,
+        pygame.draw.arc(surface, WHITE,
                         (p, fh - corner_r * 2, corner_r * 2, corner_r * 2),
                         math.pi, math.pi * 3 / 2, 3)
         # Bottom-right corner arc
-        pygame.draw.arc(self.screen, WHITE,
+        pygame.draw.arc(surface, WHITE,
                         (p + fw - corner_r * 2, fh - corner_r * 2, corner_r * 2, corner_r * 2),
                         math.pi * 3 / 2, math.pi * 2, 3)
 
         # Draw straight border lines (between corners)
         # Top line
-        pygame.draw.line(self.screen, WHITE, (p + corner_r, 0), (p + fw - corner_r, 0), 3)
+        pygame.draw.line(surface, WHITE, (p + corner_r, 0), (p + fw - corner_r, 0), 3)
         # Bottom line
-        pygame.draw.line(self.screen, WHITE, (p + corner_r, fh - 1), (p + fw - corner_r, fh - 1), 3)
+        pygame.draw.line(surface, WHITE, (p + corner_r, fh - 1), (p + fw - corner_r, fh - 1), 3)
         # Left line
-        pygame.draw.line(self.screen, WHITE, (p, corner_r), (p, fh - corner_r), 3)
+        pygame.draw.line(surface, WHITE, (p, corner_r), (p, fh - corner_r), 3)
         # Right line
-        pygame.draw.line(self.screen, WHITE, (p + fw - 1, corner_r), (p + fw - 1, fh - corner_r), 3)
+        pygame.draw.line(surface, WHITE, (p + fw - 1, corner_r), (p + fw - 1, fh - corner_r), 3)
 
         # Center line
         center_x = p + fw // 2
-        pygame.draw.line(self.screen, WHITE, (center_x, 0), (center_x, fh), 2)
+        pygame.draw.line(surface, WHITE, (center_x, 0), (center_x, fh), 2)
 
         # Center circle
         center_radius = self._scale_val(80)
-        pygame.draw.circle(self.screen, WHITE, (center_x, fh // 2), center_radius, 2)
+        pygame.draw.circle(surface, WHITE, (center_x, fh // 2), center_radius, 2)
 
         # Center dot
-        pygame.draw.circle(self.screen, WHITE, (center_x, fh // 2), 5)
+        pygame.draw.circle(surface, WHITE, (center_x, fh // 2), 5)
 
         # Goal areas (penalty boxes)
         box_width = self._scale_val(100)
@@ -170,79 +271,125 @@ class Renderer:
         box_top = (fh - box_height) // 2
 
         # Left penalty box
-        pygame.draw.rect(self.screen, WHITE, (p, box_top, box_width, box_height), 2)
+        pygame.draw.rect(surface, WHITE, (p, box_top, box_width, box_height), 2)
 
         # Right penalty box
-        pygame.draw.rect(self.screen, WHITE,
+        pygame.draw.rect(surface, WHITE,
                          (p + fw - box_width, box_top, box_width, box_height), 2)
 
-    def _draw_goals(self, state: 'GameState') -> None:
-        """Draw goals in the padding area."""
-        goal_height = self._scale_val(state.goal_height)
+    def _draw_goals(self, surface: 'pygame.Surface', goal_height: float) -> None:
+        """Draw goals in the padding area of ``surface``."""
+        goal_height = self._scale_val(goal_height)
         goal_depth = self.padding - 5  # Goal depth (visual)
         goal_top = (self.field_height - goal_height) // 2
         p = self.padding
 
         # Left goal (team 0 defends) - blue tint
-        pygame.draw.rect(self.screen, (30, 60, 120),
+        pygame.draw.rect(surface, (30, 60, 120),
                          (0, goal_top, p, goal_height))
-        pygame.draw.rect(self.screen, WHITE,
+        pygame.draw.rect(surface, WHITE,
                          (0, goal_top, p, goal_height), 3)
 
         # Right goal (team 1 defends) - red tint
-        pygame.draw.rect(self.screen, (120, 40, 40),
+        pygame.draw.rect(surface, (120, 40, 40),
                          (p + self.field_width, goal_top, p, goal_height))
-        pygame.draw.rect(self.screen, WHITE,
+        pygame.draw.rect(surface, WHITE,
                          (p + self.field_width, goal_top, p, goal_height), 3)
 
+    def _build_sprite(self, radius: int, color: tuple, outline: tuple,
+                      label: Optional[str] = None) -> 'pygame.Surface':
+        """Draw a filled, outlined circle (and optional label) centered at (radius + 1, radius + 1)."""
+        size = 2 * radius + 2
+        center = (radius + 1, radius + 1)
+        sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, color, center, radius)
+        pygame.draw.circle(sprite, outline, center, radius, 2)
+        if label is not None:
+            text = self.small_font.render(label, True, WHITE)
+            sprite.blit(text, text.get_rect(center=center))
+        return sprite
+
+    def _player_sprite(self, team_id: int, player_id: int) -> 'pygame.Surface':
+        """Cached sprite for one player: team-colored circle with its number."""
+        key = (team_id, player_id)
+        sprite = self._player_sprites.get(key)
+        if sprite is None:
+            color = BLUE if team_id == 0 else RED
+            sprite = self._build_sprite(self._player_radius, color, WHITE, str(player_id))
+            self._player_sprites[key] = sprite
+        return sprite
+
     def _draw_players(self, state: 'GameState') -> None:
         """Draw all players."""
-        player_radius = self._scale_val(self.config.player_radius)
+        scale = self.scale
+        left, top = self._player_offset
+        sprites = self._player_sprites
+        active_player_id = self.active_player_id
+        active = None
 
+        blits = []
         for player in state.players:
-            pos = self._scale_pos(player.x, player.y)
-            color = BLUE if player.team_id == 0 else RED
+            x = int(player.x * scale)
+            y = int(player.y * scale)
+            team_id = player.team_id
+            player_id = player.player_id
 
             # Highlight active player (keyboard controlled)
-            if (self.active_player_id is not None and
-                player.player_id == self.active_player_id and
-                player.team_id == self.active_team_id):
-                # Draw outer highlight ring
-                pygame.draw.circle(self.screen, YELLOW, pos, player_radius + 6, 3)
-
-            # Player circle
-            pygame.draw.circle(self.screen, color, pos, player_radius)
-            pygame.draw.circle(self.screen, WHITE, pos, player_radius, 2)
-
-            # Player number
-            text = self.small_font.render(str(player.player_id), True, WHITE)
-            text_rect = text.get_rect(center=pos)
-            self.screen.blit(text, text_rect)
+            if (active_player_id is not None and
+                player_id == active_player_id and
+                team_id == self.active_team_id):
+                active = (len(blits), (x + self.padding, y))
+
+            # Player circle and number
+            sprite = sprites.get((team_id, player_id))
+            if sprite is None:
+                sprite = self._player_sprite(team_id, player_id)
+            blits.append((sprite, (x + left, y + top)))
+
+        # One batched blit, split around the highlight ring so it still sits
+        # above earlier players and below its own
+        if active is None:
+            self._dirty.extend(self.screen.blits(blits))
+            return
+        index, pos = active
+        self._dirty.extend(self.screen.blits(blits[:index]))
+        # Draw outer highlight ring
+        self._dirty.append(pygame.draw.circle(self.screen, YELLOW, pos, self._player_radius + 6, 3))
+        self._dirty.extend(self.screen.blits(blits[index:]))
 
     def _draw_ball(self, state: 'GameState') -> None:
         """Draw the ball."""
-        ball_radius = self._scale_val(self.config.ball_radius)
-        pos = self._scale_pos(state.ball.x, state.ball.y)
-
-        pygame.draw.circle(self.screen, YELLOW, pos, ball_radius)
-        pygame.draw.circle(self.screen, BLACK, pos, ball_radius, 2)
+        ball = state.ball
+        left, top = self._ball_offset
+        self._dirty.append(self.screen.blit(
+            self._ball_sprite, (int(ball.x * self.scale) + left, int(ball.y * self.scale) + top)))
+
+    def render_text(self, font: 'pygame.font.Font', text: str, color: tuple) -> 'pygame.Surface':
+        """font.render(text, True, color), reusing the surface for repeated strings."""
+        key = (font, text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            # Tick counters never repeat within a game, so keep the cache bounded
+            if len(self._text_cache) >= TEXT_CACHE_SIZE:
+                self._text_cache.clear()
+            surface = self._text_cache[key] = font.render(text, True, color)
+        return surface
 
     def _draw_info(self, state: 'GameState') -> None:
         """Draw score and game info."""
-        # Score
-        score_text = f"{state.score[0]} - {state.score[1]}"
-        text = self.font.render(score_text, True, WHITE)
-        text_rect = text.get_rect(center=(self.width // 2, 25))
+        screen = self.screen
+        dirty = self._dirty
 
-        # Background for score
-        bg_rect = text_rect.inflate(20, 10)
-        pygame.draw.rect(self.screen, DARK_GREEN, bg_rect)
-        self.screen.blit(text, text_rect)
+        # Score on its background box
+        score_text = f"{state.score[0]} - {state.score[1]}"
+        if score_text != self._last_score:
+            self._score_banner = self._build_banner(score_text, self._score_center, 20, 10)
+            self._last_score = score_text
+        dirty.append(screen.blit(*self._score_banner))
 
         # Tick counter
-        tick_text = f"Tick: {state.tick}/{self.config.max_ticks}"
-        text = self.small_font.render(tick_text, True, WHITE)
-        self.screen.blit(text, (self.padding + 10, 10))
+        text = self.render_text(self.small_font, f"Tick: {state.tick}{self._tick_suffix}", WHITE)
+        dirty.append(screen.blit(text, self._tick_pos))
 
         # Status
         if state.status.value == "ended":
@@ -253,11 +400,23 @@ class Renderer:
             else:
                 result = "Draw!"
 
-            text = self.font.render(result, True, WHITE)
-            text_rect = text.get_rect(center=(self.width // 2, self.height // 2))
-            bg_rect = text_rect.inflate(40, 20)
-            pygame.draw.rect(self.screen, DARK_GREEN, bg_rect)
-            self.screen.blit(text, text_rect)
+            if result != self._last_status:
+                self._status_banner = self._build_banner(result, self._status_center, 40, 20)
+                self._last_status = result
+            dirty.append(screen.blit(*self._status_banner))
+
+    def _build_banner(self, text: str, center: tuple, pad_x: int, pad_y: int) -> tuple:
+        """
+        Render ``text`` on a DARK_GREEN box ``pad_x``/``pad_y`` larger than
+        it, centered at ``center``. Returns (surface, screen rect).
+        """
+        rendered = self.font.render(text, True, WHITE)
+        text_rect = rendered.get_rect(center=center)
+        box = text_rect.inflate(pad_x, pad_y)
+        banner = pygame.Surface(box.size).convert()
+        banner.fill(DARK_GREEN)
+        banner.blit(rendered, (text_rect.x - box.x, text_rect.y - box.y))
+        return banner, box
 
     def tick(self, fps: int = 60) -> None:
         """Control frame rate."""
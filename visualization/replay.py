@@ -1,4 +1,8 @@
-from typing import Optional
+from operator import itemgetter
+from pathlib import Path
+from typing import Iterable, Optional
+
+import numpy as np
 
 try:
     import pygame
@@ -7,9 +11,20 @@ except ImportError:
     PYGAME_AVAILABLE = False
 
 from game.config import GameConfig
-from game.state import GameState
-from game_logging.logger import load_game_log
-from .renderer import Renderer
+from game.state import GameStateView, GameStatus, PlayerView
+from game_logging.logger import iter_game_log, load_game_log_npz
+from .renderer import EXPOSE_EVENTS, Renderer
+
+
+# Replay HUD text
+HUD_COLOR = (200, 200, 200)
+CONTROLS = (
+    "SPACE: Play/Pause",
+    "LEFT/RIGHT: Step frame",
+    "UP/DOWN: Speed",
+    "HOME/END: Start/End",
+    "ESC: Quit",
+)
 
 
 class ReplayViewer:
@@ -26,17 +41,151 @@ class ReplayViewer:
         if not PYGAME_AVAILABLE:
             raise ImportError("pygame is required for replay. Install with: pip install pygame")
 
-        self.log_data = load_game_log(log_path)
-        self.config = GameConfig.from_dict(self.log_data['config'])
-        self.states = [
-            GameState.from_dict(s) for s in self.log_data['states']
-        ]
+        if Path(log_path).suffix == '.npz':
+            # Frame archives already hold the arrays
+            self.log_data = load_game_log_npz(log_path)
+            self.config = GameConfig.from_dict(self.log_data['config'])
+            self._load_archive(self.log_data)
+        else:
+            # States are flattened as they are parsed and never kept as dicts
+            self.log_data, states = iter_game_log(log_path)
+            self.config = GameConfig.from_dict(self.log_data['config'])
+            self._load_frames(states)
         self.current_frame = 0
         self.playing = False
         self.speed = 1.0
 
         self.renderer = Renderer(self.config, scale=scale, title="AI Football Replay")
 
+        # HUD font and the fixed control help lines, rendered once
+        self._hud_font = pygame.font.Font(None, 20)
+        self._control_surfaces = [
+            self._hud_font.render(line, True, HUD_COLOR) for line in CONTROLS
+        ]
+
+    def _load_frames(self, states: Iterable[dict]) -> None:
+        """
+        Flatten the logged states into per-frame arrays, in one pass.
+
+        Team/player ids and field dimensions are fixed for a game and are
+        taken from the first state; everything else gets one row per frame.
+        """
+        motion = itemgetter('x', 'y', 'vx', 'vy')
+        cooldown = itemgetter('kick_cooldown')
+
+        first = None
+        players = []
+        cooldowns = []
+        balls = []
+        scores = []
+        ticks = []
+        statuses = []
+        for state in states:
+            if first is None:
+                first = state
+            frame_players = state['players']
+            players.extend(map(motion, frame_players))
+            cooldowns.extend(map(cooldown, frame_players))
+            balls.append(motion(state['ball']))
+            scores.append(state['score'])
+            ticks.append(state['tick'])
+            statuses.append(state['status'])
+        if first is None:
+            raise ValueError("Game log contains no states")
+
+        n_frames = len(balls)
+        n_players = len(first['players'])
+        self._set_frames(
+            players=np.array(players, dtype=np.float64).reshape(n_frames, n_players, 4),
+            ball=np.array(balls, dtype=np.float64),
+            kick_cooldowns=np.array(cooldowns, dtype=np.int64).reshape(n_frames, n_players),
+            ticks=np.array(ticks, dtype=np.int64),
+            scores=np.array(scores, dtype=np.int64),
+            statuses=statuses,
+            team_ids=[p['team_id'] for p in first['players']],
+            player_ids=[p['player_id'] for p in first['players']],
+            field_width=first['field_width'],
+            field_height=first['field_height'],
+            goal_height=first['goal_height'],
+        )
+
+    def _load_archive(self, archive: dict) -> None:
+        """Take the per-frame arrays straight from a ``.npz`` log."""
+        if len(archive['ticks']) == 0:
+            raise ValueError("Game log contains no states")
+        config = archive['config']
+        self._set_frames(
+            players=archive['players'],
+            ball=archive['ball'],
+            kick_cooldowns=archive['kick_cooldowns'],
+            ticks=archive['ticks'],
+            scores=archive['scores'],
+            statuses=archive['statuses'].tolist(),
+            team_ids=archive['team_ids'].tolist(),
+            player_ids=archive['player_ids'].tolist(),
+            field_width=config['field_width'],
+            field_height=config['field_height'],
+            goal_height=config['goal_height'],
+        )
+
+    def _set_frames(self, players: np.ndarray, ball: np.ndarray, kick_cooldowns: np.ndarray,
+                    ticks: np.ndarray, scores: np.ndarray, statuses: list,
+                    team_ids: list, player_ids: list, field_width: float,
+                    field_height: float, goal_height: float) -> None:
+        """
+        Store the frames: players (frames, N, x/y/vx/vy), ball (frames,
+        x/y/vx/vy), kick_cooldowns (frames, N), ticks, scores (frames, 2)
+        and one GameStatus value per frame.
+        """
+        self.n_frames = len(ticks)
+        self._players = players
+        self._ball = ball
+        self._cooldowns = kick_cooldowns
+        self._ticks = ticks
+        self._scores = scores
+
+        # Statuses as indices into GameStatus
+        self._status_values = tuple(GameStatus)
+        codes = {status.value: i for i, status in enumerate(self._status_values)}
+        self._statuses = np.array([codes[status] for status in statuses], dtype=np.uint8)
+
+        # Squared player-ball distances for every frame at once
+        dx = ball[:, None, 0] - players[:, :, 0]
+        dy = ball[:, None, 1] - players[:, :, 1]
+        self._ball_dist_sq = dx * dx + dy * dy
+
+        # One view, refreshed in place for whichever frame is shown
+        self._view = GameStateView(
+            players=tuple(PlayerView(t, p) for t, p in zip(team_ids, player_ids)),
+            field_width=field_width,
+            field_height=field_height,
+            goal_height=goal_height,
+        )
+
+    def get_frame(self, index: int) -> GameStateView:
+        """
+        State of frame ``index``.
+
+        Returns a view that is refreshed in place on the next call; convert
+        with ``GameState.from_dict(view.to_dict())`` to keep a frame.
+        """
+        view = self._view
+        for p, (x, y, vx, vy), cd in zip(
+            view.players, self._players[index].tolist(), self._cooldowns[index].tolist(),
+        ):
+            p.x = x
+            p.y = y
+            p.vx = vx
+            p.vy = vy
+            p.kick_cooldown = cd
+        ball = view.ball
+        ball.x, ball.y, ball.vx, ball.vy = self._ball[index].tolist()
+        view.ball_dist_sq = self._ball_dist_sq[index].tolist()
+        view.score = tuple(self._scores[index].tolist())
+        view.tick = int(self._ticks[index])
+        view.status = self._status_values[self._statuses[index]]
+        return view
+
     def run(self) -> None:
         """Run the replay viewer."""
         running = True
@@ -48,19 +197,22 @@ class ReplayViewer:
                     running = False
                 elif event.type == pygame.KEYDOWN:
                     running = self._handle_key(event.key)
+                elif event.type in EXPOSE_EVENTS:
+                    # The renderer only pushes dirty areas; a window that was
+                    # uncovered or restored needs a full repaint
+                    self.renderer.invalidate()
 
             # Auto-advance if playing
-            if self.playing and self.current_frame < len(self.states) - 1:
+            if self.playing and self.current_frame < self.n_frames - 1:
                 self.current_frame += 1
 
             # Render current frame
-            state = self.states[self.current_frame]
-            self.renderer.render(state)
+            self.renderer.draw(self.get_frame(self.current_frame))
 
             # Draw replay controls
             self._draw_controls()
 
-            pygame.display.flip()
+            self.renderer.present()
             self.renderer.tick(int(self.config.ticks_per_second * self.speed))
 
         self.renderer.close()
@@ -72,7 +224,7 @@ class ReplayViewer:
         elif key == pygame.K_SPACE:
             self.playing = not self.playing
         elif key == pygame.K_RIGHT:
-            self.current_frame = min(self.current_frame + 1, len(self.states) - 1)
+            self.current_frame = min(self.current_frame + 1, self.n_frames - 1)
         elif key == pygame.K_LEFT:
             self.current_frame = max(self.current_frame - 1, 0)
         elif key == pygame.K_UP:
@@ -82,43 +234,36 @@ class ReplayViewer:
         elif key == pygame.K_HOME:
             self.current_frame = 0
         elif key == pygame.K_END:
-            self.current_frame = len(self.states) - 1
+            self.current_frame = self.n_frames - 1
         return True
 
     def _draw_controls(self) -> None:
         """Draw replay control info."""
-        font = pygame.font.Font(None, 20)
+        font = self._hud_font
+        render_text = self.renderer.render_text
         screen = self.renderer.screen
+        mark_dirty = self.renderer.mark_dirty
 
         # Control info
-        controls = [
-            "SPACE: Play/Pause",
-            "LEFT/RIGHT: Step frame",
-            "UP/DOWN: Speed",
-            "HOME/END: Start/End",
-            "ESC: Quit",
-        ]
-
-        y = self.renderer.height - 20 * len(controls) - 10
-        for line in controls:
-            text = font.render(line, True, (200, 200, 200))
-            screen.blit(text, (self.renderer.padding + 10, y))
+        y = self.renderer.height - 20 * len(self._control_surfaces) - 10
+        for text in self._control_surfaces:
+            mark_dirty(screen.blit(text, (self.renderer.padding + 10, y)))
             y += 20
 
         # Speed indicator
         speed_text = f"Speed: {self.speed:.2f}x"
-        text = font.render(speed_text, True, (200, 200, 200))
-        screen.blit(text, (self.renderer.width - 120, self.renderer.height - 30))
+        text = render_text(font, speed_text, HUD_COLOR)
+        mark_dirty(screen.blit(text, (self.renderer.width - 120, self.renderer.height - 30)))
 
         # Frame counter
-        frame_text = f"Frame: {self.current_frame + 1}/{len(self.states)}"
-        text = font.render(frame_text, True, (200, 200, 200))
-        screen.blit(text, (self.renderer.width - 150, 10))
+        frame_text = f"Frame: {self.current_frame + 1}/{self.n_frames}"
+        text = render_text(font, frame_text, HUD_COLOR)
+        mark_dirty(screen.blit(text, (self.renderer.width - 150, 10)))
 
         # Playing indicator
         status = "Playing" if self.playing else "Paused"
-        text = font.render(status, True, (200, 200, 200))
-        screen.blit(text, (self.renderer.width - 80, 30))
+        text = render_text(font, status, HUD_COLOR)
+        mark_dirty(screen.blit(text, (self.renderer.width - 80, 30)))
 
 
 def replay_game(log_path: str, scale: float = 1.0) -> None: